@@ -5,6 +5,7 @@ from ..records.records_directory import RecordsDirectory
 from ..url.filesystem import FilesystemDirectoryUrl
 from contextlib import contextmanager
 from ..url.base import BaseDirectoryUrl
+from ..utils.read_ahead import read_ahead_if_remote
 from tempfile import TemporaryDirectory
 from abc import ABCMeta, abstractmethod
 from typing import Optional, Type, Iterator, IO, List
@@ -88,10 +89,11 @@ class LoaderFromFileobj(LoaderFromRecordsDirectory, metaclass=ABCMeta):
                                                 directory: RecordsDirectory) -> Optional[int]:
         all_urls = directory.manifest_entry_urls()
 
+        max_read_ahead_bytes = load_plan.processing_instructions.max_read_ahead_bytes
         total_rows = None
         for url in all_urls:
             loc = self.url_resolver.file_url(url)
-            with loc.open() as f:
+            with loc.open() as raw_f, read_ahead_if_remote(raw_f, max_read_ahead_bytes) as f:
                 logger.info(f"Loading {url} into {schema}.{table}...")
                 out = self.load_from_fileobj(schema, table, load_plan, f)
                 if out is not None:
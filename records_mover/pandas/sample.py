@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from typing import Iterable, Optional, Tuple
+
+
+# Fixed, so that the same records always yield the same sample--and
+# so the same inferred schema
+SAMPLE_SEED = 0
+
+
+def sample_rows(df: DataFrame, n: int, seed: int = SAMPLE_SEED) -> DataFrame:
+    """Pick n rows of df at random, keeping them in their original
+    order.  Unlike df.sample(n), rows stay in order and the same
+    rows are picked on every run."""
+    if n >= len(df.index):
+        return df
+    rng = np.random.default_rng(seed)
+    positions = np.sort(rng.choice(len(df.index), size=n, replace=False))
+    return df.iloc[positions]
+
+
+def reservoir_sample(chunks: Iterable[DataFrame],
+                     n: int,
+                     seed: int = SAMPLE_SEED) -> Tuple[Optional[DataFrame], int]:
+    """Pick n rows at random from across a series of dataframe chunks
+    (e.g., those read from a large CSV file), looking at each chunk
+    just once and without holding more than n rows plus one chunk in
+    memory.  Every row is equally likely to be picked regardless of
+    where it appears, so e.g. records sorted by a column which starts
+    out empty are still represented fairly.
+
+    Returns the sample, with rows kept in their original order, and
+    the number of rows seen in total; the sample is None if there
+    were no chunks.
+    """
+    rng = np.random.default_rng(seed)
+    sample: Optional[DataFrame] = None
+    # Each row gets a random key, and the rows with the n smallest
+    # keys seen so far are kept--equivalent to classic reservoir
+    # sampling, but it can be done a chunk at a time.
+    keys = np.empty(0)
+    rows_seen = 0
+    for chunk in chunks:
+        chunk_keys = rng.random(len(chunk.index))
+        rows_seen += len(chunk.index)
+        if sample is None:
+            sample = chunk
+            keys = chunk_keys
+        else:
+            sample = pd.concat([sample, chunk], ignore_index=True)
+            keys = np.concatenate([keys, chunk_keys])
+        if len(keys) > n:
+            # Sorted positions keep rows in the order they were read
+            keep = np.sort(np.argpartition(keys, n)[:n])
+            sample = sample.iloc[keep]
+            keys = keys[keep]
+    if sample is not None:
+        sample = sample.reset_index(drop=True)
+    return sample, rows_seen
@@ -8,7 +8,9 @@ import gzip
 import bz2
 from .types import HintEncoding, HintRecordTerminator, HintQuoting, HintCompression
 from .conversions import hint_encoding_from_chardet
-from typing import List, IO, Optional, Iterator, Dict
+from typing import List, IO, Any, Optional, Iterator, Dict, Iterable, NamedTuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from records_mover.utils.rewound_fileobj import rewound_fileobj
 from records_mover.mover_types import _assert_never
 import logging
@@ -18,6 +20,13 @@ logger = logging.getLogger(__name__)
 
 HINT_INFERENCE_SAMPLING_SIZE_BYTES = 1024
 
+# sniff_hints() decompresses at most this much of the start of a file,
+# once, and every detector works from that.
+HINT_INFERENCE_SAMPLE_MAX_BYTES = 1024 * 1024
+
+# Files of a multi-file records directory sniffed to determine hints
+MAX_FILES_TO_SNIFF = 8
+
 
 @contextmanager
 def rewound_decompressed_fileobj(fileobj: IO[bytes],
@@ -38,107 +47,170 @@ def rewound_decompressed_fileobj(fileobj: IO[bytes],
             _assert_never(compression)
 
 
+class DecompressedSample(NamedTuple):
+    # The start of the file, after decompression
+    data: bytes
+    # True if data is the whole file
+    complete: bool
+
+
+def read_decompressed_sample(fileobj: IO[bytes],
+                             compression: HintCompression,
+                             max_bytes: int = HINT_INFERENCE_SAMPLE_MAX_BYTES) ->\
+        DecompressedSample:
+    """Decompress and read up to max_bytes from the start of fileobj,
+    leaving it where it was."""
+    with rewound_decompressed_fileobj(fileobj, compression) as decompressed_fileobj:
+        data = bytearray()
+        # Read one more byte than needed to find out if there's more
+        while len(data) <= max_bytes:
+            chunk = decompressed_fileobj.read(max_bytes + 1 - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return DecompressedSample(data=bytes(data[:max_bytes]),
+                                  complete=len(data) <= max_bytes)
+
+
+def complete_records_from_sample(sample: DecompressedSample,
+                                 encoding_hint: HintEncoding,
+                                 record_terminator_hint: Optional[HintRecordTerminator]) -> str:
+    """Decode a sample, dropping any partial record at the end if the
+    sample isn't the whole file."""
+    python_encoding = python_encoding_from_hint[encoding_hint]
+    if sample.complete:
+        return sample.data.decode(python_encoding)
+    # The sample may well end part way through a character
+    text = sample.data.decode(python_encoding, errors='ignore')
+    end_of_last_record = text.rfind(record_terminator_hint or '\n')
+    if end_of_last_record < 0:
+        return ''
+    return text[:end_of_last_record + len(record_terminator_hint or '\n')]
+
+
+def _newline_format(fileobj: IO[bytes],
+                    encoding_hint: HintEncoding) -> Optional[HintRecordTerminator]:
+    python_encoding = python_encoding_from_hint[encoding_hint]
+    text_fileobj = io.TextIOWrapper(fileobj, encoding=python_encoding)
+    try:
+        if text_fileobj.newlines is None:  # ...and it almost certainly will be...
+            text_fileobj.readline()  # read enough to know newline format
+        # https://www.python.org/dev/peps/pep-0278/
+        if text_fileobj.newlines is not None:
+            logger.info(f"Inferred record terminator as {repr(text_fileobj.newlines)}")
+            return str(text_fileobj.newlines)
+        else:
+            logger.warning("Python could not determine newline format of file.")
+            return None
+    finally:
+        text_fileobj.detach()
+
+
 def infer_newline_format(fileobj: IO[bytes],
                          encoding_hint: HintEncoding,
                          compression: HintCompression) ->\
         Optional[HintRecordTerminator]:
     with rewound_decompressed_fileobj(fileobj, compression) as fileobj:
-        python_encoding = python_encoding_from_hint[encoding_hint]
-        text_fileobj = io.TextIOWrapper(fileobj, encoding=python_encoding)
-        try:
-            if text_fileobj.newlines is None:  # ...and it almost certainly will be...
-                text_fileobj.readline()  # read enough to know newline format
-            # https://www.python.org/dev/peps/pep-0278/
-            if text_fileobj.newlines is not None:
-                logger.info(f"Inferred record terminator as {repr(text_fileobj.newlines)}")
-                return str(text_fileobj.newlines)
-            else:
-                logger.warning("Python could not determine newline format of file.")
-                return None
-        finally:
-            text_fileobj.detach()
+        return _newline_format(fileobj, encoding_hint)
+
+
+def _encoding_hint_from_chunks(chunks: Iterable[bytes]) -> Optional[HintEncoding]:
+    detector = chardet.UniversalDetector()
+    for chunk in chunks:
+        detector.feed(chunk)
+        if detector.done or len(chunk) < HINT_INFERENCE_SAMPLING_SIZE_BYTES:
+            break
+    detector.close()
+    assert detector.result is not None
+    if 'encoding' in detector.result:
+        chardet_encoding = detector.result['encoding']
+        if chardet_encoding in hint_encoding_from_chardet:
+            return hint_encoding_from_chardet[chardet_encoding]
+        else:
+            logger.warning("Got unrecognized encoding from chardet "
+                           f"sniffing: {detector.result}")
+            return None
+    else:
+        logger.warning(f"Unable to sniff file encoding using chardet: {detector.result}")
+        return None
 
 
 def sniff_encoding_hint(fileobj: IO[bytes]) -> Optional[HintEncoding]:
     with rewound_fileobj(fileobj) as fileobj:
-        detector = chardet.UniversalDetector()
-        while True:
-            chunk = fileobj.read(HINT_INFERENCE_SAMPLING_SIZE_BYTES)
-            detector.feed(chunk)
-            if detector.done or len(chunk) < HINT_INFERENCE_SAMPLING_SIZE_BYTES:
-                break
-        detector.close()
-        assert detector.result is not None
-        if 'encoding' in detector.result:
-            chardet_encoding = detector.result['encoding']
-            if chardet_encoding in hint_encoding_from_chardet:
-                return hint_encoding_from_chardet[chardet_encoding]
-            else:
-                logger.warning("Got unrecognized encoding from chardet "
-                               f"sniffing: {detector.result}")
-                return None
+        return _encoding_hint_from_chunks(
+            iter(lambda: fileobj.read(HINT_INFERENCE_SAMPLING_SIZE_BYTES), b''))
+
+
+def sniff_encoding_hint_from_sample(sample: DecompressedSample) -> Optional[HintEncoding]:
+    chunk_size = HINT_INFERENCE_SAMPLING_SIZE_BYTES
+    return _encoding_hint_from_chunks(sample.data[i:i + chunk_size]
+                                      for i in range(0, len(sample.data), chunk_size))
+
+
+def _csv_hints_from_python(fileobj: IO[bytes],
+                           record_terminator_hint: Optional[HintRecordTerminator],
+                           encoding_hint: HintEncoding) -> PartialRecordsHints:
+    # https://docs.python.org/3/library/csv.html#csv.Sniffer
+    #
+    # Sniffer tries to determine quotechar, doublequote,
+    # delimiter, skipinitialspace.  does not try to determine
+    # lineterminator.
+    # https://github.com/python/cpython/blob/master/Lib/csv.py#L165
+    python_encoding = python_encoding_from_hint[encoding_hint]
+    #
+    # TextIOWrapper can only handle standard newline types:
+    #
+    # https://docs.python.org/3/library/io.html#io.TextIOWrapper
+    #
+    if record_terminator_hint not in [None, '\n', '\r', '\r\n']:
+        logger.info("Unable to infer file with non-standard newlines "
+                    f"using Python csv.Sniffer {repr(record_terminator_hint)}.")
+        return {}
+    text_fileobj = io.TextIOWrapper(fileobj,
+                                    encoding=python_encoding,
+                                    newline=record_terminator_hint)
+    try:
+        sniffer = csv.Sniffer()
+        sample = text_fileobj.read(HINT_INFERENCE_SAMPLING_SIZE_BYTES)
+        #
+        # the CSV sniffer's has_header() method seems to only
+        # cope with DOS and UNIX newlines, not Mac.  So let's give it
+        # UNIX newlines if we know enough to translate, since
+        # we're not using it to sniff newline format anyway.
+        #
+        if record_terminator_hint is not None and record_terminator_hint != '\n':
+            sample_with_unix_newlines = sample.replace(record_terminator_hint, '\n')
         else:
-            logger.warning(f"Unable to sniff file encoding using chardet: {detector.result}")
-            return None
+            sample_with_unix_newlines = sample
+        dialect = sniffer.sniff(sample_with_unix_newlines)
+        header_row = sniffer.has_header(sample_with_unix_newlines)
+        out: PartialRecordsHints = {
+            'doublequote': True if dialect.doublequote else False,
+            'field-delimiter': dialect.delimiter,
+            'header-row': True if header_row else False,
+        }
+        if dialect.quotechar is not None:
+            out['quotechar'] = dialect.quotechar
+        logger.info(f"Python csv.Dialect sniffed: {out}")
+        return out
+    except csv.Error as e:
+        if str(e) == 'Could not determine delimiter':
+            logger.info(f"Error from csv.Sniffer--potential single-field file: {str(e)}")
+            return {}
+        else:
+            logger.info(f"Error from csv.Sniffer--potential single-field file: {str(e)}")
+            raise
+    finally:
+        text_fileobj.detach()
 
 
 def csv_hints_from_python(fileobj: IO[bytes],
                           record_terminator_hint: Optional[HintRecordTerminator],
                           encoding_hint: HintEncoding,
                           compression: HintCompression) -> PartialRecordsHints:
-    # https://docs.python.org/3/library/csv.html#csv.Sniffer
     with rewound_decompressed_fileobj(fileobj,
                                       compression) as fileobj:
-        # Sniffer tries to determine quotechar, doublequote,
-        # delimiter, skipinitialspace.  does not try to determine
-        # lineterminator.
-        # https://github.com/python/cpython/blob/master/Lib/csv.py#L165
-        python_encoding = python_encoding_from_hint[encoding_hint]
-        #
-        # TextIOWrapper can only handle standard newline types:
-        #
-        # https://docs.python.org/3/library/io.html#io.TextIOWrapper
-        #
-        if record_terminator_hint not in [None, '\n', '\r', '\r\n']:
-            logger.info("Unable to infer file with non-standard newlines "
-                        f"using Python csv.Sniffer {repr(record_terminator_hint)}.")
-            return {}
-        text_fileobj = io.TextIOWrapper(fileobj,
-                                        encoding=python_encoding,
-                                        newline=record_terminator_hint)
-        try:
-            sniffer = csv.Sniffer()
-            sample = text_fileobj.read(HINT_INFERENCE_SAMPLING_SIZE_BYTES)
-            #
-            # the CSV sniffer's has_header() method seems to only
-            # cope with DOS and UNIX newlines, not Mac.  So let's give it
-            # UNIX newlines if we know enough to translate, since
-            # we're not using it to sniff newline format anyway.
-            #
-            if record_terminator_hint is not None and record_terminator_hint != '\n':
-                sample_with_unix_newlines = sample.replace(record_terminator_hint, '\n')
-            else:
-                sample_with_unix_newlines = sample
-            dialect = sniffer.sniff(sample_with_unix_newlines)
-            header_row = sniffer.has_header(sample_with_unix_newlines)
-            out: PartialRecordsHints = {
-                'doublequote': True if dialect.doublequote else False,
-                'field-delimiter': dialect.delimiter,
-                'header-row': True if header_row else False,
-            }
-            if dialect.quotechar is not None:
-                out['quotechar'] = dialect.quotechar
-            logger.info(f"Python csv.Dialect sniffed: {out}")
-            return out
-        except csv.Error as e:
-            if str(e) == 'Could not determine delimiter':
-                logger.info(f"Error from csv.Sniffer--potential single-field file: {str(e)}")
-                return {}
-            else:
-                logger.info(f"Error from csv.Sniffer--potential single-field file: {str(e)}")
-                raise
-        finally:
-            text_fileobj.detach()
+        return _csv_hints_from_python(fileobj, record_terminator_hint, encoding_hint)
 
 
 def csv_hints_from_pandas(fileobj: IO[bytes],
@@ -188,14 +260,56 @@ def sniff_compression_hint(fileobj: IO[bytes]) -> HintCompression:
 
 
 def sniff_hints_from_fileobjs(fileobjs: List[IO[bytes]],
-                              initial_hints: PartialRecordsHints) -> PartialRecordsHints:
-    if len(fileobjs) != 1:
-        # https://github.com/bluelabsio/records-mover/issues/84
-        raise NotImplementedError('Cannot currently sniff hints from multiple '
-                                  'files--please provide hints')
-    fileobj = fileobjs[0]
-    hints = sniff_hints(fileobj, initial_hints=initial_hints)
-    return hints
+                              initial_hints: PartialRecordsHints,
+                              max_workers: int = 1) -> PartialRecordsHints:
+    if len(fileobjs) == 0:
+        raise ValueError('No files to sniff hints from')
+    if len(fileobjs) == 1:
+        return sniff_hints(fileobjs[0], initial_hints=initial_hints)
+
+    # Files of a records directory are typically written by the same
+    # process (e.g., a parallel unload), so a sample spread evenly
+    # across them is enough to go on.
+    num_sampled = min(len(fileobjs), MAX_FILES_TO_SNIFF)
+    sampled_fileobjs = [fileobjs[(i * len(fileobjs)) // num_sampled]
+                        for i in range(num_sampled)]
+
+    def sniff(fileobj: IO[bytes]) -> Optional[PartialRecordsHints]:
+        from pandas.errors import EmptyDataError
+
+        try:
+            return sniff_hints(fileobj, initial_hints=initial_hints)
+        except EmptyDataError:
+            # Parallel unloads often leave some files empty
+            return None
+
+    logger.info(f"Sniffing hints from {num_sampled} of {len(fileobjs)} files")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, num_sampled))) as executor:
+        sniffed = [hints for hints in executor.map(sniff, sampled_fileobjs)
+                   if hints is not None]
+    if not sniffed:
+        # Raise the same error as for a single empty file
+        return sniff_hints(fileobjs[0], initial_hints=initial_hints)
+    return reconcile_hints(sniffed)
+
+
+def reconcile_hints(sniffed: List[PartialRecordsHints]) -> PartialRecordsHints:
+    """Combine hints sniffed from several files of the same records into
+    one set, going with the most common value where they disagree."""
+    hint_names: Dict[str, None] = {}
+    for hints in sniffed:
+        hint_names.update(dict.fromkeys(hints))
+    reconciled: Dict[str, Any] = {}
+    for hint_name in hint_names:
+        counts = Counter(hints[hint_name] for hints in sniffed  # type: ignore
+                         if hint_name in hints)
+        # Ties go to whichever file came first
+        value, _ = counts.most_common(1)[0]
+        if len(counts) > 1:
+            logger.warning(f"Files disagree on {hint_name} hint ({dict(counts)}); "
+                           f"using {value!r}")
+        reconciled[hint_name] = value
+    return reconciled  # type: ignore
 
 
 def sniff_hints(fileobj: IO[bytes],
@@ -216,8 +330,16 @@ def sniff_hints(fileobj: IO[bytes],
             compression_hint = sniff_compression_hint(fileobj)
         else:
             compression_hint = initial_hints['compression']
+
+        #
+        # Decompress the start of the file just once; everything
+        # below looks only at that sample, so nothing needs to
+        # rewind and decompress the file again:
+        #
+        sample = read_decompressed_sample(fileobj, compression_hint)
+
         if 'encoding' not in initial_hints:
-            encoding_hint = sniff_encoding_hint(fileobj)
+            encoding_hint = sniff_encoding_hint_from_sample(sample)
         else:
             encoding_hint = initial_hints['encoding']
         # If guessing was inconclusive, default to UTF8
@@ -231,9 +353,8 @@ def sniff_hints(fileobj: IO[bytes],
         if 'record-terminator' in initial_hints:
             record_terminator_hint = initial_hints['record-terminator']
         else:
-            record_terminator_hint = infer_newline_format(fileobj,
-                                                          final_encoding_hint,
-                                                          compression_hint)
+            record_terminator_hint = _newline_format(io.BytesIO(sample.data),
+                                                     final_encoding_hint)
 
         #
         # Now we have enough to study each line of the file, Python's
@@ -243,10 +364,9 @@ def sniff_hints(fileobj: IO[bytes],
         other_inferred_csv_hints = {}
         if record_terminator_hint is not None:
             other_inferred_csv_hints['record-terminator'] = record_terminator_hint
-            python_inferred_hints = csv_hints_from_python(fileobj,
-                                                          record_terminator_hint,
-                                                          final_encoding_hint,
-                                                          compression_hint)
+            python_inferred_hints = _csv_hints_from_python(io.BytesIO(sample.data),
+                                                           record_terminator_hint,
+                                                           final_encoding_hint)
         else:
             python_inferred_hints = {}
 
@@ -260,7 +380,11 @@ def sniff_hints(fileobj: IO[bytes],
         if encoding_hint is not None:
             streaming_hints['encoding'] = encoding_hint
         streaming_hints.update(python_inferred_hints)
-        pandas_inferred_hints = csv_hints_from_pandas(fileobj, streaming_hints)
+        # ...parsing the already decompressed sample
+        sample_streaming_hints = streaming_hints.copy()
+        sample_streaming_hints['compression'] = None
+        pandas_inferred_hints = csv_hints_from_pandas(io.BytesIO(sample.data),
+                                                      sample_streaming_hints)
 
         #
         # Let's combine these together and present back a refined
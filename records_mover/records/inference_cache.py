@@ -0,0 +1,195 @@
+from .processing_instructions import ProcessingInstructions
+from .records_format import BaseRecordsFormat
+from .schema import RecordsSchema
+from .delimited import PartialRecordsHints
+from ..url.base import BaseFileUrl
+from typing import IO, List, Optional, Sequence, Tuple, cast
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes hashed from each end of a file to fingerprint its contents
+FINGERPRINT_BLOCK_BYTES = 64 * 1024
+
+# Default ceiling on the number of results kept in the cache
+DEFAULT_MAX_INFERENCE_CACHE_ENTRIES = 10000
+
+
+def fingerprint_fileobj(fileobj: IO[bytes], loc: Optional[BaseFileUrl] = None) -> Optional[str]:
+    """Identifies the contents of a file by what's known about it
+    cheaply--its URL and content_version() (e.g., an S3 ETag or
+    local modification time) if loc is given, plus its size and the
+    first and last FINGERPRINT_BLOCK_BYTES if fileobj can be seeked
+    to its end.  Returns None if there's nothing to go on.
+
+    The position of fileobj is left at the start.
+    """
+    digest = hashlib.sha256()
+    identified = False
+    if loc is not None:
+        version = loc.content_version()
+        digest.update(f"{loc.url}\n{version}\n".encode('utf-8'))
+        identified = version is not None
+    if fileobj.seekable():
+        try:
+            size = fileobj.seek(0, io.SEEK_END)
+        except io.UnsupportedOperation:
+            # e.g., a PeekBufferedFile, which only knows its start
+            pass
+        else:
+            fileobj.seek(max(0, size - FINGERPRINT_BLOCK_BYTES))
+            last_block = fileobj.read(FINGERPRINT_BLOCK_BYTES)
+            fileobj.seek(0)
+            first_block = fileobj.read(FINGERPRINT_BLOCK_BYTES)
+            fileobj.seek(0)
+            digest.update(f"{size}\n".encode('utf-8'))
+            digest.update(first_block)
+            digest.update(last_block)
+            identified = True
+    if not identified:
+        return None
+    return digest.hexdigest()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        # Removed by someone else meanwhile
+        pass
+
+
+def _key(kind: str, fingerprints: Sequence[str], inputs: object) -> str:
+    digest = hashlib.sha256(kind.encode('utf-8'))
+    for fingerprint in fingerprints:
+        digest.update(fingerprint.encode('utf-8'))
+    digest.update(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8'))
+    return f"{kind}-{digest.hexdigest()}"
+
+
+class InferenceCache:
+    """Remembers the hints sniffed and schemas inferred from files, so
+    that e.g. a recurring job reading files whose layout doesn't change
+    can skip sniffing and inference on later runs.
+
+    Results are keyed by the fingerprints of the files they came from
+    (see fingerprint_fileobj()) plus whatever else they depend on
+    (initial hints, records format, how many rows are sampled).
+    Results older than ttl_seconds are ignored, and once more than
+    max_entries are stored, the least recently used are removed.
+
+    Results are stored as JSON files, and several processes may safely
+    share a cache directory.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 ttl_seconds: float,
+                 max_entries: int = DEFAULT_MAX_INFERENCE_CACHE_ENTRIES) -> None:
+        self.directory = os.path.abspath(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def hints_key(fingerprints: Sequence[str],
+                  initial_hints: PartialRecordsHints) -> str:
+        return _key('hints', fingerprints, initial_hints)
+
+    @staticmethod
+    def schema_key(fingerprints: Sequence[str],
+                   records_format: BaseRecordsFormat,
+                   processing_instructions: ProcessingInstructions) -> str:
+        return _key('schema', fingerprints, {
+            'records_format': records_format.config(),
+            'max_inference_rows': processing_instructions.max_inference_rows,
+            'infer_from_whole_stream': processing_instructions.infer_from_whole_stream,
+        })
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _get(self, key: str) -> Optional[object]:
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if time.time() - entry['created'] > self.ttl_seconds:
+            logger.debug(f"Removing expired inference cache entry {key}")
+            _remove(path)
+            return None
+        try:
+            # Entries' modification times track when they were last
+            # used, for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by someone else meanwhile
+            pass
+        return entry['value']
+
+    def _put(self, key: str, value: object) -> None:
+        entry = {'created': time.time(), 'value': value}
+        fd, partial_path = tempfile.mkstemp(prefix='.partial-', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            # Atomic, so readers never see part of an entry
+            os.replace(partial_path, self._path(key))
+        except BaseException:
+            os.remove(partial_path)
+            raise
+        self.evict()
+
+    def get_hints(self, key: str) -> Optional[PartialRecordsHints]:
+        hints = self._get(key)
+        if hints is None:
+            return None
+        logger.info("Using cached hints instead of sniffing them")
+        return cast(PartialRecordsHints, hints)
+
+    def put_hints(self, key: str, hints: PartialRecordsHints) -> None:
+        self._put(key, hints)
+
+    def get_schema(self, key: str) -> Optional[RecordsSchema]:
+        schema_json = self._get(key)
+        if schema_json is None:
+            return None
+        logger.info("Using cached records schema instead of inferring it")
+        return RecordsSchema.from_json(cast(str, schema_json))
+
+    def put_schema(self, key: str, records_schema: RecordsSchema) -> None:
+        self._put(key, records_schema.to_json())
+
+    def _entries(self) -> List[Tuple[float, str]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except FileNotFoundError:
+                # Evicted by someone else meanwhile
+                pass
+        return entries
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache holds at
+        most max_entries."""
+        with self._lock:
+            entries = sorted(self._entries())
+            for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+                logger.debug(f"Evicting {path} from inference cache")
+                _remove(path)
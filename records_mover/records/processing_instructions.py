@@ -1,10 +1,20 @@
 from typing import Optional
+from ..utils.read_ahead import DEFAULT_MAX_READ_AHEAD_BYTES
+import os
 
 # An arbitrary 4 mb csv I looked at ran around 100,000 lines.
 # Assuming we want to limit our memory usage to, say, 400MB of memory,
 # let's limit inference to 1,000,000 lines.
 DEFAULT_MAX_SAMPLE_SIZE = 1000000
 
+# Files of a multi-file records directory sniffed or inferred from at
+# once
+DEFAULT_MAX_INFERENCE_WORKERS = min(8, os.cpu_count() or 1)
+
+# How long sniffed hints and inferred schemas are reused from an
+# inference cache
+DEFAULT_INFERENCE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
 
 class ProcessingInstructions:
     def __init__(self,
@@ -12,7 +22,15 @@ class ProcessingInstructions:
                  fail_if_cant_handle_hint: bool=True,
                  fail_if_row_invalid: bool=True,
                  max_inference_rows: Optional[int]=DEFAULT_MAX_SAMPLE_SIZE,
-                 max_failure_rows: Optional[int]=None) -> None:
+                 max_failure_rows: Optional[int]=None,
+                 max_chunks_in_flight: Optional[int]=None,
+                 max_upload_workers: int=1,
+                 max_read_ahead_bytes: Optional[int]=DEFAULT_MAX_READ_AHEAD_BYTES,
+                 max_inference_workers: int=DEFAULT_MAX_INFERENCE_WORKERS,
+                 infer_from_whole_stream: bool=False,
+                 inference_cache_dir: Optional[str]=None,
+                 inference_cache_ttl_seconds: float=DEFAULT_INFERENCE_CACHE_TTL_SECONDS,
+                 max_inference_processes: int=1) -> None:
         """Directives on how to handle different situations when processing
         records.  Note that not all vendor mechanisms support this
         level of configurability; when choosing between optimizing for
@@ -43,6 +61,44 @@ class ProcessingInstructions:
            controls the maximum number of rows we'll look at.  Higher values will be more likely to
            result in a schema that can be loaded into, but will take longer to load.  If set to
            None, the entire file will be processed.
+
+        :param max_chunks_in_flight: If set, when records are being serialized from a series
+           of dataframes, serialize chunks in the background while earlier chunks are already
+           being loaded into the target, keeping at most this many serialized chunks on local
+           disk at once.  If None, all chunks will be serialized to local disk before loading
+           starts.
+
+        :param max_upload_workers: When writing multiple files into a records directory (e.g., on
+           S3 or GCS), upload up to this many files concurrently.
+
+        :param max_read_ahead_bytes: When loading a database from a stream which isn't a local
+           file (e.g., an object on S3), read the stream in the background while the database is
+           ingesting earlier data, keeping at most this many bytes in memory.  If None, the
+           database reads directly from the stream.
+
+        :param max_inference_workers: When sniffing the format or inferring the schema of records
+           split across multiple files, look at up to this many files concurrently.
+
+        :param infer_from_whole_stream: If True, the rows looked at during type inference are
+           picked at random from across each whole file, rather than being the first
+           max_inference_rows rows.  This reads each file to the end once, holding up to around
+           twice max_inference_rows rows in memory, so it's slower, but infers schemas which
+           better fit records where e.g. later rows differ from the first ones because the
+           records are sorted.  Pure streams (e.g., a pipe) are always inferred from their start.
+
+        :param inference_cache_dir: If set, a local directory in which to remember the hints
+           sniffed and schemas inferred from files, keyed by a fingerprint of each file's contents
+           (its URL, version or modification time, size, and first and last blocks).  When the same
+           files are read again (e.g., by a recurring job), sniffing and inference are skipped.
+
+        :param inference_cache_ttl_seconds: When inference_cache_dir is in use, results older than
+           this are inferred afresh.
+
+        :param max_inference_processes: When inferring the schema of very wide records (hundreds
+           of columns or more), split the columns between up to this many processes.  If pyarrow
+           is installed (e.g., via the 'parquet' extra), columns of numeric and other
+           non-object types are shared with them as a memory-mapped Arrow file rather than being
+           pickled.
         """
 
         self.fail_if_dont_understand = fail_if_dont_understand
@@ -50,3 +106,11 @@ class ProcessingInstructions:
         self.fail_if_row_invalid = fail_if_row_invalid
         self.max_failure_rows = max_failure_rows
         self.max_inference_rows = max_inference_rows
+        self.max_chunks_in_flight = max_chunks_in_flight
+        self.max_upload_workers = max_upload_workers
+        self.max_read_ahead_bytes = max_read_ahead_bytes
+        self.max_inference_workers = max_inference_workers
+        self.infer_from_whole_stream = infer_from_whole_stream
+        self.inference_cache_dir = inference_cache_dir
+        self.inference_cache_ttl_seconds = inference_cache_ttl_seconds
+        self.max_inference_processes = max_inference_processes
@@ -1,11 +1,14 @@
 import json
 import logging
+import time
 from .records_format_file import RecordsFormatFile
 from .records_schema_sql_file import RecordsSchemaSqlFile
 from .records_schema_json_file import RecordsSchemaJsonFile
 from .schema import RecordsSchema
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from ..url.base import BaseDirectoryUrl, BaseFileUrl
+from ..utils.polling import wait_for, DEFAULT_MAX_MS_BETWEEN_POLLS
 from .records_format import BaseRecordsFormat, DelimitedRecordsFormat
 from typing import Mapping, IO, List, Optional
 from .records_types import UrlDetails, RecordsManifestWithLength, LegacyRecordsManifest
@@ -49,10 +52,12 @@ class RecordsDirectory:
     def save_fileobjs(self,
                       fileobjs_by_target_names: Mapping[str, IO[bytes]],
                       records_schema: Optional[RecordsSchema]=None,
-                      records_format: Optional[BaseRecordsFormat]=None) \
+                      records_format: Optional[BaseRecordsFormat]=None,
+                      max_upload_workers: int=1) \
             -> UrlDetails:
         """Write out a full records directory from file objects."""
-        url_details: UrlDetails = self.save_data_from_fileobjs(fileobjs_by_target_names)
+        url_details: UrlDetails = self.save_data_from_fileobjs(fileobjs_by_target_names,
+                                                               max_upload_workers)
         self.save_preliminary_manifest(url_details)
         if records_schema:
             self.save_schema(records_schema)
@@ -65,17 +70,39 @@ class RecordsDirectory:
 
     def save_data_from_fileobjs(self,
                                 fileobjs_by_target_names: Mapping[str,
-                                                                  IO[bytes]]) -> UrlDetails:
+                                                                  IO[bytes]],
+                                max_upload_workers: int=1) -> UrlDetails:
         """
         Write out just the datafiles into the records directory.
 
         Prefer save_fileobjs when writing a complete records directory.
+
+        :param max_upload_workers: If greater than one, upload up to
+          this many files concurrently.  The returned details are in
+          the same order as fileobjs_by_target_names regardless.
         """
         url_details: UrlDetails = {}
-        for target_name, fileobj in fileobjs_by_target_names.items():
-            target_loc = self.loc.file_in_this_directory(target_name)
+        # Create the URL objects up front in this thread, as the
+        # underlying client libraries don't promise their session
+        # objects are safe to use from multiple threads.
+        target_locs_and_fileobjs = [
+            (self.loc.file_in_this_directory(target_name), fileobj)
+            for target_name, fileobj in fileobjs_by_target_names.items()
+        ]
+
+        def upload(target_loc: BaseFileUrl, fileobj: IO[bytes]) -> int:
             logger.info(f"Uploading {target_loc.url}")
-            length: int = target_loc.upload_fileobj(fileobj)
+            return target_loc.upload_fileobj(fileobj)
+
+        if max_upload_workers > 1 and len(target_locs_and_fileobjs) > 1:
+            with ThreadPoolExecutor(max_workers=max_upload_workers) as executor:
+                futures = [executor.submit(upload, target_loc, fileobj)
+                           for target_loc, fileobj in target_locs_and_fileobjs]
+                lengths = [future.result() for future in futures]
+        else:
+            lengths = [upload(target_loc, fileobj)
+                       for target_loc, fileobj in target_locs_and_fileobjs]
+        for (target_loc, _), length in zip(target_locs_and_fileobjs, lengths):
             url_details[target_loc.url] = {
                 'content_length': length,
             }
@@ -198,13 +225,47 @@ class RecordsDirectory:
     def await_completion(self,
                          manifest_filename: str = "_manifest",
                          log_level: int = logging.INFO,
-                         ms_between_polls: int = 50) -> None:
+                         ms_between_polls: int = 50,
+                         max_ms_between_polls: int = DEFAULT_MAX_MS_BETWEEN_POLLS,
+                         timeout_seconds: Optional[float] = None) -> None:
+        """Wait until the manifest and all of the files it lists exist.
+
+        Rather than waiting on each file in turn, the directory is
+        listed once per poll and checked for all outstanding files.
+        Raises TimeoutError if that takes longer than timeout_seconds
+        overall.  Returns immediately for locations where files appear
+        as soon as they're written.
+        """
+        if not self.loc.eventually_consistent:
+            return
+        start = time.monotonic()
+
+        def remaining_seconds() -> Optional[float]:
+            if timeout_seconds is None:
+                return None
+            return max(timeout_seconds - (time.monotonic() - start), 0)
+
         manifest_loc = self.loc.file_in_this_directory(manifest_filename)
-        manifest_loc.wait_to_exist(log_level=log_level, ms_between_polls=ms_between_polls)
-        manifest_locs = [self.loc.file_in_this_directory(self._filename_of_url(url))
-                         for url in self.manifest_entry_urls()]
-        for loc in manifest_locs:
-            loc.wait_to_exist(log_level=log_level, ms_between_polls=ms_between_polls)
+        manifest_loc.wait_to_exist(log_level=log_level,
+                                   ms_between_polls=ms_between_polls,
+                                   max_ms_between_polls=max_ms_between_polls,
+                                   timeout_seconds=remaining_seconds())
+        missing_filenames = {self._filename_of_url(url)
+                             for url in self.manifest_entry_urls()}
+        total_files = len(missing_filenames)
+
+        def all_files_exist() -> bool:
+            missing_filenames.difference_update(loc.filename()
+                                                for loc in self.loc.files_in_directory())
+            return len(missing_filenames) == 0
+
+        wait_for(all_files_exist,
+                 description=lambda: (f"{len(missing_filenames)} of {total_files} "
+                                      f"files to appear in {self.loc.url}"),
+                 log_level=log_level,
+                 ms_between_polls=ms_between_polls,
+                 max_ms_between_polls=max_ms_between_polls,
+                 timeout_seconds=remaining_seconds())
 
     def __str__(self) -> str:
         return f"{type(self).__name__}({self.loc.url})"
@@ -1,7 +1,8 @@
+import copy
 import datetime
 from ...processing_instructions import ProcessingInstructions
 import logging
-from typing import Optional, Dict, Any, Type, cast, TYPE_CHECKING
+from typing import Optional, Dict, FrozenSet, Any, Type, cast, TYPE_CHECKING
 from ....utils.limits import (FLOAT16_SIGNIFICAND_BITS,
                               FLOAT32_SIGNIFICAND_BITS,
                               FLOAT64_SIGNIFICAND_BITS,
@@ -67,6 +68,42 @@ class RecordsSchemaField:
             return True
         return False
 
+    @staticmethod
+    def widest_type(a: 'FieldType', b: 'FieldType') -> 'FieldType':
+        """Return a field type which can represent values of both types
+        given, falling back to string."""
+        if a == b:
+            return a
+        widenings: Dict[FrozenSet['FieldType'], 'FieldType'] = {
+            frozenset(['integer', 'decimal']): 'decimal',
+            frozenset(['date', 'datetime']): 'datetime',
+            frozenset(['datetime', 'datetimetz']): 'datetimetz',
+            frozenset(['time', 'timetz']): 'timetz',
+        }
+        return widenings.get(frozenset([a, b]), 'string')
+
+    def merge(self, other: 'RecordsSchemaField') -> 'RecordsSchemaField':
+        """Combine what was learned about this field from two separate
+        sets of records (e.g., two files of the same records directory)
+        into a new field which fits both."""
+        if self.name != other.name:
+            raise ValueError(f"Can't merge field {self.name} with field {other.name}")
+        field_type = RecordsSchemaField.widest_type(self.field_type, other.field_type)
+        a = self.cast(field_type)
+        b = other.cast(field_type)
+        constraints: Optional[RecordsSchemaFieldConstraints] = None
+        if a.constraints is not None and b.constraints is not None:
+            constraints = a.constraints.merge(b.constraints)
+        statistics: Optional[RecordsSchemaFieldStatistics] = None
+        if a.statistics is not None and b.statistics is not None:
+            statistics = copy.copy(a.statistics)
+            statistics.merge(b.statistics)
+        return RecordsSchemaField(name=self.name,
+                                  field_type=field_type,
+                                  constraints=constraints,
+                                  statistics=statistics,
+                                  representations=self.representations)
+
     @staticmethod
     def python_type_to_field_type(specific_type: Type[Any]) -> Optional['FieldType']:
         import numpy as np
@@ -1,6 +1,6 @@
 import logging
 from records_mover.mover_types import _assert_never
-from typing import Optional, cast, TYPE_CHECKING
+from typing import Optional, TypeVar, cast, TYPE_CHECKING
 from records_mover.utils.limits import (FLOAT16_SIGNIFICAND_BITS,
                                         FLOAT32_SIGNIFICAND_BITS,
                                         FLOAT64_SIGNIFICAND_BITS,
@@ -37,6 +37,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+T = TypeVar('T')
+
+
+def _same_or_none(a: Optional[T], b: Optional[T]) -> Optional[T]:
+    return a if a == b else None
+
+
 class RecordsSchemaFieldConstraints:
     def __init__(self, required: bool, unique: Optional[bool] = None):
         """
@@ -147,6 +154,14 @@ class RecordsSchemaFieldConstraints:
 
         return constraints
 
+    def merge(self, other: 'RecordsSchemaFieldConstraints') -> 'RecordsSchemaFieldConstraints':
+        """Combine constraints inferred from two separate sets of records
+        (e.g., two files of the same records directory) into constraints
+        which hold for both.  Both should already be cast to the same
+        field type."""
+        return RecordsSchemaFieldConstraints(required=self.required and other.required,
+                                             unique=_same_or_none(self.unique, other.unique))
+
     @staticmethod
     def from_sqlalchemy_type(required: bool,
                              unique: Optional[bool],
@@ -53,6 +53,31 @@ class RecordsSchemaFieldDecimalConstraints(RecordsSchemaFieldConstraints):
                                                         fixed_precision=fixed_precision,
                                                         fixed_scale=fixed_scale)
 
+    def merge(self, other: 'RecordsSchemaFieldConstraints') ->\
+            'RecordsSchemaFieldDecimalConstraints':
+        merged = super().merge(other)
+        if not isinstance(other, RecordsSchemaFieldDecimalConstraints):
+            raise TypeError(f"Can't merge {self} with {other}")
+        fp_total_bits: Optional[int] = None
+        fp_significand_bits: Optional[int] = None
+        if self.fp_total_bits is not None and other.fp_total_bits is not None:
+            fp_total_bits = max(self.fp_total_bits, other.fp_total_bits)
+        if self.fp_significand_bits is not None and other.fp_significand_bits is not None:
+            fp_significand_bits = max(self.fp_significand_bits, other.fp_significand_bits)
+        # There's no fixed precision and scale both will fit in
+        # without knowing the values, so only keep those if they agree.
+        fixed_precision: Optional[int] = None
+        fixed_scale: Optional[int] = None
+        if (self.fixed_precision, self.fixed_scale) == (other.fixed_precision, other.fixed_scale):
+            fixed_precision = self.fixed_precision
+            fixed_scale = self.fixed_scale
+        return RecordsSchemaFieldDecimalConstraints(required=merged.required,
+                                                    unique=merged.unique,
+                                                    fixed_precision=fixed_precision,
+                                                    fixed_scale=fixed_scale,
+                                                    fp_total_bits=fp_total_bits,
+                                                    fp_significand_bits=fp_significand_bits)
+
     def to_data(self) -> 'FieldDecimalConstraintsDict':
         raw_out = super().to_data()
         out = cast('FieldDecimalConstraintsDict', raw_out)
@@ -36,6 +36,22 @@ class RecordsSchemaFieldIntegerConstraints(RecordsSchemaFieldConstraints):
                                                     min_=min_,
                                                     max_=max_)
 
+    def merge(self, other: 'RecordsSchemaFieldConstraints') ->\
+            'RecordsSchemaFieldIntegerConstraints':
+        merged = super().merge(other)
+        if not isinstance(other, RecordsSchemaFieldIntegerConstraints):
+            raise TypeError(f"Can't merge {self} with {other}")
+        min_: Optional[int] = None
+        max_: Optional[int] = None
+        if self.min_ is not None and other.min_ is not None:
+            min_ = min(self.min_, other.min_)
+        if self.max_ is not None and other.max_ is not None:
+            max_ = max(self.max_, other.max_)
+        return RecordsSchemaFieldIntegerConstraints(required=merged.required,
+                                                    unique=merged.unique,
+                                                    min_=min_,
+                                                    max_=max_)
+
     def to_data(self) -> 'FieldIntegerConstraintsDict':
         raw_out = super().to_data()
         out = cast('FieldIntegerConstraintsDict', raw_out)
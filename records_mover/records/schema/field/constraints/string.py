@@ -45,6 +45,22 @@ class RecordsSchemaFieldStringConstraints(RecordsSchemaFieldConstraints):
                                                    max_length_bytes=max_length_bytes,
                                                    max_length_chars=max_length_chars)
 
+    def merge(self, other: 'RecordsSchemaFieldConstraints') ->\
+            'RecordsSchemaFieldStringConstraints':
+        merged = super().merge(other)
+        if not isinstance(other, RecordsSchemaFieldStringConstraints):
+            raise TypeError(f"Can't merge {self} with {other}")
+        max_length_bytes: Optional[int] = None
+        max_length_chars: Optional[int] = None
+        if self.max_length_bytes is not None and other.max_length_bytes is not None:
+            max_length_bytes = max(self.max_length_bytes, other.max_length_bytes)
+        if self.max_length_chars is not None and other.max_length_chars is not None:
+            max_length_chars = max(self.max_length_chars, other.max_length_chars)
+        return RecordsSchemaFieldStringConstraints(required=merged.required,
+                                                   unique=merged.unique,
+                                                   max_length_bytes=max_length_bytes,
+                                                   max_length_chars=max_length_chars)
+
     def to_data(self) -> 'FieldStringConstraintsDict':
         raw_out = super().to_data()
         out = cast('FieldStringConstraintsDict', raw_out)
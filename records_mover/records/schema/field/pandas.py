@@ -1,11 +1,16 @@
 import pandas as pd
 from pandas import Series, Index
-from typing import Any, Type, TYPE_CHECKING, Optional, Mapping, Union
-from .statistics import RecordsSchemaFieldStringStatistics
+from pandas.api.types import infer_dtype
+from typing import Any, FrozenSet, Type, TYPE_CHECKING, Optional, Mapping, Tuple, Union
+from .statistics import (RecordsSchemaFieldStatistics,
+                         RecordsSchemaFieldStringStatistics,
+                         RecordsSchemaFieldNumericStatistics,
+                         Number)
 from ...processing_instructions import ProcessingInstructions
 from .representation import RecordsSchemaFieldRepresentation
 from ....utils.limits import IntegerType
 from .numpy import details_from_numpy_dtype
+import datetime
 import numpy as np
 if TYPE_CHECKING:
     from ..field import RecordsSchemaField  # noqa
@@ -18,6 +23,24 @@ Dtype = Union[
 ]
 DtypeObj = Union[np.dtype, "ExtensionDtype"]
 
+# Python types behind the kinds of values reported by pandas'
+# infer_dtype() which map to a records schema field type
+INFERRED_PYTHON_TYPES: Mapping[str, Type[Any]] = {
+    'string': str,
+    'integer': int,
+    'floating': float,
+    'boolean': bool,
+    'date': datetime.date,
+    'time': datetime.time,
+    # Includes pd.Timestamp, which is a subclass
+    'datetime': datetime.datetime,
+    'datetime64': pd.Timestamp,
+}
+
+# Bound on the code points of a string column examined at a time
+# when counting UTF-8 lengths, as 4 byte integers
+MAX_CODE_POINTS_PER_BLOCK = 4 * 1024 * 1024
+
 
 def supports_nullable_ints() -> bool:
     """Detects if this version of pandas supports nullable int extension types."""
@@ -92,6 +115,63 @@ def field_from_series(series: Series,
                               representations=representations)
 
 
+def _numeric_range(series: Series) -> Tuple[Optional[Number], Optional[Number]]:
+    try:
+        min_, max_ = series.min(), series.max()
+    except TypeError:
+        # Values that can't be compared with each other
+        return None, None
+    if not (pd.api.types.is_number(min_) and pd.api.types.is_number(max_)):
+        return None, None
+    if pd.isna(min_) or pd.isna(max_):
+        return None, None
+    # Convert from numpy scalars so these can be merged and serialized
+    return getattr(min_, 'item', lambda: min_)(), getattr(max_, 'item', lambda: max_)()
+
+
+def _python_type_of(series: Series, skipna: bool) -> Optional[Type[Any]]:
+    """The one Python type of all of the series's values (only non-null
+    ones if skipna), or None if there's more than one, or one that
+    refine_field_from_series() doesn't need to tell apart.
+
+    Unlike mapping type() across the series, pandas' infer_dtype()
+    answers from the dtype when it can, and otherwise scans the values
+    in C.
+    """
+    inferred_type = infer_dtype(series, skipna=skipna)
+    if inferred_type == 'date':
+        # datetimes are dates too, so a mix of the two is reported as
+        # 'date'--which would lose the times
+        if any(isinstance(value, datetime.datetime) for value in series.to_numpy(dtype=object)):
+            return None
+    return INFERRED_PYTHON_TYPES.get(inferred_type)
+
+
+def _max_utf8_length(strings: Series, char_lengths: Series, max_chars: int) -> int:
+    """Length in bytes of the longest UTF-8 encoding of any of strings,
+    given their lengths in characters, counted from their code points
+    without encoding each string."""
+    # A string of n characters takes n to 4 bytes to encode, so only
+    # those at least a quarter of the length of the longest can
+    # produce the longest encoding
+    lengths_in_chars = char_lengths.to_numpy(dtype=np.float64, na_value=0.0)
+    candidates = lengths_in_chars >= max_chars / 4
+    candidate_strings = strings[candidates].to_numpy(dtype=object)
+    candidate_lengths_in_chars = lengths_in_chars[candidates].astype(np.int64)
+    max_bytes = max_chars
+    block_rows = max(1, MAX_CODE_POINTS_PER_BLOCK // max(1, max_chars))
+    for start in range(0, len(candidate_strings), block_rows):
+        block = candidate_strings[start:start + block_rows]
+        # Fixed-width UCS-4, so each string is a row of code points
+        code_points = block.astype(np.str_).view(np.uint32).reshape(len(block), -1)
+        extra_bytes = ((code_points >= 0x80).sum(axis=1) +
+                       (code_points >= 0x800).sum(axis=1) +
+                       (code_points >= 0x10000).sum(axis=1))
+        lengths = candidate_lengths_in_chars[start:start + block_rows] + extra_bytes
+        max_bytes = max(max_bytes, int(lengths.max()))
+    return max_bytes
+
+
 def refine_field_from_series(field: 'RecordsSchemaField',
                              series: Series,
                              total_rows: int,
@@ -102,27 +182,62 @@ def refine_field_from_series(field: 'RecordsSchemaField',
     # types that show up directly as `.dtype` already, we can find
     # that out.
     #
-    unique_python_types = series.map(type).unique()
-    if unique_python_types.size == 1:
-        unique_python_type: Type[Any] = unique_python_types[0]
+    unique_python_type = _python_type_of(series, skipna=False)
+    if unique_python_type is not None:
         field_type = field.python_type_to_field_type(unique_python_type)
         if field_type is not None:
             if RecordsSchemaField.is_more_specific_type(field_type, field.field_type):
                 field = field.cast(field_type)
 
+    null_count = int(series.isna().sum())
+    # Nulls show up as e.g. float NaNs, which shouldn't count
+    non_null_python_type = (unique_python_type if null_count == 0
+                            else _python_type_of(series, skipna=True))
+    python_types: FrozenSet[type]
+    if non_null_python_type is not None:
+        python_types = frozenset([non_null_python_type])
+    elif null_count == len(series):
+        python_types = frozenset()
+    else:
+        # A mix of types, which is rare enough to be worth
+        # the per-value scan to find out exactly what they are
+        python_types = frozenset(series.dropna().map(type).unique())
+
+    statistics: Optional[RecordsSchemaFieldStatistics]
     if field.field_type == 'string':
-        max_column_length = series.astype('str').map(len).max()
-        if not np.isnan(max_column_length):
+        strings = series.astype('str')
+        char_lengths = strings.str.len()
+        max_column_length = char_lengths.max()
+        if np.isnan(max_column_length):
+            statistics = None
+        else:
+            max_column_length = int(max_column_length)
+            max_column_length_bytes = _max_utf8_length(strings, char_lengths,
+                                                       max_column_length)
             statistics =\
                 RecordsSchemaFieldStringStatistics(rows_sampled=rows_sampled,
                                                    total_rows=total_rows,
-                                                   max_length_bytes=None,
-                                                   max_length_chars=max_column_length)
-            if field.statistics is None:
-                field.statistics = statistics
-            elif not isinstance(field.statistics, RecordsSchemaFieldStringStatistics):
-                raise ValueError("Did not expect to see existing statistics "
-                                 f"for string type: {field.statistics}")
-            else:
-                field.statistics.merge(statistics)
+                                                   max_length_bytes=max_column_length_bytes,
+                                                   max_length_chars=max_column_length,
+                                                   null_count=null_count,
+                                                   python_types=python_types)
+    elif field.field_type == 'integer' or field.field_type == 'decimal':
+        min_, max_ = _numeric_range(series)
+        statistics =\
+            RecordsSchemaFieldNumericStatistics(rows_sampled=rows_sampled,
+                                                total_rows=total_rows,
+                                                min_=min_,
+                                                max_=max_,
+                                                null_count=null_count,
+                                                python_types=python_types)
+    else:
+        statistics = RecordsSchemaFieldStatistics(rows_sampled=rows_sampled,
+                                                  total_rows=total_rows,
+                                                  null_count=null_count,
+                                                  python_types=python_types)
+    if statistics is not None:
+        if field.statistics is None:
+            field.statistics = statistics
+        else:
+            field.statistics.merge(statistics)
     return field
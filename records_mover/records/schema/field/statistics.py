@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Union, cast, TYPE_CHECKING
+from typing import Optional, FrozenSet, Union, TypeVar, cast, TYPE_CHECKING
 if TYPE_CHECKING:
     from mypy_extensions import TypedDict
 
@@ -13,16 +13,65 @@ if TYPE_CHECKING:
         max_length_bytes: int
         max_length_chars: int
 
+    class NumericFieldStatisticsDict(FieldStatisticsDict, total=False):
+        min: str
+        max: str
+
 
 logger = logging.getLogger(__name__)
 
+Number = Union[int, float]
+
+T = TypeVar('T', int, float)
+
+
+def _max_or_none(a: Optional[T], b: Optional[T]) -> Optional[T]:
+    if a is None or b is None:
+        return None
+    return max(a, b)
+
+
+def _max_of_known(a: Optional[T], b: Optional[T]) -> Optional[T]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+
+def _min_or_none(a: Optional[T], b: Optional[T]) -> Optional[T]:
+    if a is None or b is None:
+        return None
+    return min(a, b)
+
 
 class RecordsSchemaFieldStatistics:
     def __init__(self,
                  rows_sampled: int,
-                 total_rows: int):
+                 total_rows: int,
+                 null_count: Optional[int] = None,
+                 python_types: Optional[FrozenSet[type]] = None):
+        """
+        :param rows_sampled: Number of rows these statistics were
+        gathered from.
+
+        :param total_rows: Number of rows in the data these statistics
+        describe.
+
+        :param null_count: Number of sampled rows with no value for
+        this field, if known.
+
+        :param python_types: Types of the non-null values sampled, if
+        known.
+
+        null_count and python_types aren't part of the records schema
+        spec, so they are used while inferring a schema but not
+        serialized.
+        """
         self.rows_sampled = rows_sampled
         self.total_rows = total_rows
+        self.null_count = null_count
+        self.python_types = python_types
 
     def to_data(self) -> 'FieldStatisticsDict':
         return {
@@ -31,7 +80,9 @@ class RecordsSchemaFieldStatistics:
         }
 
     @staticmethod
-    def from_data(data: Optional[Union['FieldStatisticsDict', 'StringFieldStatisticsDict']],
+    def from_data(data: Optional[Union['FieldStatisticsDict',
+                                       'StringFieldStatisticsDict',
+                                       'NumericFieldStatisticsDict']],
                   field_type: 'FieldType') -> Optional['RecordsSchemaFieldStatistics']:
         if data is None:
             return None
@@ -44,13 +95,49 @@ class RecordsSchemaFieldStatistics:
                 total_rows=total_rows,
                 max_length_bytes=data.get('max_length_bytes'),
                 max_length_chars=data.get('max_length_chars'))
+        elif field_type == 'integer' or field_type == 'decimal':
+            numeric_data = cast('NumericFieldStatisticsDict', data)
+            parse = int if field_type == 'integer' else float
+            min_str = numeric_data.get('min')
+            max_str = numeric_data.get('max')
+            return RecordsSchemaFieldNumericStatistics(
+                rows_sampled=rows_sampled,
+                total_rows=total_rows,
+                min_=None if min_str is None else parse(min_str),
+                max_=None if max_str is None else parse(max_str))
         else:
             return RecordsSchemaFieldStatistics(rows_sampled=rows_sampled,
                                                 total_rows=total_rows)
 
+    def merge(self, other: 'RecordsSchemaFieldStatistics') -> None:
+        """Fold in statistics from a separate set of records (e.g.,
+        another file of the same records directory, or the next chunk
+        of a stream of dataframes)."""
+        self.rows_sampled += other.rows_sampled
+        self.total_rows += other.total_rows
+        if self.null_count is None or other.null_count is None:
+            self.null_count = None
+        else:
+            self.null_count += other.null_count
+        if self.python_types is None or other.python_types is None:
+            self.python_types = None
+        else:
+            self.python_types |= other.python_types
+
     def cast(self, field_type: 'FieldType') -> Optional['RecordsSchemaFieldStatistics']:
-        # only string provides statistics at this point
-        return None
+        # What's specific to the old type doesn't apply to the new one
+        if field_type == 'string':
+            # Lengths as strings weren't measured
+            return RecordsSchemaFieldStringStatistics(rows_sampled=self.rows_sampled,
+                                                      total_rows=self.total_rows,
+                                                      max_length_bytes=None,
+                                                      max_length_chars=None,
+                                                      null_count=self.null_count,
+                                                      python_types=self.python_types)
+        return RecordsSchemaFieldStatistics(rows_sampled=self.rows_sampled,
+                                            total_rows=self.total_rows,
+                                            null_count=self.null_count,
+                                            python_types=self.python_types)
 
     def __str__(self) -> str:
         return f"{type(self)}({self.to_data()})"
@@ -61,9 +148,13 @@ class RecordsSchemaFieldStringStatistics(RecordsSchemaFieldStatistics):
                  rows_sampled: int,
                  total_rows: int,
                  max_length_bytes: Optional[int],
-                 max_length_chars: Optional[int]):
+                 max_length_chars: Optional[int],
+                 null_count: Optional[int] = None,
+                 python_types: Optional[FrozenSet[type]] = None):
         super().__init__(rows_sampled=rows_sampled,
-                         total_rows=total_rows)
+                         total_rows=total_rows,
+                         null_count=null_count,
+                         python_types=python_types)
         self.max_length_bytes = max_length_bytes
         self.max_length_chars = max_length_chars
 
@@ -76,11 +167,69 @@ class RecordsSchemaFieldStringStatistics(RecordsSchemaFieldStatistics):
             out['max_length_chars'] = int(self.max_length_chars)
         return out
 
-    def merge(self, other: 'RecordsSchemaFieldStringStatistics') -> None:
-        raise NotImplementedError
+    def merge(self, other: 'RecordsSchemaFieldStatistics') -> None:
+        super().merge(other)
+        # Records of another type (e.g., another chunk where the
+        # column held only numbers) may not have had their lengths as
+        # strings measured; keep the longest that was, rather than
+        # losing them all.
+        if isinstance(other, RecordsSchemaFieldStringStatistics):
+            self.max_length_bytes = _max_of_known(self.max_length_bytes, other.max_length_bytes)
+            self.max_length_chars = _max_of_known(self.max_length_chars, other.max_length_chars)
 
     def cast(self, field_type: 'FieldType') -> Optional['RecordsSchemaFieldStatistics']:
         if field_type == 'string':
             return self
         else:
             return super().cast(field_type)
+
+
+class RecordsSchemaFieldNumericStatistics(RecordsSchemaFieldStatistics):
+    def __init__(self,
+                 rows_sampled: int,
+                 total_rows: int,
+                 min_: Optional[Number],
+                 max_: Optional[Number],
+                 null_count: Optional[int] = None,
+                 python_types: Optional[FrozenSet[type]] = None):
+        super().__init__(rows_sampled=rows_sampled,
+                         total_rows=total_rows,
+                         null_count=null_count,
+                         python_types=python_types)
+        self.min_ = min_
+        self.max_ = max_
+
+    def to_data(self) -> 'NumericFieldStatisticsDict':
+        generic_out = super().to_data()
+        out = cast('NumericFieldStatisticsDict', generic_out)
+        # Encoded as strings to avoid JSON numeric limits
+        if self.min_ is not None:
+            out['min'] = str(self.min_)
+        if self.max_ is not None:
+            out['max'] = str(self.max_)
+        return out
+
+    def merge(self, other: 'RecordsSchemaFieldStatistics') -> None:
+        super().merge(other)
+        if isinstance(other, RecordsSchemaFieldNumericStatistics):
+            self.min_ = _min_or_none(self.min_, other.min_)
+            self.max_ = _max_or_none(self.max_, other.max_)
+        else:
+            self.min_ = None
+            self.max_ = None
+
+    def cast(self, field_type: 'FieldType') -> Optional['RecordsSchemaFieldStatistics']:
+        if field_type == 'integer' or field_type == 'decimal':
+            return self
+        if (field_type == 'string' and
+           isinstance(self.min_, int) and isinstance(self.max_, int)):
+            # No integer in range is written longer than the ends of
+            # the range, and they're plain ASCII
+            max_length = max(len(str(self.min_)), len(str(self.max_)))
+            return RecordsSchemaFieldStringStatistics(rows_sampled=self.rows_sampled,
+                                                      total_rows=self.total_rows,
+                                                      max_length_bytes=max_length,
+                                                      max_length_chars=max_length,
+                                                      null_count=self.null_count,
+                                                      python_types=self.python_types)
+        return super().cast(field_type)
@@ -1,13 +1,19 @@
+import functools
+import io
 import logging
 import json
-from typing import List, Dict, Mapping, IO, Any, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Mapping, IO, Any, Iterator, Optional, Tuple, TYPE_CHECKING
 from ..field import RecordsSchemaField
 from ...records_format import BaseRecordsFormat
 from ...processing_instructions import ProcessingInstructions
 from .known_representation import RecordsSchemaKnownRepresentation
 from ..errors import UnsupportedSchemaError
+from ...delimited import PartialRecordsHints
+from ....utils.peek_buffered_file import PeekBufferedFile
 if TYPE_CHECKING:
     from pandas import DataFrame
+    from pandas.io.parsers import TextFileReader
 
     from ....db import DBDriver  # noqa
     from typing_extensions import Literal
@@ -29,6 +35,77 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _sample_df_from_peek_buffer(fileobj: PeekBufferedFile,
+                                records_format: BaseRecordsFormat,
+                                sample_row_count: Optional[int]) -> 'DataFrame':
+    from records_mover.records.delimited import stream_csv
+    from records_mover.records.delimited.sniff import (read_decompressed_sample,
+                                                       complete_records_from_sample)
+
+    # Only the start of a pure stream can be replayed to whoever reads
+    # it next, so infer from as much of that as fits, leaving room for
+    # decompressors reading ahead of what they return.
+    hints = records_format.hints  # type: ignore
+    sample = read_decompressed_sample(fileobj,  # type: ignore
+                                      hints.get('compression'),
+                                      max_bytes=fileobj.max_buffer_bytes // 2)
+    text = complete_records_from_sample(sample,
+                                        hints.get('encoding', 'UTF8'),
+                                        hints.get('record-terminator'))
+    sample_hints: PartialRecordsHints = {**hints, 'compression': None, 'encoding': 'UTF8'}
+    with stream_csv(io.BytesIO(text.encode('utf-8')), sample_hints) as reader:
+        if sample_row_count is not None:
+            return reader.get_chunk(sample_row_count)
+        else:
+            return reader.read()
+
+
+def _chunks(reader: 'TextFileReader', chunk_rows: int) -> Iterator['DataFrame']:
+    while True:
+        try:
+            yield reader.get_chunk(chunk_rows)
+        except StopIteration:
+            return
+
+
+def _infer_schema_from_fileobj(fileobj: IO[bytes],
+                               records_format: BaseRecordsFormat,
+                               processing_instructions: ProcessingInstructions,
+                               sample_row_count: Optional[int]) -> Tuple[int, 'RecordsSchema']:
+    from records_mover.records.delimited import stream_csv
+    from records_mover.pandas import purge_unnamed_unused_columns
+    from records_mover.pandas.sample import reservoir_sample
+
+    if isinstance(fileobj, PeekBufferedFile):
+        df = _sample_df_from_peek_buffer(fileobj,
+                                         records_format,
+                                         sample_row_count)
+    else:
+        with stream_csv(fileobj, records_format.hints) as reader:  # type: ignore
+            # Parse schema from sample df
+
+            if sample_row_count is None:
+                df = reader.read()
+            elif processing_instructions.infer_from_whole_stream:
+                sampled_df, rows_read = reservoir_sample(_chunks(reader, sample_row_count),
+                                                         sample_row_count)
+                assert sampled_df is not None  # there's always a first chunk, if only a header
+                df = sampled_df
+                logger.info(f"Sampled {len(df.index)} of {rows_read} rows to infer schema")
+            else:
+                df = reader.get_chunk(sample_row_count)
+
+            fileobj.seek(0)
+
+    df = purge_unnamed_unused_columns(df)
+    schema = RecordsSchema.from_dataframe(df, processing_instructions,
+                                          include_index=False)
+
+    schema = schema.refine_from_dataframe(df,
+                                          processing_instructions=processing_instructions)
+    return len(df.index), schema
+
+
 class RecordsSchema:
     """This class records whatever type information we have available at
     the time of capture of records data so that future readers of the
@@ -134,38 +211,64 @@ class RecordsSchema:
                       records_format: BaseRecordsFormat,
                       processing_instructions: ProcessingInstructions) -> 'RecordsSchema':
         """
-        Sniffs
+        Sniffs a schema from the records in fileobjs.  When the records
+        are split across several files, each is inferred from
+        separately--up to processing_instructions.max_inference_workers
+        at once--and the results merged.
         """
-        from records_mover.records.delimited import stream_csv
-        from records_mover.pandas import purge_unnamed_unused_columns
-
-        if len(fileobjs) != 1:
-            # https://github.com/bluelabsio/records-mover/issues/84
-            raise NotImplementedError('Cannot currently sniff schema from multiple '
-                                      'files--please provide explicit schema JSON')
-        fileobj = fileobjs[0]
-        if not fileobj.seekable():
-            raise NotImplementedError('Cannot currently sniff schema from a pure stream--'
-                                      'please save file to disk and load from there or '
-                                      'provide explicit schema JSON')
-        with stream_csv(fileobj, records_format.hints) as reader:  # type: ignore
-            # Parse schema from sample df
-
-            sample_row_count = processing_instructions.max_inference_rows
-            if sample_row_count is not None:
-                df = reader.get_chunk(sample_row_count)
-            else:
-                df = reader.read()
-
-            fileobj.seek(0)
-
-            df = purge_unnamed_unused_columns(df)
-            schema = RecordsSchema.from_dataframe(df, processing_instructions,
-                                                  include_index=False)
-
-            schema = schema.refine_from_dataframe(df,
-                                                  processing_instructions=processing_instructions)
+        from pandas.errors import EmptyDataError
+
+        for fileobj in fileobjs:
+            if not fileobj.seekable():
+                raise NotImplementedError('Cannot currently sniff schema from a pure stream--'
+                                          'please save file to disk and load from there or '
+                                          'provide explicit schema JSON')
+        sample_row_count = processing_instructions.max_inference_rows
+        if len(fileobjs) == 1:
+            _, schema = _infer_schema_from_fileobj(fileobjs[0],
+                                                   records_format,
+                                                   processing_instructions,
+                                                   sample_row_count)
             return schema
+        # Spread the rows looked at across all of the files
+        if sample_row_count is not None:
+            sample_row_count = max(1, -(-sample_row_count // len(fileobjs)))
+
+        def infer(fileobj: IO[bytes]) -> Optional[Tuple[int, 'RecordsSchema']]:
+            try:
+                return _infer_schema_from_fileobj(fileobj,
+                                                  records_format,
+                                                  processing_instructions,
+                                                  sample_row_count)
+            except EmptyDataError:
+                # Parallel unloads often leave some files empty
+                return None
+
+        max_workers = min(processing_instructions.max_inference_workers, len(fileobjs))
+        logger.info(f"Inferring schema from {len(fileobjs)} files, "
+                    f"{max_workers} at a time")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = [result for result in executor.map(infer, fileobjs)
+                       if result is not None]
+        if not results:
+            raise EmptyDataError('No columns to parse from any file')
+        # Files with a header but no records say nothing about types
+        schemas = ([schema for row_count, schema in results if row_count > 0] or
+                   [schema for _, schema in results])
+        return functools.reduce(lambda a, b: a.merge(b), schemas)
+
+    def merge(self, other: 'RecordsSchema') -> 'RecordsSchema':
+        """Combine schemas inferred from separate sets of records with the
+        same fields (e.g., the files of a records directory) into one
+        which fits them all."""
+        field_names = [field.name for field in self.fields]
+        other_field_names = [field.name for field in other.fields]
+        if field_names != other_field_names:
+            raise ValueError(f"Can't merge schemas with different fields: {field_names} "
+                             f"vs {other_field_names}")
+        return RecordsSchema(fields=[field.merge(other_field)
+                                     for field, other_field in zip(self.fields, other.fields)],
+                             known_representations=self.known_representations)
 
     def refine_from_dataframe(self,
                               df: 'DataFrame',
@@ -1,12 +1,25 @@
 from pandas import DataFrame
 from .known_representation import RecordsSchemaKnownRepresentation
-from typing import Dict, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 from ...processing_instructions import ProcessingInstructions
+from ....pandas.sample import sample_rows
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import tempfile
 if TYPE_CHECKING:
     from ..field import RecordsSchemaField  # noqa
     from ..schema import RecordsSchema  # noqa
 
 
+logger = logging.getLogger(__name__)
+
+# Fewest columns worth handing to each inference process--for
+# narrower records, starting processes costs more than it saves
+MIN_COLUMNS_PER_INFERENCE_PROCESS = 100
+
+
 def schema_from_dataframe(df: DataFrame,
                           processing_instructions: ProcessingInstructions,
                           include_index: bool) -> 'RecordsSchema':
@@ -42,16 +55,132 @@ def refine_schema_from_dataframe(records_schema: 'RecordsSchema',
     max_sample_size = processing_instructions.max_inference_rows
     total_rows = len(df.index)
     if max_sample_size is not None and max_sample_size < total_rows:
-        sampled_df = df.sample(n=max_sample_size)
+        sampled_df = sample_rows(df, max_sample_size)
     else:
         sampled_df = df
     rows_sampled = len(sampled_df.index)
 
-    fields = [
-        field.refine_from_series(sampled_df[field.name],
+    num_processes = min(processing_instructions.max_inference_processes,
+                        len(records_schema.fields) // MIN_COLUMNS_PER_INFERENCE_PROCESS,
+                        os.cpu_count() or 1)
+    if num_processes > 1:
+        fields = _refine_fields_in_processes(records_schema.fields,
+                                             sampled_df,
+                                             total_rows=total_rows,
+                                             rows_sampled=rows_sampled,
+                                             num_processes=num_processes)
+    else:
+        fields = [
+            field.refine_from_series(sampled_df[field.name],
+                                     total_rows=total_rows,
+                                     rows_sampled=rows_sampled)
+            for field in records_schema.fields
+        ]
+    return RecordsSchema(fields=fields,
+                         known_representations=records_schema.known_representations)
+
+
+def _arrow_table(df: DataFrame, names: List[str]) -> Optional[Any]:
+    """Return the columns of df which can be shared via Arrow without
+    changing what's inferred from them as a pyarrow Table, or None if
+    there are none.
+
+    That leaves out object columns, whose values Arrow converts (e.g.,
+    ints and Nones come back as float64 with NaNs, and Nones in
+    strings as NaNs), and any whose dtype doesn't survive the trip.
+    """
+    try:
+        import pyarrow as pa
+    except ModuleNotFoundError:
+        logger.info("Pickling records for inference processes, as pyarrow isn't installed")
+        return None
+    # Arrow only has string column names
+    candidates = [name for name in names
+                  if isinstance(name, str) and df[name].dtype != object]
+    if len(candidates) == 0:
+        return None
+    try:
+        # dtypes alone decide how these convert, so no rows are needed
+        round_tripped_dtypes =\
+            pa.Table.from_pandas(df[candidates].iloc[:0], preserve_index=False).to_pandas().dtypes
+        shareable = [name for name in candidates
+                     if round_tripped_dtypes[name] == df[name].dtype]
+        if len(shareable) == 0:
+            return None
+        return pa.Table.from_pandas(df[shareable], preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        logger.info(f"Pickling records for inference processes, as they can't be "
+                    f"shared via Arrow: {e}")
+        return None
+
+
+def _refine_fields_in_process(arrow_path: Optional[str],
+                              arrow_names: List[str],
+                              pickled_df: DataFrame,
+                              fields: List['RecordsSchemaField'],
+                              total_rows: int,
+                              rows_sampled: int) -> List['RecordsSchemaField']:
+    if arrow_path is not None and len(arrow_names) > 0:
+        import pyarrow as pa
+
+        # Memory mapped, so every process reads the one copy of those
+        # columns in the page cache
+        with pa.memory_map(arrow_path) as source:
+            arrow_df = pa.ipc.open_file(source).read_all().select(arrow_names).to_pandas()
+    else:
+        arrow_df = DataFrame()
+    return [
+        field.refine_from_series(arrow_df[field.name] if field.name in arrow_df
+                                 else pickled_df[field.name],
                                  total_rows=total_rows,
                                  rows_sampled=rows_sampled)
-        for field in records_schema.fields
+        for field in fields
     ]
-    return RecordsSchema(fields=fields,
-                         known_representations=records_schema.known_representations)
+
+
+def _process_pool(num_processes: int) -> multiprocessing.pool.Pool:
+    # Forking a process which may be running other threads (e.g.,
+    # inferring from several files at once) risks deadlocks
+    start_method = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                    else 'spawn')
+    return multiprocessing.get_context(start_method).Pool(processes=num_processes)
+
+
+def _refine_fields_in_processes(fields: List['RecordsSchemaField'],
+                                df: DataFrame,
+                                total_rows: int,
+                                rows_sampled: int,
+                                num_processes: int) -> List['RecordsSchemaField']:
+    """Refine fields from the columns of df, splitting the columns
+    between processes.  Each process is sent its columns of object
+    dtype pickled, and reads the rest from a memory-mapped Arrow file
+    where pyarrow is installed (see _arrow_table()), so that the
+    results match refining them in this process."""
+    names = [field.name for field in fields]
+    table = _arrow_table(df, names)
+    arrow_names = set(table.column_names) if table is not None else set()
+
+    # Contiguous runs of columns, so results come back in order
+    run_length = -(-len(fields) // num_processes)
+    runs = [fields[start:start + run_length] for start in range(0, len(fields), run_length)]
+    logger.info(f"Inferring schema of {len(fields)} columns in {len(runs)} processes")
+    with tempfile.TemporaryDirectory(prefix='records_mover_inference') as dirname:
+        arrow_path = None
+        if table is not None:
+            import pyarrow as pa
+
+            arrow_path = os.path.join(dirname, 'sample.arrow')
+            with pa.OSFile(arrow_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            del table
+        args = [(arrow_path,
+                 [field.name for field in run if field.name in arrow_names],
+                 df[[field.name for field in run if field.name not in arrow_names]],
+                 run,
+                 total_rows,
+                 rows_sampled)
+                for run in runs]
+        with _process_pool(len(runs)) as pool:
+            results = pool.starmap(_refine_fields_in_process, args)
+        return [field for run_of_fields in results for field in run_of_fields]
@@ -39,7 +39,8 @@ class DataUrlRecordsSource(SupportsToFileobjsSource):
                            records_format_if_possible: Optional[BaseRecordsFormat]=None)\
             -> Iterator['FileobjsSource']:
         """Convert current source to a FileObjsSource and present it in a context manager"""
-        with self.url_resolver.file_url(self.input_url).open() as fileobj:
+        loc = self.url_resolver.cached_file_url(self.input_url)
+        with loc.open() as fileobj:
             input_url_obj = urlparse(self.input_url)
             path = input_url_obj.path
             filename = path.split('/')[-1]
@@ -48,7 +49,8 @@ class DataUrlRecordsSource(SupportsToFileobjsSource):
                                 records_format=self.records_format,
                                 records_schema=self.records_schema,
                                 processing_instructions=processing_instructions,
-                                initial_hints=self.initial_hints) as fileobjs_source:
+                                initial_hints=self.initial_hints,
+                                input_locs={filename: loc}) as fileobjs_source:
                 yield fileobjs_source
 
     def __str__(self) -> str:
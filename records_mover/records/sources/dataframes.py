@@ -9,9 +9,10 @@ from .fileobjs import FileobjsSource  # noqa
 from tempfile import NamedTemporaryFile
 from ..delimited import complain_on_unhandled_hints
 import logging
-from typing import Iterator, Iterable, Optional, Union, Dict, IO, Callable, TYPE_CHECKING
+from typing import Iterator, Iterable, Optional, Union, Dict, IO, Callable, Any, TYPE_CHECKING
 from records_mover.pandas import purge_unnamed_unused_columns
 from records_mover.records.pandas import prep_df_for_csv_output
+from records_mover.utils.pipelined_concat_files import PipelinedConcatFiles
 if TYPE_CHECKING:
     from pandas import DataFrame
 
@@ -71,6 +72,14 @@ class DataframesRecordsSource(SupportsToFileobjsSource):
         i = 1
 
         for df in self.dfs:
+            if i > 1 and self.records_schema is None:
+                # initial_records_schema() only looked at the first
+                # chunk, so widen types and fold in statistics from
+                # each later one as it goes by.
+                #
+                # https://github.com/bluelabsio/records-mover/issues/93
+                records_schema =\
+                    records_schema.merge(self.schema_from_df(df, processing_instructions))
             with NamedTemporaryFile(prefix='mover_seralized_dataframe') as output_file:
                 df = purge_unnamed_unused_columns(df)
                 output_filename = output_file.name
@@ -79,15 +88,6 @@ class DataframesRecordsSource(SupportsToFileobjsSource):
                 short_filename = records_format.generate_filename('data{:0>3}'.format(i))
                 target_names_to_input_fileobjs[short_filename] = open(output_filename, 'rb')
                 # pad with leading zeros to three digits so these files sort when listed
-                if i == 2 and self.records_schema is None:
-                    # Records mover is not yet smart enough to
-                    # coalease multiple records schemas from different
-                    # chunks into a single schema, so the result of
-                    # initial_records_schema was based on only the
-                    # first chunk.
-                    #
-                    # https://github.com/bluelabsio/records-mover/issues/93
-                    logger.warning("Only checking first chunk for type inference")
                 i = i + 1
 
         try:
@@ -99,6 +99,55 @@ class DataframesRecordsSource(SupportsToFileobjsSource):
                 if not fileobj.closed:
                     fileobj.close()
 
+    def serialized_df_fileobjs(self,
+                               save_first_df: Callable[['DataFrame', str], None],
+                               save_df: Callable[['DataFrame', str], None]) -> Iterator[IO[bytes]]:
+        for i, df in enumerate(self.dfs, start=1):
+            with NamedTemporaryFile(prefix='mover_seralized_dataframe') as output_file:
+                df = purge_unnamed_unused_columns(df)
+                output_filename = output_file.name
+                logger.info(f"Writing chunk {i} to {output_filename}")
+                if i == 1:
+                    save_first_df(df, output_filename)
+                else:
+                    save_df(df, output_filename)
+                # The file is removed from disk as soon as this file
+                # object is closed by the reader.
+                fileobj = open(output_filename, 'rb')
+            if i == 2 and self.records_schema is None:
+                # The target needs the schema before later chunks are
+                # seen when they're pipelined.
+                #
+                # https://github.com/bluelabsio/records-mover/issues/93
+                logger.warning("Only checking first chunk for type inference")
+            yield fileobj
+
+    def pipeline_dfs(self,
+                     processing_instructions: ProcessingInstructions,
+                     records_schema: RecordsSchema,
+                     records_format: BaseRecordsFormat,
+                     save_first_df: Callable[['DataFrame', str], None],
+                     save_df: Callable[['DataFrame', str], None])\
+            -> Iterator[FileobjsSource]:
+        # Chunks are serialized by a background thread and presented
+        # as a single stream, so the target can start loading the
+        # first chunk while later ones are still being written.
+        max_chunks_in_flight = processing_instructions.max_chunks_in_flight
+        assert max_chunks_in_flight is not None
+        fileobjs = self.serialized_df_fileobjs(save_first_df, save_df)
+        single_fileobj = PipelinedConcatFiles(fileobjs,
+                                              max_files_in_flight=max_chunks_in_flight)
+        short_filename = records_format.generate_filename('data001')
+        target_names_to_input_fileobjs: Dict[str, IO[bytes]] = {
+            short_filename: single_fileobj  # type: ignore
+        }
+        try:
+            yield FileobjsSource(target_names_to_input_fileobjs=target_names_to_input_fileobjs,
+                                 records_schema=records_schema,
+                                 records_format=records_format)
+        finally:
+            single_fileobj.close()
+
     def schema_from_df(self, df: 'DataFrame',
                        processing_instructions: ProcessingInstructions) -> RecordsSchema:
         records_schema = RecordsSchema.from_dataframe(df,
@@ -136,17 +185,31 @@ class DataframesRecordsSource(SupportsToFileobjsSource):
             # Convince mypy that this type will stay the same
             delimited_records_format = records_format
 
-            def save_df(df: 'DataFrame', output_filename: str) -> None:
-                df = prep_df_for_csv_output(df,
-                                            include_index=self.include_index,
-                                            records_schema=records_schema,
-                                            records_format=delimited_records_format,
-                                            processing_instructions=processing_instructions)
-                df.to_csv(path_or_buf=output_filename,
-                          index=self.include_index,
-                          **options)
-                logger.info('CSV file written')
+            def df_saver(options: Dict[str, Any]) -> Callable[['DataFrame', str], None]:
+                def save_df(df: 'DataFrame', output_filename: str) -> None:
+                    df = prep_df_for_csv_output(df,
+                                                include_index=self.include_index,
+                                                records_schema=records_schema,
+                                                records_format=delimited_records_format,
+                                                processing_instructions=processing_instructions)
+                    df.to_csv(path_or_buf=output_filename,
+                              index=self.include_index,
+                              **options)
+                    logger.info('CSV file written')
+                return save_df
+
+            save_df = df_saver(options)
+            if processing_instructions.max_chunks_in_flight is not None:
+                # Chunks will be concatenated into a single stream,
+                # so only the first one gets a header row.
+                return self.pipeline_dfs(processing_instructions, records_schema, records_format,
+                                         save_first_df=save_df,
+                                         save_df=df_saver({**options, 'header': False}))
         elif isinstance(records_format, ParquetRecordsFormat):
+            if processing_instructions.max_chunks_in_flight is not None:
+                # Parquet files can't be concatenated into a single
+                # stream.
+                logger.info("Serializing all Parquet chunks before loading")
             # Pyarrow is the only engine we've tested with, and it
             # needed special options, so let's tell Pandas to use it
             pyarrow_args = {
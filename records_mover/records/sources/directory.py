@@ -35,7 +35,7 @@ class RecordsDirectoryRecordsSource(SupportsRecordsDirectory,
 
         all_urls = self.directory.manifest_entry_urls()
 
-        locs = [self.url_resolver.file_url(url) for url in all_urls]
+        locs = [self.url_resolver.cached_file_url(url) for url in all_urls]
 
         with ExitStack() as stack:
             target_names_to_input_fileobjs = {
@@ -47,5 +47,8 @@ class RecordsDirectoryRecordsSource(SupportsRecordsDirectory,
                                                 processing_instructions=processing_instructions,
                                                 records_format=self.records_format,
                                                 records_schema=records_schema,
-                                                initial_hints=None) as f:
+                                                initial_hints=None,
+                                                input_locs={
+                                                    loc.filename(): loc for loc in locs
+                                                }) as f:
                 yield f
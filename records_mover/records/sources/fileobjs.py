@@ -4,6 +4,7 @@ from .base import (SupportsMoveToRecordsDirectory,
                    SupportsToDataframesSource)
 from ..records_directory import RecordsDirectory
 from ...utils.concat_files import ConcatFiles
+from ...utils.peek_buffered_file import PeekBufferedFile
 import io
 from ..results import MoveResult
 from ..records_format import BaseRecordsFormat, DelimitedRecordsFormat
@@ -13,10 +14,11 @@ from ..processing_instructions import ProcessingInstructions
 from ...records.delimited import complain_on_unhandled_hints
 from ..delimited import python_encoding_from_hint
 from ..schema import RecordsSchema
+from ..inference_cache import InferenceCache, fingerprint_fileobj
 from records_mover.url.filesystem import FilesystemDirectoryUrl
-from records_mover.url.base import BaseDirectoryUrl
+from records_mover.url.base import BaseDirectoryUrl, BaseFileUrl
 import logging
-from typing import Mapping, IO, Optional, Iterator, List, Any, TYPE_CHECKING
+from typing import Mapping, IO, Optional, Iterator, List, Any, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from .dataframes import DataframesRecordsSource  # noqa
 
@@ -24,6 +26,65 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _open_inference_cache(target_names_to_input_fileobjs: Mapping[str, IO[bytes]],
+                          input_locs: Optional[Mapping[str, BaseFileUrl]],
+                          processing_instructions: ProcessingInstructions) ->\
+        Optional[Tuple[InferenceCache, List[str]]]:
+    if processing_instructions.inference_cache_dir is None:
+        return None
+    fingerprints = []
+    for target_name, fileobj in target_names_to_input_fileobjs.items():
+        loc = None if input_locs is None else input_locs.get(target_name)
+        fingerprint = fingerprint_fileobj(fileobj, loc)
+        if fingerprint is None:
+            logger.info(f"Not using inference cache, as {target_name} can't be identified")
+            return None
+        fingerprints.append(fingerprint)
+    inference_cache = InferenceCache(processing_instructions.inference_cache_dir,
+                                     ttl_seconds=processing_instructions.
+                                     inference_cache_ttl_seconds)
+    return inference_cache, fingerprints
+
+
+def _sniff_hints(fileobjs: List[IO[bytes]],
+                 initial_hints: PartialRecordsHints,
+                 processing_instructions: ProcessingInstructions,
+                 cache: Optional[Tuple[InferenceCache, List[str]]]) -> PartialRecordsHints:
+    if cache is not None:
+        inference_cache, fingerprints = cache
+        hints_key = inference_cache.hints_key(fingerprints, initial_hints)
+        cached_hints = inference_cache.get_hints(hints_key)
+        if cached_hints is not None:
+            return cached_hints
+    logger.info(f"Determining records format with initial_hints={initial_hints}")
+    hints = sniff_hints_from_fileobjs(fileobjs,
+                                      initial_hints=initial_hints,
+                                      max_workers=processing_instructions.max_inference_workers)
+    if cache is not None:
+        inference_cache.put_hints(hints_key, hints)
+    return hints
+
+
+def _infer_schema(fileobjs: List[IO[bytes]],
+                  records_format: BaseRecordsFormat,
+                  processing_instructions: ProcessingInstructions,
+                  cache: Optional[Tuple[InferenceCache, List[str]]]) -> RecordsSchema:
+    if cache is not None:
+        inference_cache, fingerprints = cache
+        schema_key = inference_cache.schema_key(fingerprints,
+                                                records_format,
+                                                processing_instructions)
+        cached_schema = inference_cache.get_schema(schema_key)
+        if cached_schema is not None:
+            return cached_schema
+    records_schema = RecordsSchema.from_fileobjs(fileobjs,
+                                                 records_format=records_format,
+                                                 processing_instructions=processing_instructions)
+    if cache is not None:
+        inference_cache.put_schema(schema_key, records_schema)
+    return records_schema
+
+
 class FileobjsSource(SupportsMoveToRecordsDirectory,
                      SupportsToDataframesSource):
     def __init__(self,
@@ -52,16 +113,37 @@ class FileobjsSource(SupportsMoveToRecordsDirectory,
                         processing_instructions: ProcessingInstructions,
                         records_format: Optional[BaseRecordsFormat],
                         records_schema: Optional[RecordsSchema],
-                        initial_hints: Optional[PartialRecordsHints]) ->\
+                        initial_hints: Optional[PartialRecordsHints],
+                        input_locs: Optional[Mapping[str, BaseFileUrl]] = None) ->\
             Iterator['FileobjsSource']:
+        """Yields a FileobjsSource, sniffing the records format and
+        inferring the records schema if they're not given.
+
+        :param input_locs: Where the fileobjs were read from, if
+           known, keyed by target name--used to identify them in
+           processing_instructions.inference_cache_dir.
+        """
+        cache = None
+        if records_format is None or records_schema is None:
+            # Pure streams can't be rewound after sniffing, so record
+            # their first few MB to replay to whoever reads them next.
+            target_names_to_input_fileobjs = {
+                target_name: (fileobj if fileobj.seekable()
+                              else PeekBufferedFile(fileobj))  # type: ignore
+                for target_name, fileobj in target_names_to_input_fileobjs.items()
+            }
+            cache = _open_inference_cache(target_names_to_input_fileobjs,
+                                          input_locs,
+                                          processing_instructions)
+        fileobjs = list(target_names_to_input_fileobjs.values())
         try:
             if records_format is None:
                 if initial_hints is None:
                     initial_hints = {}
-                logger.info(f"Determining records format with initial_hints={initial_hints}")
-                inferred_hints =\
-                    sniff_hints_from_fileobjs(list(target_names_to_input_fileobjs.values()),
-                                              initial_hints=initial_hints)
+                inferred_hints = _sniff_hints(fileobjs,
+                                              initial_hints,
+                                              processing_instructions,
+                                              cache)
                 # 'csv' isn't the most precise variant or fastest
                 # variant to read, but given it's the default for Excel
                 # and Google Sheets, it's the most common on import.  So,
@@ -70,10 +152,10 @@ class FileobjsSource(SupportsMoveToRecordsDirectory,
                 records_format = DelimitedRecordsFormat(variant='csv',
                                                         hints=inferred_hints)
             if records_schema is None:
-                records_schema =\
-                    RecordsSchema.from_fileobjs(list(target_names_to_input_fileobjs.values()),
-                                                records_format=records_format,
-                                                processing_instructions=processing_instructions)
+                records_schema = _infer_schema(fileobjs,
+                                               records_format,
+                                               processing_instructions,
+                                               cache)
 
             yield FileobjsSource(target_names_to_input_fileobjs=target_names_to_input_fileobjs,
                                  records_format=records_format,
@@ -100,9 +182,11 @@ class FileobjsSource(SupportsMoveToRecordsDirectory,
 
         if records_format != self.records_format:
             raise NotImplementedError(f"This directory can only accept {self.records_format}")
+        max_upload_workers = processing_instructions.max_upload_workers
         url_details = records_directory.save_fileobjs(self.target_names_to_input_fileobjs,
                                                       records_schema=self.records_schema,
-                                                      records_format=self.records_format)
+                                                      records_format=self.records_format,
+                                                      max_upload_workers=max_upload_workers)
         output_urls = {
             filename_from_url(url): url
             for url in url_details
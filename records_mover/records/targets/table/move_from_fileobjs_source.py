@@ -7,6 +7,7 @@ from records_mover.records.load_plan import RecordsLoadPlan
 from records_mover.records.sources.fileobjs import FileobjsSource
 from records_mover.records.targets.table.base import BaseTableMoveAlgorithm
 from records_mover.utils.concat_files import ConcatFiles
+from records_mover.utils.read_ahead import read_ahead_if_remote
 from typing import Optional, IO
 import logging
 
@@ -38,10 +39,14 @@ class DoMoveFromFileobjsSource(BaseTableMoveAlgorithm):
         # records_target.can_move_from_fileobjs_source() is true,
         # which is only true when .load_from_fileobj() is not None.
         assert loader_from_fileobj is not None
-        return loader_from_fileobj.load_from_fileobj(schema=self.tbl.schema_name,
-                                                     table=self.tbl.table_name,
-                                                     load_plan=self.plan,
-                                                     fileobj=self.fileobj)
+        # A fresh read-ahead wrapper per attempt, as
+        # reset_before_reload() rewinds the underlying stream
+        with read_ahead_if_remote(self.fileobj,
+                                  self.plan.processing_instructions.max_read_ahead_bytes) as f:
+            return loader_from_fileobj.load_from_fileobj(schema=self.tbl.schema_name,
+                                                         table=self.tbl.table_name,
+                                                         load_plan=self.plan,
+                                                         fileobj=f)
 
     def reset_before_reload(self) -> None:
         if not self.tbl.drop_and_recreate_on_load_error:
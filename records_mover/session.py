@@ -5,6 +5,7 @@ from .records.records import Records
 from .url.base import BaseFileUrl, BaseDirectoryUrl
 from typing import Union, Optional, IO
 from .url.resolver import UrlResolver
+from .url.local_cache import LocalFileCache, DEFAULT_MAX_CACHE_BYTES
 from records_mover.creds.creds_via_lastpass import CredsViaLastPass
 from records_mover.creds.creds_via_airflow import CredsViaAirflow
 from records_mover.creds.creds_via_env import CredsViaEnv
@@ -44,6 +45,40 @@ def _infer_session_type() -> str:
     return 'env'
 
 
+def _infer_local_cache_dir() -> Optional[str]:
+    if 'RECORDS_MOVER_CACHE_DIR' in os.environ:
+        return os.environ['RECORDS_MOVER_CACHE_DIR']
+
+    config_result = get_config('records_mover', 'bluelabs')
+    cfg = config_result.config
+    if 'session' in cfg:
+        session_cfg = cfg['session']
+        local_cache_dir: Optional[str] = session_cfg.get('local_cache_dir')
+        if local_cache_dir is not None:
+            logger.info(f"Using local_cache_dir={local_cache_dir} from config file")
+            return local_cache_dir
+
+    return None
+
+
+def _infer_gcs_parallel_composite_upload() -> bool:
+    if 'RECORDS_MOVER_GCS_PARALLEL_COMPOSITE_UPLOAD' in os.environ:
+        return os.environ['RECORDS_MOVER_GCS_PARALLEL_COMPOSITE_UPLOAD'].lower() in ('1', 'true')
+
+    config_result = get_config('records_mover', 'bluelabs')
+    cfg = config_result.config
+    if 'session' in cfg:
+        session_cfg = cfg['session']
+        gcs_parallel_composite_upload: Optional[bool] =\
+            session_cfg.get('gcs_parallel_composite_upload')
+        if gcs_parallel_composite_upload is not None:
+            logger.info("Using gcs_parallel_composite_upload="
+                        f"{gcs_parallel_composite_upload} from config file")
+            return gcs_parallel_composite_upload
+
+    return False
+
+
 def _infer_default_aws_creds_name(session_type: str) -> Optional[str]:
     if session_type == 'airflow':
         return 'aws_default'
@@ -148,7 +183,11 @@ class Session():
                  default_gcs_client: Union[PleaseInfer,
                                            'google.cloud.storage.Client',
                                            None] = PleaseInfer.token,
-                 scratch_gcs_url: Union[None, str, PleaseInfer] = PleaseInfer.token) -> None:
+                 scratch_gcs_url: Union[None, str, PleaseInfer] = PleaseInfer.token,
+                 local_cache_dir: Union[None, str, PleaseInfer] = PleaseInfer.token,
+                 local_cache_max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+                 gcs_parallel_composite_upload: Union[bool,
+                                                      PleaseInfer] = PleaseInfer.token) -> None:
         """This is an object which ties together configuration on how to do
         key things in order to move records.
 
@@ -200,6 +239,21 @@ class Session():
         :param scratch_gcs_url: A gs:// URL used as a base directory where temporary
            files/directories can be created.  This can be helpful for large imports into
            Google BigQuery.
+        :param local_cache_dir: A local directory in which to keep copies of files read from
+           remote URLs (e.g., s3:// or gs://) so that they don't need to be downloaded again
+           while unchanged.  If not specified, the RECORDS_MOVER_CACHE_DIR environment variable or
+           the 'local_cache_dir' setting in the 'session' section of the config file will be used;
+           if none of those are set, no cache is used.
+        :param local_cache_max_bytes: When local_cache_dir is in use, the least recently used
+           files are removed once the cache holds more than this many bytes.
+        :param gcs_parallel_composite_upload: If True, files larger than one chunk written to
+           gs:// URLs (including the scratch_gcs_url temporary directories used when loading
+           Google BigQuery) are uploaded as several parts at once and composed together at the
+           end.  This is faster for large files, but the resulting objects have no MD5 hash, and
+           some buffered parts are held in memory.  If not specified, the
+           RECORDS_MOVER_GCS_PARALLEL_COMPOSITE_UPLOAD environment variable or the
+           'gcs_parallel_composite_upload' setting in the 'session' section of the config file
+           will be used; if none of those are set, files are uploaded in a single stream.
         """
         if session_type is PleaseInfer.token:
             session_type = _infer_session_type()
@@ -224,11 +278,23 @@ class Session():
 
         self.creds = creds
 
+        if local_cache_dir is PleaseInfer.token:
+            local_cache_dir = _infer_local_cache_dir()
+        self.file_cache: Optional[LocalFileCache] = None
+        if local_cache_dir is not None:
+            self.file_cache = LocalFileCache(local_cache_dir, max_bytes=local_cache_max_bytes)
+
+        if gcs_parallel_composite_upload is PleaseInfer.token:
+            gcs_parallel_composite_upload = _infer_gcs_parallel_composite_upload()
+        self.gcs_parallel_composite_upload = gcs_parallel_composite_upload
+
     @property
     def url_resolver(self) -> UrlResolver:
         return UrlResolver(boto3_session_getter=self.creds.default_boto3_session,
                            gcp_credentials_getter=self.creds.default_gcs_creds,
-                           gcs_client_getter=self.creds.default_gcs_client)
+                           gcs_client_getter=self.creds.default_gcs_client,
+                           file_cache=self.file_cache,
+                           gcs_parallel_composite_upload=self.gcs_parallel_composite_upload)
 
     def get_default_db_engine(self) -> 'Engine':
         """Provide the database object corresponding to the default database
@@ -3,6 +3,7 @@ import secrets
 import logging
 import json
 from records_mover.mover_types import JsonValue
+from records_mover.utils.polling import DEFAULT_MAX_MS_BETWEEN_POLLS
 from typing import TypeVar, Iterator, IO, Any, Optional, List, Union
 
 V = TypeVar('V', bound='BaseDirectoryUrl')
@@ -26,6 +27,10 @@ class BaseDirectoryUrl:
     scheme: str
     url: str
 
+    # Whether newly written files may take a while to show up, so that
+    # it's worth waiting for them (see wait_to_exist())
+    eventually_consistent = False
+
     def __init__(self, url: str, **kwargs) -> None:
         raise NotImplementedError()
 
@@ -204,7 +209,9 @@ class BaseFileUrl:
 
     def wait_to_exist(self,
                       log_level: int = logging.INFO,
-                      ms_between_polls: int = 50) -> None:
+                      ms_between_polls: int = 50,
+                      max_ms_between_polls: int = DEFAULT_MAX_MS_BETWEEN_POLLS,
+                      timeout_seconds: Optional[float] = None) -> None:
         "Returns after the file exists--useful for eventually consistent stores (e.g., S3)"
         return
 
@@ -221,6 +228,11 @@ class BaseFileUrl:
     def size(self) -> int:
         raise NotImplementedError(f"Please implement for {type(self).__name__}")
 
+    def content_version(self) -> Optional[str]:
+        """Identifies the current contents of the file (e.g., an ETag), so that a
+        copy can be reused until it changes.  None if that can't be determined."""
+        return None
+
     def __str__(self) -> str:
         return self.url
 
@@ -0,0 +1,137 @@
+import errno
+import os
+import stat
+import sys
+from typing import IO, Any
+
+
+# Bytes handed to the kernel per copy_file_range()/sendfile() call
+KERNEL_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Bytes read per call when the kernel can't copy for us
+USERSPACE_COPY_CHUNK_SIZE = 1024 * 1024
+
+# From linux/fs.h--clone the source file's extents into the
+# destination, sharing the blocks copy-on-write (e.g., on btrfs or XFS)
+FICLONE = 0x40049409
+
+# Errors meaning "this fast path doesn't work here", rather than that
+# the copy itself has failed--e.g., files on different filesystems on
+# older kernels, or an output file opened for appending.
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EBADF,
+    errno.ENOTTY,
+}
+
+
+def is_regular_file(fileobj: Any) -> bool:
+    """Returns True if fileobj is backed by a regular file on disk,
+    which the kernel can copy from or to directly."""
+    try:
+        fd = fileobj.fileno()
+        return (fileobj.seekable() and
+                isinstance(fd, int) and
+                stat.S_ISREG(os.fstat(fd).st_mode))
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is both an OSError and a ValueError
+        return False
+
+
+def reflink(input_file: IO[bytes], output_file: IO[bytes]) -> bool:
+    """Make output_file a copy-on-write clone of all of input_file if
+    the filesystem supports it, returning whether that happened."""
+    if not sys.platform.startswith('linux'):
+        return False
+    import fcntl
+
+    output_file.flush()
+    try:
+        fcntl.ioctl(output_file.fileno(), FICLONE, input_file.fileno())
+    except OSError as e:
+        if e.errno in _UNSUPPORTED_ERRNOS:
+            return False
+        raise
+    size = os.fstat(input_file.fileno()).st_size
+    input_file.seek(size)
+    output_file.seek(size)
+    return True
+
+
+def _copy_file_range(in_fd: int, in_offset: int, out_fd: int, out_offset: int) -> int:
+    copied = 0
+    while True:
+        n = os.copy_file_range(in_fd, out_fd, KERNEL_COPY_CHUNK_SIZE,
+                               in_offset + copied, out_offset + copied)
+        if n == 0:
+            return copied
+        copied += n
+
+
+def _sendfile(in_fd: int, in_offset: int, out_fd: int, out_offset: int) -> int:
+    copied = 0
+    os.lseek(out_fd, out_offset, os.SEEK_SET)
+    while True:
+        n = os.sendfile(out_fd, in_fd, in_offset + copied, KERNEL_COPY_CHUNK_SIZE)
+        if n == 0:
+            return copied
+        copied += n
+
+
+def _userspace_copy(in_fd: int, in_offset: int, out_fd: int, out_offset: int) -> int:
+    copied = 0
+    os.lseek(out_fd, out_offset, os.SEEK_SET)
+    while True:
+        data = os.pread(in_fd, USERSPACE_COPY_CHUNK_SIZE, in_offset + copied)
+        if not data:
+            return copied
+        view = memoryview(data)
+        while view:
+            written = os.write(out_fd, view)
+            view = view[written:]
+        copied += len(data)
+
+
+def copy_file_contents(input_file: IO[bytes], output_file: IO[bytes]) -> int:
+    """Copy the rest of input_file (from its current position) into
+    output_file (at its current position) without passing the data
+    through Python, using copy_file_range() or sendfile() where
+    available.  Both must be regular files (see is_regular_file()).
+
+    Leaves both files positioned just after the copied data, and
+    returns the number of bytes copied.
+    """
+    output_file.flush()
+    in_fd = input_file.fileno()
+    out_fd = output_file.fileno()
+    in_offset = input_file.tell()
+    out_offset = output_file.tell()
+
+    kernel_methods = []
+    if hasattr(os, 'copy_file_range'):  # Linux, Python 3.8+
+        kernel_methods.append(_copy_file_range)
+    if hasattr(os, 'sendfile'):
+        kernel_methods.append(_sendfile)
+
+    copied = None
+    for method in kernel_methods:
+        try:
+            copied = method(in_fd, in_offset, out_fd, out_offset)
+            break
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            # Every method reads and writes at explicit offsets, so
+            # the next one can safely start over from the beginning.
+    if copied is None:
+        copied = _userspace_copy(in_fd, in_offset, out_fd, out_offset)
+
+    # Bring Python's idea of the file positions in line with the
+    # kernel's.
+    input_file.seek(in_offset + copied)
+    output_file.seek(out_offset + copied)
+    return copied
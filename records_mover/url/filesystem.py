@@ -4,6 +4,7 @@ from urllib.parse import urlparse, unquote
 import tempfile
 from pathlib import Path
 from .base import BaseDirectoryUrl, BaseFileUrl
+from .fast_copy import is_regular_file, copy_file_contents, reflink
 from typing import IO, Iterator, List, Union, Optional
 
 
@@ -30,6 +31,41 @@ class FilesystemFileUrl(BaseFilesystemUrl, BaseFileUrl):
     def open(self, mode: str = "rb") -> IO[bytes]:
         return open(self.local_file_path, mode)
 
+    # Local-to-local copies are handed to the kernel
+    # (copy_file_range()/sendfile()) rather than being read into
+    # Python and written back out, and whole-file copies are
+    # reflinked where the filesystem supports it.
+
+    def upload_fileobj(self, fileobj: IO[bytes], mode: str = 'wb') -> int:
+        if not is_regular_file(fileobj):
+            return super().upload_fileobj(fileobj, mode=mode)
+        with self.open(mode=mode) as output_fileobj:
+            return copy_file_contents(fileobj, output_fileobj)
+
+    def download_fileobj(self, output_fileobj: IO[bytes]) -> None:
+        if not is_regular_file(output_fileobj):
+            return super().download_fileobj(output_fileobj)
+        with self.open() as fileobj:
+            copy_file_contents(fileobj, output_fileobj)
+
+    def concatenate_from(self, other_locs: List['BaseFileUrl']) -> Optional[int]:
+        if not all(isinstance(loc, FilesystemFileUrl) for loc in other_locs):
+            return super().concatenate_from(other_locs)
+        length = 0
+        with self.open(mode='wb') as output_fileobj:
+            for input_loc in other_locs:
+                with input_loc.open(mode='rb') as input_fileobj:
+                    length += copy_file_contents(input_fileobj, output_fileobj)
+        return length
+
+    def copy_to(self, other_loc: 'BaseFileUrl') -> 'BaseFileUrl':
+        if not isinstance(other_loc, FilesystemFileUrl):
+            return super().copy_to(other_loc)
+        with self.open() as input_fileobj, other_loc.open(mode='wb') as output_fileobj:
+            if not reflink(input_fileobj, output_fileobj):
+                copy_file_contents(input_fileobj, output_fileobj)
+        return other_loc
+
     def rename_to(self, new: 'BaseFileUrl') -> 'FilesystemFileUrl':
         if not isinstance(new, FilesystemFileUrl):
             raise TypeError(f'Can only rename to same type, not {new}')
@@ -47,6 +83,10 @@ class FilesystemFileUrl(BaseFilesystemUrl, BaseFileUrl):
         statinfo = os.stat(self.local_file_path)
         return statinfo.st_size
 
+    def content_version(self) -> Optional[str]:
+        statinfo = os.stat(self.local_file_path)
+        return f"{statinfo.st_mtime_ns}-{statinfo.st_size}"
+
     def containing_directory(self) -> 'FilesystemDirectoryUrl':
         parent_dir = os.path.dirname(self.local_file_path)
         new_url = Path(parent_dir).as_uri()
@@ -90,6 +130,20 @@ class FilesystemDirectoryUrl(BaseFilesystemUrl, BaseDirectoryUrl):
             if f is not None
         ]
 
+    def copy_to(self, other_loc: BaseDirectoryUrl) -> BaseDirectoryUrl:
+        if not isinstance(other_loc, BaseFilesystemUrl) or not other_loc.is_directory():
+            return super().copy_to(other_loc)
+        for dirpath, dirnames, filenames in os.walk(self.local_file_path):
+            relative_path = os.path.relpath(dirpath, self.local_file_path)
+            target_path = os.path.normpath(os.path.join(other_loc.local_file_path,
+                                                        relative_path))
+            os.makedirs(target_path, exist_ok=True)
+            for filename in filenames:
+                source_loc = FilesystemFileUrl(Path(dirpath, filename).as_uri())
+                target_loc = FilesystemFileUrl(Path(target_path, filename).as_uri())
+                source_loc.copy_to(target_loc)
+        return other_loc
+
     @contextmanager
     def temporary_directory(self: 'FilesystemDirectoryUrl') -> Iterator['FilesystemDirectoryUrl']:
         with tempfile.TemporaryDirectory(dir=self.local_file_path,
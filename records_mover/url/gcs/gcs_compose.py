@@ -0,0 +1,210 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+import io
+import secrets
+import logging
+from typing import Any, Dict, IO, List, cast
+from google.cloud.storage.bucket import Bucket
+import google.api_core.exceptions
+
+
+logger = logging.getLogger(__name__)
+
+
+# GCS won't compose more than this many objects in one request
+# https://cloud.google.com/storage/docs/composite-objects
+MAX_COMPOSE_SOURCES = 32
+
+# Number of compose requests made at once when building a tree of
+# intermediate objects
+DEFAULT_COMPOSE_WORKERS = 8
+
+# Streams are uploaded in parts of this size...
+DEFAULT_UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+# ...this many at a time.  Together these bound the memory used: one
+# buffer of chunk_size per worker, plus one being filled.
+DEFAULT_UPLOAD_WORKERS = 4
+
+
+def _compose(bucket_obj: Bucket, source_blob_names: List[str], target_blob_name: str) -> None:
+    sources = [bucket_obj.blob(name) for name in source_blob_names]
+    bucket_obj.blob(target_blob_name).compose(sources)
+
+
+def _delete_quietly(bucket_obj: Bucket, blob_name: str) -> None:
+    try:
+        bucket_obj.blob(blob_name).delete()
+    except google.api_core.exceptions.NotFound:
+        pass
+
+
+def gcs_compose(bucket_obj: Bucket,
+                source_blob_names: List[str],
+                target_blob_name: str,
+                max_workers: int = DEFAULT_COMPOSE_WORKERS) -> None:
+    """Concatenate objects within a bucket into target_blob_name
+    without the data leaving GCS.
+
+    More than MAX_COMPOSE_SOURCES sources are first composed in
+    batches into intermediate objects (concurrently), and those into
+    further intermediates, and so on until few enough remain to
+    compose into the target.  Intermediates are deleted afterwards.
+    """
+    if len(source_blob_names) == 0:
+        raise ValueError('Must provide at least one object to compose')
+    sources = list(source_blob_names)
+    intermediate_blob_names: List[str] = []
+    # Keep intermediates from concurrent jobs writing the same target apart
+    intermediate_prefix = f"{target_blob_name}.compose-{secrets.token_hex(8)}"
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            level = 0
+            while len(sources) > MAX_COMPOSE_SOURCES:
+                batches = [sources[i:i + MAX_COMPOSE_SOURCES]
+                           for i in range(0, len(sources), MAX_COMPOSE_SOURCES)]
+                batch_targets = [f"{intermediate_prefix}-{level}-{i}"
+                                 for i in range(len(batches))]
+                intermediate_blob_names.extend(batch_targets)
+                logger.info(f"Composing {len(sources)} objects into {len(batches)} "
+                            f"intermediate objects for gs://{bucket_obj.name}/{target_blob_name}")
+                # list() to raise any exceptions
+                list(executor.map(lambda batch, target: _compose(bucket_obj, batch, target),
+                                  batches, batch_targets))
+                sources = batch_targets
+                level += 1
+            _compose(bucket_obj, sources, target_blob_name)
+        finally:
+            list(executor.map(lambda name: _delete_quietly(bucket_obj, name),
+                              intermediate_blob_names))
+
+
+def _read_into(fileobj: IO[bytes], buf: bytearray) -> int:
+    "Fill buf from fileobj, returning the number of bytes read"
+    view = memoryview(buf)
+    length = 0
+    readinto = getattr(fileobj, 'readinto', None)
+    # Streams may return fewer bytes than asked for before the end
+    while length < len(buf):
+        if readinto is not None:
+            n = readinto(view[length:])
+        else:
+            data = fileobj.read(len(buf) - length)
+            n = len(data)
+            view[length:length + n] = data
+        if not n:
+            break
+        length += n
+    return length
+
+
+class _BufferReader(io.RawIOBase):
+    "Seekable stream over a memoryview, so it can be uploaded without copying it first"
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def readinto(self, b: Any) -> int:
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+
+def _upload_part(bucket_obj: Bucket, blob_name: str, view: memoryview) -> None:
+    bucket_obj.blob(blob_name).upload_from_file(cast(IO[bytes], _BufferReader(view)),
+                                                size=len(view))
+
+
+def gcs_parallel_composite_upload(bucket_obj: Bucket,
+                                  fileobj: IO[bytes],
+                                  target_blob_name: str,
+                                  chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+                                  max_workers: int = DEFAULT_UPLOAD_WORKERS) -> int:
+    """Upload a stream into target_blob_name, returning the number of
+    bytes uploaded.
+
+    Streams bigger than chunk_size are uploaded as concurrent parts
+    which are then composed into the target (see gcs_compose()), so
+    the upload isn't limited to a single connection's throughput.
+    Parts are read into at most max_workers + 1 buffers of chunk_size,
+    which are reused as their uploads finish.  Note that GCS records
+    only a CRC32C checksum, not an MD5 hash, for composite objects.
+    """
+    first_chunk = bytearray(chunk_size)
+    first_length = _read_into(fileobj, first_chunk)
+    second_chunk = bytearray(chunk_size) if first_length == chunk_size else None
+    second_length = _read_into(fileobj, second_chunk) if second_chunk is not None else 0
+    if second_length == 0:
+        _upload_part(bucket_obj, target_blob_name, memoryview(first_chunk)[:first_length])
+        return first_length
+    assert second_chunk is not None  # keep mypy happy
+
+    part_prefix = f"{target_blob_name}.part-{secrets.token_hex(8)}"
+    part_blob_names: List[str] = []
+    length = 0
+    # Buffers being uploaded, to be reused once they're done
+    in_flight: Dict['Future[None]', bytearray] = {}
+    free_buffers: List[bytearray] = []
+    buffers_allocated = 2
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(chunk: bytearray, chunk_length: int) -> None:
+            part_blob_name = f"{part_prefix}-{len(part_blob_names):05}"
+            part_blob_names.append(part_blob_name)
+            future = executor.submit(_upload_part, bucket_obj, part_blob_name,
+                                     memoryview(chunk)[:chunk_length])
+            in_flight[future] = chunk
+
+        def reclaim_buffers() -> None:
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                free_buffers.append(in_flight.pop(future))
+                # Raise any exception from uploading
+                future.result()
+
+        try:
+            submit(first_chunk, first_length)
+            submit(second_chunk, second_length)
+            length = first_length + second_length
+            while True:
+                if not free_buffers and buffers_allocated <= max_workers:
+                    free_buffers.append(bytearray(chunk_size))
+                    buffers_allocated += 1
+                while not free_buffers or len(in_flight) >= max_workers:
+                    reclaim_buffers()
+                chunk = free_buffers.pop()
+                chunk_length = _read_into(fileobj, chunk)
+                if chunk_length == 0:
+                    break
+                submit(chunk, chunk_length)
+                length += chunk_length
+            for future in list(in_flight):
+                future.result()
+            logger.info(f"Uploaded {len(part_blob_names)} parts; composing "
+                        f"gs://{bucket_obj.name}/{target_blob_name}")
+            gcs_compose(bucket_obj, part_blob_names, target_blob_name)
+        finally:
+            # Let any uploads still running finish so that they don't
+            # recreate parts after they've been cleaned up
+            wait(list(in_flight))
+            list(executor.map(lambda name: _delete_quietly(bucket_obj, name),
+                              part_blob_names))
+    return length
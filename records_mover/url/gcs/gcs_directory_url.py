@@ -1,11 +1,17 @@
 from urllib.parse import urlparse, unquote
 from records_mover.url import BaseDirectoryUrl, BaseFileUrl
+from concurrent.futures import ThreadPoolExecutor
 import google.auth.credentials
 import google.cloud.storage
-import googleapiclient.discovery
-from typing import List, TYPE_CHECKING
+import google.api_core.exceptions
+from typing import List, Tuple, Union, TYPE_CHECKING
 if TYPE_CHECKING:
     from .gcs_file_url import GCSFileUrl
+    from google.cloud.storage.blob import Blob
+
+
+# Number of objects deleted at once by purge_directory()
+DEFAULT_PURGE_WORKERS = 16
 
 
 class GCSDirectoryUrl(BaseDirectoryUrl):
@@ -13,6 +19,7 @@ class GCSDirectoryUrl(BaseDirectoryUrl):
                  url: str,
                  gcs_client: google.cloud.storage.Client,
                  gcp_credentials: google.auth.credentials.Credentials,
+                 gcs_parallel_composite_upload: bool = False,
                  **kwargs) -> None:
         self.url = url
         parsed = urlparse(url)
@@ -22,28 +29,45 @@ class GCSDirectoryUrl(BaseDirectoryUrl):
         self.client = gcs_client
         self.credentials = gcp_credentials
         self.bucket_obj = self.client.bucket(self.bucket)
+        # Passed on to files and directories within this one
+        self.parallel_composite_upload = gcs_parallel_composite_upload
 
     def _directory(self, url: str) -> 'GCSDirectoryUrl':
-        return GCSDirectoryUrl(url, gcs_client=self.client, gcp_credentials=self.credentials)
+        return GCSDirectoryUrl(url, gcs_client=self.client, gcp_credentials=self.credentials,
+                               gcs_parallel_composite_upload=self.parallel_composite_upload)
 
     def _file(self, url: str) -> 'GCSFileUrl':
         from .gcs_file_url import GCSFileUrl
-        return GCSFileUrl(url, gcs_client=self.client, gcp_credentials=self.credentials)
+        return GCSFileUrl(url, gcs_client=self.client, gcp_credentials=self.credentials,
+                          gcs_parallel_composite_upload=self.parallel_composite_upload)
 
     def directory_in_this_directory(self, directory_name: str) -> 'GCSDirectoryUrl':
         return self._directory(f"{self.url}{directory_name}/")
 
     def purge_directory(self) -> None:
-        for dir_loc in self.directories_in_directory():
-            dir_loc.purge_directory()
-        for file_loc in self.files_in_directory():
-            file_loc.delete()
         # Like S3, directories are just a convenient fiction in GCS;
         # once all contents are gone, they disappear from the file
         # listing, since they never really existed, so we don't need
         # a final delete on the directory.
+        #
+        # Listing without a delimiter returns everything under the
+        # prefix, 'sub directories' and all, in one paginated pass.
+        blobs = self.client.list_blobs(bucket_or_name=self.bucket, prefix=self.blob)
 
-    def files_in_directory(self) -> List[BaseFileUrl]:
+        def delete(blob: 'Blob') -> None:
+            try:
+                blob.delete()
+            except google.api_core.exceptions.NotFound:
+                # Already gone--e.g., purged concurrently
+                pass
+
+        with ThreadPoolExecutor(max_workers=DEFAULT_PURGE_WORKERS) as executor:
+            # list() to raise any exceptions
+            list(executor.map(delete, blobs))
+
+    def _list_directory(self) -> Tuple[List[str], List[str]]:
+        """Returns the names of the blobs and 'sub directory' prefixes
+        directly in this directory, from a single listing."""
         prefix = self.blob
         blobs = self.client.list_blobs(bucket_or_name=self.bucket,
                                        prefix=prefix, delimiter='/')
@@ -53,27 +77,34 @@ class GCSDirectoryUrl(BaseDirectoryUrl):
             # I've seen this happen with gs://bluelabs-test-recordsmover/bar/
             if blob.name != prefix
         ]
-        file_urls = [
-            f"gs://{self.bucket}/{blob_name}"
-            for blob_name in blob_names
+        # Only populated once the listing above has been iterated
+        folder_names = [
+            folder_name
+            for folder_name in sorted(blobs.prefixes)
+            # I haven't seen this happen - this is for safety
+            if folder_name != prefix
         ]
-        return [self._file(file_url) for file_url in file_urls]
+        return blob_names, folder_names
+
+    def _files(self, blob_names: List[str]) -> List[BaseFileUrl]:
+        return [self._file(f"gs://{self.bucket}/{blob_name}") for blob_name in blob_names]
+
+    def _directories(self, folder_names: List[str]) -> List[BaseDirectoryUrl]:
+        return [self._directory(f"gs://{self.bucket}/{folder_name}")
+                for folder_name in folder_names]
+
+    def files_in_directory(self) -> List[BaseFileUrl]:
+        blob_names, _ = self._list_directory()
+        return self._files(blob_names)
 
     def directories_in_directory(self) -> List[BaseDirectoryUrl]:
-        # https://stackoverflow.com/a/57099354/9795956
+        _, folder_names = self._list_directory()
+        return self._directories(folder_names)
 
-        service = googleapiclient.discovery.build('storage', 'v1',
-                                                  credentials=self.credentials)
-        prefix = self.blob
-        folders_req = service.objects().list(bucket=self.bucket,
-                                             prefix=prefix,
-                                             delimiter='/')
-        folders_resp = folders_req.execute()
-        folder_names = folders_resp.get('prefixes', [])
-        directory_urls = [
-            f"gs://{self.bucket}/{folder_name}"
-            for folder_name in folder_names
-            # I haven't seen this happen - this is for safety
-            if folder_name != prefix
-        ]
-        return [self._directory(directory_url) for directory_url in directory_urls]
+    def files_and_directories_in_directory(self) -> List[Union[BaseFileUrl, BaseDirectoryUrl]]:
+        # One listing provides both, so there's no need to make two
+        blob_names, folder_names = self._list_directory()
+        out: List[Union[BaseFileUrl, BaseDirectoryUrl]] = []
+        out.extend(self._files(blob_names))
+        out.extend(self._directories(folder_names))
+        return out
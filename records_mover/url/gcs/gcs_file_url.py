@@ -1,18 +1,29 @@
 from urllib.parse import urlparse, unquote
 from records_mover.url.gcs.gcs_directory_url import GCSDirectoryUrl
-from typing import IO
+from records_mover.url.gcs.gcs_compose import (
+    gcs_compose, gcs_parallel_composite_upload, DEFAULT_UPLOAD_CHUNK_SIZE, DEFAULT_UPLOAD_WORKERS
+)
+from typing import IO, List, Optional
 from records_mover.url import BaseFileUrl
 from smart_open.gcs import open as gs_open
 import google.cloud.storage
 from google.cloud.storage.blob import Blob
 import google.api_core.exceptions
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class GCSFileUrl(BaseFileUrl):
+    upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE
+    max_upload_workers: int = DEFAULT_UPLOAD_WORKERS
+
     def __init__(self,
                  url: str,
                  gcs_client: google.cloud.storage.Client,
                  gcp_credentials: google.auth.credentials.Credentials,
+                 gcs_parallel_composite_upload: bool = False,
                  **kwargs) -> None:
         self.url = url
         parsed = urlparse(url)
@@ -21,6 +32,11 @@ class GCSFileUrl(BaseFileUrl):
         self.client = gcs_client
         self.credentials = gcp_credentials
         self.bucket_obj = self.client.bucket(self.bucket)
+        # If set, uploads larger than one chunk are made as
+        # max_upload_workers concurrent part uploads of
+        # upload_chunk_size, composed together at the end.  Off by
+        # default, as composite objects have no MD5 hash.
+        self.parallel_composite_upload = gcs_parallel_composite_upload
 
     def open(self, mode: str = "rb") -> IO[bytes]:
         try:
@@ -35,8 +51,19 @@ class GCSFileUrl(BaseFileUrl):
             # smart-open version: 2.0
             raise FileNotFoundError(f"{self} not found")
 
+    def upload_fileobj(self, fileobj: IO[bytes], mode: str = 'wb') -> int:
+        if mode != 'wb' or not self.parallel_composite_upload:
+            # use the single-threaded method that handles all modes
+            return super().upload_fileobj(fileobj, mode=mode)
+        return gcs_parallel_composite_upload(self.bucket_obj,
+                                             fileobj,
+                                             self.blob,
+                                             chunk_size=self.upload_chunk_size,
+                                             max_workers=self.max_upload_workers)
+
     def _directory(self, url: str) -> GCSDirectoryUrl:
-        return GCSDirectoryUrl(url, gcs_client=self.client, gcp_credentials=self.credentials)
+        return GCSDirectoryUrl(url, gcs_client=self.client, gcp_credentials=self.credentials,
+                               gcs_parallel_composite_upload=self.parallel_composite_upload)
 
     def _blob_obj(self) -> 'Blob':
         return self.bucket_obj.blob(self.blob)
@@ -44,6 +71,13 @@ class GCSFileUrl(BaseFileUrl):
     def size(self) -> int:
         return self._blob_obj().size
 
+    def content_version(self) -> Optional[str]:
+        # Object generations change whenever the data is overwritten
+        blob = self.bucket_obj.get_blob(self.blob)
+        if blob is None:
+            raise FileNotFoundError(f"{self.url} not found")
+        return str(blob.generation)
+
     def rename_to(self, new: 'BaseFileUrl') -> 'BaseFileUrl':
         if not isinstance(new, GCSFileUrl):
             raise NotImplementedError('Cannot rename a GCS file to a non-GCS file')
@@ -60,3 +94,17 @@ class GCSFileUrl(BaseFileUrl):
 
     def delete(self) -> None:
         self._blob_obj().delete()
+
+    def concatenate_from(self, other_locs: List['BaseFileUrl']) -> Optional[int]:
+        if len(other_locs) == 0:
+            return super().concatenate_from(other_locs)
+        if not all([isinstance(loc, GCSFileUrl) and loc.bucket == self.bucket
+                    for loc in other_locs]):
+            logger.warning("Concatenating data locally - this may be slow for large data sets")
+            return super().concatenate_from(other_locs)
+        source_blob_names = []
+        for loc in other_locs:
+            assert isinstance(loc, GCSFileUrl)  # keep mypy happy
+            source_blob_names.append(loc.blob)
+        gcs_compose(self.bucket_obj, source_blob_names, self.blob)
+        return None
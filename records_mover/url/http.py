@@ -1,7 +1,37 @@
 from .urllib import UrllibFileMixin
 from .base import BaseFileUrl
+from .http_ranged_reader import (HttpRangedReader, probe_range_support, head, strong_etag,
+                                 DEFAULT_MAX_ATTEMPTS)
+from .ranged_reader import DEFAULT_PART_SIZE, DEFAULT_MAX_PARTS_IN_FLIGHT
+import io
+from typing import IO, Optional
 
 
 class HttpFileUrl(UrllibFileMixin, BaseFileUrl):
+    # Files larger than this are downloaded as parallel byte ranges
+    # of this size when the server supports it--see HttpRangedReader
+    download_part_size = DEFAULT_PART_SIZE
+    max_download_parts_in_flight = DEFAULT_MAX_PARTS_IN_FLIGHT
+    max_download_attempts = DEFAULT_MAX_ATTEMPTS
+
     def __init__(self, url: str, **kwargs) -> None:
         self.url = url
+
+    def open(self, mode: str = "rb") -> IO[bytes]:
+        if mode == 'rb':
+            range_support = probe_range_support(self.url)
+            if range_support is not None and range_support.size > self.download_part_size:
+                reader = HttpRangedReader(self.url,
+                                          size=range_support.size,
+                                          etag=range_support.etag,
+                                          part_size=self.download_part_size,
+                                          max_parts_in_flight=self.max_download_parts_in_flight,
+                                          max_attempts=self.max_download_attempts)
+                return io.BufferedReader(reader)
+        return super().open(mode)
+
+    def content_version(self) -> Optional[str]:
+        headers = head(self.url)
+        if headers is None:
+            return None
+        return strong_etag(headers)
@@ -0,0 +1,148 @@
+from .ranged_reader import RangedReader, DEFAULT_PART_SIZE, DEFAULT_MAX_PARTS_IN_FLIGHT
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+from email.message import Message
+import http.client
+import logging
+import random
+import socket
+import time
+from typing import Dict, NamedTuple, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# Attempts at downloading each part before giving up
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Cap on the randomized exponential backoff between attempts
+MAX_BACKOFF_SECONDS = 30.0
+
+# Seconds to wait on a stalled connection before retrying
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+# Bytes read from the response per call while downloading a part
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class HttpRangeSupport(NamedTuple):
+    size: int
+    # Only strong validators may be used with If-Range
+    etag: Optional[str]
+
+
+def head(url: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Optional[Message]:
+    """Return the response headers from a HEAD request of the URL, or
+    None if the request fails."""
+    try:
+        with urlopen(Request(url, method='HEAD'), timeout=timeout) as response:
+            return response.headers
+    except (URLError, http.client.HTTPException, OSError) as e:
+        # Some servers don't do HEAD requests; a plain GET will report
+        # any real problem with the URL.
+        logger.debug(f"HEAD request of {url} failed: {e}")
+        return None
+
+
+def strong_etag(headers: Message) -> Optional[str]:
+    etag = headers.get('ETag')
+    if etag is not None and etag.startswith('W/'):
+        return None
+    return etag
+
+
+def probe_range_support(url: str,
+                        timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Optional[HttpRangeSupport]:
+    """Make a HEAD request to see whether the server will serve byte
+    ranges of this URL, returning its size and ETag if so."""
+    headers = head(url, timeout=timeout)
+    if headers is None:
+        return None
+    if headers.get('Accept-Ranges', '').lower() != 'bytes':
+        return None
+    if headers.get('Content-Encoding', 'identity').lower() != 'identity':
+        # Ranges would be of the encoded bytes
+        return None
+    content_length = headers.get('Content-Length')
+    if content_length is None:
+        return None
+    return HttpRangeSupport(size=int(content_length), etag=strong_etag(headers))
+
+
+def _is_retryable(e: Exception) -> bool:
+    if isinstance(e, HTTPError):
+        # Server errors may be transient; client errors won't be
+        return e.code >= 500
+    return isinstance(e, (URLError, ConnectionError, TimeoutError, socket.timeout,
+                          http.client.HTTPException))
+
+
+class HttpRangedReader(RangedReader):
+    """RangedReader over an HTTP(S) URL whose server supports byte
+    ranges (see probe_range_support()).
+
+    A part whose download fails part way through is resumed from the
+    last byte received, with randomized exponential backoff, rather
+    than starting over.
+    """
+
+    def __init__(self,
+                 url: str,
+                 size: int,
+                 etag: Optional[str] = None,
+                 part_size: int = DEFAULT_PART_SIZE,
+                 max_parts_in_flight: int = DEFAULT_MAX_PARTS_IN_FLIGHT,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 timeout: float = DEFAULT_TIMEOUT_SECONDS) -> None:
+        self._url = url
+        self._etag = etag
+        self._max_attempts = max_attempts
+        self._timeout = timeout
+        super().__init__(size=size,
+                         part_size=part_size,
+                         max_parts_in_flight=max_parts_in_flight)
+
+    def _read_range_into(self, data: bytearray, start: int, end: int) -> None:
+        headers: Dict[str, str] = {'Range': f'bytes={start}-{end}'}
+        if self._etag is not None:
+            # If the object has changed, the server will send the
+            # whole new thing with a 200 instead of a 206
+            headers['If-Range'] = self._etag
+        with urlopen(Request(self._url, headers=headers), timeout=self._timeout) as response:
+            if response.status != 206:
+                raise IOError(f"{self._url} did not return the byte range requested "
+                              f"(HTTP status {response.status})--was it modified while "
+                              "being read?")
+            while True:
+                chunk = response.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    return
+                data += chunk
+
+    def _fetch_part(self, start: int, end: int) -> bytes:
+        expected_length = end - start + 1
+        data = bytearray()
+        attempt = 1
+        while True:
+            try:
+                # Pick up from wherever the last attempt got to
+                self._read_range_into(data, start + len(data), end)
+                if len(data) >= expected_length:
+                    break
+                error: Exception = IOError(f"Connection closed after {len(data)} of "
+                                           f"{expected_length} bytes")
+            except Exception as e:
+                if not _is_retryable(e):
+                    raise
+                error = e
+            if attempt >= self._max_attempts:
+                raise error
+            backoff = random.uniform(0, min(MAX_BACKOFF_SECONDS, 0.5 * 2 ** attempt))
+            logger.warning(f"Error downloading {self._url} at byte {start + len(data)} "
+                           f"(attempt {attempt} of {self._max_attempts}): {error}; "
+                           f"resuming in {backoff:.1f}s")
+            time.sleep(backoff)
+            attempt += 1
+        self._check_part_length(self._url, start, end, bytes(data))
+        return bytes(data)
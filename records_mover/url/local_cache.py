@@ -0,0 +1,124 @@
+from .base import BaseFileUrl
+from .filesystem import FilesystemFileUrl
+from pathlib import Path
+from urllib.parse import urlparse, unquote
+from typing import List, Optional, Tuple
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default ceiling on the total size of files kept in the cache
+DEFAULT_MAX_CACHE_BYTES = 10 * 1024 * 1024 * 1024
+
+# Prefix of entries still being downloaded; these aren't looked up
+# or evicted
+PARTIAL_PREFIX = '.partial-'
+
+
+def _directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(dirpath, filename))
+               for dirpath, _, filenames in os.walk(path)
+               for filename in filenames)
+
+
+class LocalFileCache:
+    """Keeps local copies of remote files, so that e.g. re-running a
+    job or making several passes over the same file doesn't download
+    it again.
+
+    Entries are keyed by URL plus the file's content_version() (e.g.,
+    an S3 ETag or GCS generation), so a file that changes remotely is
+    downloaded afresh.  Files whose version can't be determined
+    aren't cached.  Once the cache holds more than max_bytes, the
+    least recently used entries are removed.
+
+    Copies are regular local files, so they can be seeked and memory
+    mapped.  Several processes may safely share a cache directory.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 max_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _entry_dir(self, url: str, version: str) -> str:
+        key = hashlib.sha256(f"{url}\n{version}".encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key)
+
+    def _local_filename(self, loc: BaseFileUrl) -> str:
+        # Keep the original filename, as it's used e.g. to sniff
+        # compression
+        filename = os.path.basename(unquote(urlparse(loc.url).path))
+        return filename or 'contents'
+
+    def local_copy(self, loc: BaseFileUrl) -> Optional[FilesystemFileUrl]:
+        """Return a local copy of loc, downloading it if it isn't already
+        cached, or None if loc can't be cached."""
+        version = loc.content_version()
+        if version is None:
+            logger.debug(f"Not caching {loc.url}: unable to determine content version")
+            return None
+        entry_dir = self._entry_dir(loc.url, version)
+        local_path = os.path.join(entry_dir, self._local_filename(loc))
+        if os.path.isfile(local_path):
+            logger.info(f"Using cached copy of {loc.url}")
+            # Entries' modification times track when they were last
+            # used, for eviction
+            os.utime(entry_dir)
+            return FilesystemFileUrl(Path(local_path).as_uri())
+
+        logger.info(f"Downloading {loc.url} to local cache in {self.directory}")
+        partial_dir = tempfile.mkdtemp(prefix=PARTIAL_PREFIX, dir=self.directory)
+        try:
+            partial_path = os.path.join(partial_dir, self._local_filename(loc))
+            with open(partial_path, 'wb') as f:
+                loc.download_fileobj(f)
+            try:
+                os.rename(partial_dir, entry_dir)
+            except OSError:
+                if not os.path.isfile(local_path):
+                    raise
+                # Someone else cached the same version first
+        finally:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+        self.evict(keep=entry_dir)
+        return FilesystemFileUrl(Path(local_path).as_uri())
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith(PARTIAL_PREFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                entries.append((os.stat(path).st_mtime, _directory_size(path), path))
+            except FileNotFoundError:
+                # Evicted by someone else meanwhile
+                pass
+        return entries
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Remove least recently used entries until the cache fits in
+        max_bytes, other than the one named by 'keep'."""
+        with self._lock:
+            entries = sorted(self._entries())
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total_bytes <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                logger.debug(f"Evicting {path} from local cache")
+                # Anyone with the file open can keep reading it
+                shutil.rmtree(path, ignore_errors=True)
+                total_bytes -= size
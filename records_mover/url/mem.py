@@ -0,0 +1,209 @@
+from .base import BaseDirectoryUrl, BaseFileUrl
+from typing import IO, Any, Dict, List
+import errno
+import io
+import threading
+
+
+# Default ceiling on the total size of all files held in memory
+DEFAULT_MAX_MEMORY_STORE_BYTES = 1024 * 1024 * 1024
+
+
+class MemoryStore:
+    """Process-local store of file contents for mem:// URLs, keyed by
+    the part of the URL after 'mem://'.
+
+    Writes which would take the total size over max_bytes fail with
+    ENOSPC, as they would on a full disk.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_MEMORY_STORE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._files: Dict[str, bytes] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> bytes:
+        with self._lock:
+            try:
+                return self._files[path]
+            except KeyError:
+                raise FileNotFoundError(f"mem://{path} not found")
+
+    def _total_bytes_with(self, path: str, size: int) -> int:
+        new_total_bytes = self._total_bytes - len(self._files.get(path, b'')) + size
+        if new_total_bytes > self.max_bytes:
+            raise OSError(errno.ENOSPC,
+                          f"Writing {size} bytes to mem://{path} would exceed "
+                          f"the {self.max_bytes} byte limit on in-memory files")
+        return new_total_bytes
+
+    def check_room(self, path: str, size: int) -> None:
+        "Raise as put() would if path were to hold size bytes"
+        with self._lock:
+            self._total_bytes_with(path, size)
+
+    def put(self, path: str, data: bytes) -> None:
+        with self._lock:
+            new_total_bytes = self._total_bytes_with(path, len(data))
+            self._files[path] = data
+            self._total_bytes = new_total_bytes
+
+    def delete(self, path: str) -> None:
+        with self._lock:
+            try:
+                data = self._files.pop(path)
+            except KeyError:
+                raise FileNotFoundError(f"mem://{path} not found")
+            self._total_bytes -= len(data)
+
+    def exists(self, path: str) -> bool:
+        with self._lock:
+            return path in self._files
+
+    def paths_with_prefix(self, prefix: str) -> List[str]:
+        with self._lock:
+            return sorted(path for path in self._files if path.startswith(prefix))
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+
+memory_store = MemoryStore()
+
+
+class _MemoryFileWriter(io.BytesIO):
+    """Buffers writes, storing the contents when closed.  Writes which
+    would take the file past the store's limit fail straight away, and
+    nothing is stored after one has."""
+
+    def __init__(self, path: str, initial_contents: bytes = b'') -> None:
+        super().__init__()
+        self._path = path
+        self._failed = False
+        self.write(initial_contents)
+
+    def write(self, b: Any) -> int:
+        with self.getbuffer() as buffer:
+            size = buffer.nbytes
+        new_size = max(size, self.tell() + memoryview(b).nbytes)
+        try:
+            memory_store.check_room(self._path, new_size)
+        except OSError:
+            self._failed = True
+            raise
+        return super().write(b)
+
+    def close(self) -> None:
+        if not self.closed and not self._failed:
+            memory_store.put(self._path, self.getvalue())
+        super().close()
+
+
+def _path_of(url: str) -> str:
+    if not url.startswith('mem://'):
+        raise ValueError(f"Not a mem:// URL: {url}")
+    return url[len('mem://'):]
+
+
+class MemoryFileUrl(BaseFileUrl):
+    """A file held in this process's memory--handy for small staging
+    files, and for benchmarking without disk or network noise.
+    Contents are lost when the process exits."""
+
+    def __init__(self, url: str, **kwargs) -> None:
+        self.url = url
+        self.scheme = 'mem'
+        self.path = _path_of(url)
+
+    def _directory(self, url: str) -> 'MemoryDirectoryUrl':
+        return MemoryDirectoryUrl(url)
+
+    def open(self, mode: str = "rb") -> IO[bytes]:
+        if mode == 'rb':
+            return io.BytesIO(memory_store.get(self.path))
+        elif mode == 'wb':
+            return _MemoryFileWriter(self.path)
+        elif mode == 'ab':
+            initial_contents = memory_store.get(self.path) if self.exists() else b''
+            return _MemoryFileWriter(self.path, initial_contents)
+        raise NotImplementedError(f"Mode {mode} not supported on {self.url}")
+
+    def exists(self) -> bool:
+        return memory_store.exists(self.path)
+
+    def delete(self) -> None:
+        memory_store.delete(self.path)
+
+    def size(self) -> int:
+        return len(memory_store.get(self.path))
+
+    def filename(self) -> str:
+        return self.path.split('/')[-1]
+
+    def copy_to(self, other_loc: BaseFileUrl) -> BaseFileUrl:
+        if not isinstance(other_loc, MemoryFileUrl):
+            return super().copy_to(other_loc)
+        # bytes are immutable, so the copy can share them
+        memory_store.put(other_loc.path, memory_store.get(self.path))
+        return other_loc
+
+    def rename_to(self, new: BaseFileUrl) -> 'MemoryFileUrl':
+        if not isinstance(new, MemoryFileUrl):
+            raise TypeError(f'Can only rename to same type, not {new}')
+        self.copy_to(new)
+        self.delete()
+        return new
+
+    def containing_directory(self) -> 'MemoryDirectoryUrl':
+        return MemoryDirectoryUrl(self.url[:self.url.rindex('/') + 1])
+
+
+class MemoryDirectoryUrl(BaseDirectoryUrl):
+    "A directory of MemoryFileUrls"
+
+    def __init__(self, url: str, **kwargs) -> None:
+        if not url.endswith('/'):
+            raise ValueError(f"Directory URLs must end in '/': {url}")
+        self.url = url
+        self.scheme = 'mem'
+        self.path = _path_of(url)
+
+    def _file(self, url: str) -> MemoryFileUrl:
+        return MemoryFileUrl(url)
+
+    def directory_in_this_directory(self, directory_name: str) -> 'MemoryDirectoryUrl':
+        return MemoryDirectoryUrl(self.url + directory_name + '/')
+
+    def _entry_names(self) -> List[str]:
+        return [path[len(self.path):]
+                for path in memory_store.paths_with_prefix(self.path)]
+
+    def files_in_directory(self) -> List[BaseFileUrl]:
+        return [self._file(self.url + name)
+                for name in self._entry_names()
+                if '/' not in name]
+
+    def directories_in_directory(self) -> List[BaseDirectoryUrl]:
+        # Directories exist only as long as files are in them
+        subdirectory_names = sorted({name.split('/')[0]
+                                     for name in self._entry_names()
+                                     if '/' in name})
+        return [self.directory_in_this_directory(name) for name in subdirectory_names]
+
+    def purge_directory(self) -> None:
+        for path in memory_store.paths_with_prefix(self.path):
+            try:
+                memory_store.delete(path)
+            except FileNotFoundError:
+                pass
+
+    def filename(self) -> str:
+        return self.path.rstrip('/').split('/')[-1]
+
+    def containing_directory(self) -> 'MemoryDirectoryUrl':
+        stripped = self.url.rstrip('/')
+        if '/' not in self.path.rstrip('/'):
+            return MemoryDirectoryUrl('mem://')
+        return MemoryDirectoryUrl(stripped[:stripped.rindex('/') + 1])
@@ -0,0 +1,136 @@
+import io
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Optional
+
+
+# Size of each byte-range request
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+
+# Number of byte-range requests outstanding at once.  Together with
+# the part size, this bounds the memory used for read-ahead.
+DEFAULT_MAX_PARTS_IN_FLIGHT = 8
+
+
+class RangedReader(io.RawIOBase, metaclass=ABCMeta):
+    """Readable stream over a remote object of known size which
+    downloads it as concurrent byte-range requests, serving the bytes
+    in order.
+
+    A single streaming download is limited to the throughput of a
+    single connection; downloading parts in parallel is how e.g. the
+    AWS SDKs get around that.  At most 'max_parts_in_flight' parts are
+    being downloaded or are waiting to be read at any one time, so
+    memory use is bounded by roughly part_size * (max_parts_in_flight
+    + 1).
+
+    Seeking cancels the parts not yet downloaded and starts requesting
+    them again from the new position, so e.g. a sniffer can rewind to
+    the start.
+
+    Subclasses implement _fetch_part() for their kind of store.
+    """
+
+    def __init__(self,
+                 size: int,
+                 part_size: int = DEFAULT_PART_SIZE,
+                 max_parts_in_flight: int = DEFAULT_MAX_PARTS_IN_FLIGHT) -> None:
+        self._parts: 'Deque[Future[bytes]]' = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if part_size < 1:
+            raise ValueError('part_size must be at least 1')
+        if max_parts_in_flight < 1:
+            raise ValueError('max_parts_in_flight must be at least 1')
+        self._size = size
+        self._part_size = part_size
+        self._max_parts_in_flight = max_parts_in_flight
+        self._executor = ThreadPoolExecutor(max_workers=max_parts_in_flight,
+                                            thread_name_prefix=type(self).__name__)
+        self._next_part_offset = 0
+        self._current = memoryview(b'')
+        self._current_pos = 0
+        self._tell = 0
+        self._request_parts()
+
+    @abstractmethod
+    def _fetch_part(self, start: int, end: int) -> bytes:
+        """Download and return bytes start through end, inclusive.
+        Called concurrently from worker threads."""
+        ...
+
+    def _check_part_length(self, description: str, start: int, end: int, data: bytes) -> None:
+        expected_length = end - start + 1
+        if len(data) != expected_length:
+            raise IOError(f"Expected {expected_length} bytes from {description} "
+                          f"starting at byte {start}, but got {len(data)}--was the object "
+                          "modified while being read?")
+
+    def _request_parts(self) -> None:
+        while (len(self._parts) < self._max_parts_in_flight and
+               self._next_part_offset < self._size):
+            start = self._next_part_offset
+            end = min(start + self._part_size, self._size) - 1
+            assert self._executor is not None
+            self._parts.append(self._executor.submit(self._fetch_part, start, end))
+            self._next_part_offset = end + 1
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._tell
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._tell + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        current_start = self._tell - self._current_pos
+        if current_start <= pos < current_start + len(self._current):
+            # Still within the part already downloaded
+            self._current_pos = pos - current_start
+        else:
+            for part in self._parts:
+                part.cancel()
+            self._parts.clear()
+            self._current = memoryview(b'')
+            self._current_pos = 0
+            self._next_part_offset = min(pos, self._size)
+            self._request_parts()
+        self._tell = pos
+        return pos
+
+    def readinto(self, b: Any) -> int:
+        while self._current_pos >= len(self._current):
+            if len(self._parts) == 0:
+                return 0
+            # Raises any exception from downloading the part
+            self._current = memoryview(self._parts.popleft().result())
+            self._current_pos = 0
+            self._request_parts()
+        n = min(len(b), len(self._current) - self._current_pos)
+        b[:n] = self._current[self._current_pos:self._current_pos + n]
+        self._current_pos += n
+        self._tell += n
+        return n
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        for part in self._parts:
+            part.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._parts.clear()
+        self._current = memoryview(b'')
+        return super().close()
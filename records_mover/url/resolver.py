@@ -7,6 +7,7 @@ import logging
 if TYPE_CHECKING:
     import google.cloud.storage  # noqa
     import boto3.session  # noqa
+    from .local_cache import LocalFileCache  # noqa
 
 
 logger = logging.getLogger(__name__)
@@ -33,12 +34,14 @@ def init_urls() -> None:
         GCSDirectoryUrl = None  # type: ignore
     from .filesystem import FilesystemDirectoryUrl, FilesystemFileUrl
     from .http import HttpFileUrl
+    from .mem import MemoryFileUrl, MemoryDirectoryUrl
     if len(directory_url_ctors) == 0:
         if S3Url is not None:
             directory_url_ctors['s3'] = S3Url
         if GCSDirectoryUrl is not None:
             directory_url_ctors['gs'] = GCSDirectoryUrl
         directory_url_ctors['file'] = FilesystemDirectoryUrl
+        directory_url_ctors['mem'] = MemoryDirectoryUrl
     if len(file_url_ctors) == 0:
         if S3Url is not None:
             file_url_ctors['s3'] = S3Url
@@ -48,12 +51,14 @@ def init_urls() -> None:
 
         file_url_ctors['http'] = HttpFileUrl
         file_url_ctors['https'] = HttpFileUrl
+        file_url_ctors['mem'] = MemoryFileUrl
 
 
 class UrlClassKwArgs(TypedDict, total=False):
     gcs_client: 'google.cloud.storage.Client'
     gcp_credentials: 'google.auth.credentials.Credentials'
     boto3_session: 'boto3.session.Session'
+    gcs_parallel_composite_upload: bool
 
 
 class UrlResolver:
@@ -68,11 +73,16 @@ class UrlResolver:
 
                  gcp_credentials_getter:
                  Callable[[],
-                          Optional['google.auth.credentials.Credentials']])\
+                          Optional['google.auth.credentials.Credentials']],
+
+                 file_cache: Optional['LocalFileCache'] = None,
+                 gcs_parallel_composite_upload: bool = False)\
             -> None:
         self.boto3_session_getter = boto3_session_getter
         self.gcs_client_getter = gcs_client_getter
         self.gcp_credentials_getter = gcp_credentials_getter
+        self.file_cache = file_cache
+        self.gcs_parallel_composite_upload = gcs_parallel_composite_upload
 
     def file_url(self, url: str) -> BaseFileUrl:
         init_urls()
@@ -87,6 +97,18 @@ class UrlResolver:
         else:
             raise NotImplementedError(f"Teach me how to create FileUrls for {parsed_url.scheme}")
 
+    def cached_file_url(self, url: str) -> BaseFileUrl:
+        """Like file_url(), but if a local file cache is configured,
+        returns a local copy of remote files where possible--useful when
+        a file will be read more than once."""
+        loc = self.file_url(url)
+        if self.file_cache is None or urlparse(url).scheme == 'file':
+            return loc
+        local_loc = self.file_cache.local_copy(loc)
+        if local_loc is None:
+            return loc
+        return local_loc
+
     def _kwargs_for_function(self, fn: Callable) -> UrlClassKwArgs:
         parameters: Dict[str, Type] = inspect.signature(fn).parameters
         out: UrlClassKwArgs = {}
@@ -112,6 +134,8 @@ class UrlResolver:
                 raise EnvironmentError('URL requires GCP credentials, but none are configured.  '
                                        'Please configure your credentials.')
             out["gcp_credentials"] = gcp_credentials
+        if 'gcs_parallel_composite_upload' in parameters:
+            out["gcs_parallel_composite_upload"] = self.gcs_parallel_composite_upload
         return out
 
     def directory_url(self, url: str) -> BaseDirectoryUrl:
@@ -3,6 +3,7 @@ import boto3
 from botocore.credentials import ReadOnlyCredentials
 from typing import TypeVar, Callable, Optional, Any, Union, TYPE_CHECKING
 from ..base import BaseDirectoryUrl, BaseFileUrl
+from .s3_clients import s3_client, s3_resource
 if TYPE_CHECKING:
     # http://mypy.readthedocs.io/en/latest/common_issues.html#import-cycles
     from .s3_file_url import S3FileUrl  # noqa
@@ -17,6 +18,8 @@ T = TypeVar('T', bound='S3BaseUrl')
 
 
 class S3BaseUrl:
+    eventually_consistent = True
+
     def __init__(self,
                  url: str,
                  boto3_session: boto3.session.Session,
@@ -33,10 +36,15 @@ class S3BaseUrl:
         self.bucket = parsed.netloc
         self.region = boto3_session.region_name
         self._boto3_session = boto3_session
-        self.s3_resource: S3ResourceTypeStub = boto3_session.resource('s3')
-        self.s3_client: S3ClientTypeStub = boto3_session.client('s3')
+        self.s3_client: S3ClientTypeStub = s3_client(boto3_session)
         self.S3Url = S3Url
 
+    @property
+    def s3_resource(self) -> 'S3ResourceTypeStub':
+        # Not saved on the object, as URL objects may be handed
+        # between threads but boto3 resources should not be.
+        return s3_resource(self._boto3_session)
+
     def _directory(self, url: str) -> 'S3DirectoryUrl':
         out = self.S3Url(url, self._boto3_session)
         if not isinstance(out, BaseDirectoryUrl):
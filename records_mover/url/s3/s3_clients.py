@@ -0,0 +1,56 @@
+import threading
+from weakref import WeakKeyDictionary
+import boto3
+from typing import Dict, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    # These type stubs aren't real classes, so only use their names
+    # during type checking
+    from boto3.session import S3ResourceTypeStub, S3ClientTypeStub
+
+
+# Creating a boto3 client or resource costs tens of milliseconds and
+# a fair bit of memory, and S3 URL objects are created in bulk
+# (e.g., one per file when listing a directory), so share them among
+# all URL objects using the same session and region.
+_lock = threading.Lock()
+_clients: 'WeakKeyDictionary[boto3.session.Session, Dict[Optional[str], S3ClientTypeStub]]' =\
+    WeakKeyDictionary()
+_thread_local = threading.local()
+
+
+def s3_client(boto3_session: boto3.session.Session) -> 'S3ClientTypeStub':
+    """Return an S3 client for this session and its region.
+
+    boto3 clients are thread-safe, so a single client is shared across
+    threads.
+    """
+    region = boto3_session.region_name
+    with _lock:
+        clients_by_region = _clients.setdefault(boto3_session, {})
+        client = clients_by_region.get(region)
+        if client is None:
+            # boto3 sessions are not thread-safe, so creation of
+            # clients happens under the lock as well.
+            client = boto3_session.client('s3')
+            clients_by_region[region] = client
+        return client
+
+
+def s3_resource(boto3_session: boto3.session.Session) -> 'S3ResourceTypeStub':
+    """Return an S3 resource for this session and its region.
+
+    boto3 resources are not thread-safe, so each thread gets its own.
+    """
+    resources = getattr(_thread_local, 'resources', None)
+    if resources is None:
+        resources = WeakKeyDictionary()
+        _thread_local.resources = resources
+    region = boto3_session.region_name
+    resources_by_region: Dict[Optional[str], S3ResourceTypeStub] =\
+        resources.setdefault(boto3_session, {})
+    resource = resources_by_region.get(region)
+    if resource is None:
+        with _lock:
+            resource = boto3_session.resource('s3')
+        resources_by_region[region] = resource
+    return resource
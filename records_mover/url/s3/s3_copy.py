@@ -0,0 +1,49 @@
+from boto3.s3.transfer import TransferConfig
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # These type stubs aren't real classes, so only use their names
+    # during type checking
+    from boto3.session import S3ClientTypeStub
+
+
+# S3 CopyObject can copy at most 5GB in a single request; anything
+# larger needs to be copied in parts via UploadPartCopy.
+MAX_SINGLE_COPY_SIZE = 5 * 1024 * 1024 * 1024
+
+# Number of objects copied at once when copying a directory
+DEFAULT_COPY_WORKERS = 16
+
+# When copying many objects at once, parallelism comes from copying
+# different objects at the same time, so only split up objects which
+# are too big to be copied in one request.
+DIRECTORY_COPY_TRANSFER_CONFIG = TransferConfig(multipart_threshold=MAX_SINGLE_COPY_SIZE,
+                                                multipart_chunksize=512 * 1024 * 1024,
+                                                max_concurrency=4)
+
+# A single large object (e.g., a data file being moved into place) is
+# copied fastest by copying many of its parts at once.  Objects larger
+# than the threshold take time proportional to their size divided by
+# max_concurrency; boto3 grows the part size as needed to stay within
+# S3's 10,000 part limit.
+RENAME_TRANSFER_CONFIG = TransferConfig(multipart_threshold=64 * 1024 * 1024,
+                                        multipart_chunksize=64 * 1024 * 1024,
+                                        max_concurrency=10)
+
+
+def s3_server_side_copy(source_client: 'S3ClientTypeStub',
+                        source_bucket: str,
+                        source_key: str,
+                        target_client: 'S3ClientTypeStub',
+                        target_bucket: str,
+                        target_key: str,
+                        config: TransferConfig = DIRECTORY_COPY_TRANSFER_CONFIG) -> None:
+    """Copy an object within S3 without the data passing through this
+    process.  Uses a single CopyObject request when the object is
+    below config.multipart_threshold in size, and concurrent
+    UploadPartCopy requests otherwise."""
+    # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.copy
+    target_client.copy(CopySource={'Bucket': source_bucket, 'Key': source_key},
+                       Bucket=target_bucket,
+                       Key=target_key,
+                       SourceClient=source_client,
+                       Config=config)
@@ -1,49 +1,111 @@
 from .s3_base_url import S3BaseUrl
-from .awscli import aws_cli
+from .s3_listing import s3_objects, s3_objects_parallel, s3_common_prefixes
+from .s3_copy import s3_server_side_copy, DEFAULT_COPY_WORKERS
+from .s3_sync import s3_sync_to_local, DEFAULT_SYNC_WORKERS
 from ..base import BaseDirectoryUrl, BaseFileUrl
 from ..filesystem import FilesystemDirectoryUrl
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+from typing import Dict, Iterable, List, TYPE_CHECKING
+if TYPE_CHECKING:
+    from boto3.session import ListObjectsResponseContentType
+
+
+# Maximum number of keys accepted by a single S3 DeleteObjects request
+MAX_KEYS_PER_DELETE = 1000
 
 
 class S3DirectoryUrl(S3BaseUrl, BaseDirectoryUrl):
+    # Number of files downloaded at once when copying to a local
+    # directory
+    max_sync_workers: int = DEFAULT_SYNC_WORKERS
+
     def directory_in_this_directory(self, directory_name: str) -> 'S3DirectoryUrl':
         return self._directory(f"{self.url}{directory_name}/")
 
+    def _files_from_listing(self,
+                            objects: Iterable['ListObjectsResponseContentType']) ->\
+            List['BaseFileUrl']:
+        out: List[BaseFileUrl] = []
+        for obj in objects:
+            loc = self._file(f"s3://{self.bucket}/{obj['Key']}")
+            # Save a HEAD request per file when callers need sizes
+            # (e.g., when building a manifest).
+            loc.listed_size = obj['Size']
+            out.append(loc)
+        return out
+
     def files_in_directory(self) -> List['BaseFileUrl']:
-        prefix = self.key
-        resp = self.s3_client.list_objects(Bucket=self.bucket, Prefix=prefix, Delimiter='/')
-        keys = [item['Key'] for item in resp.get('Contents', [])]
-        return [self._key_in_same_bucket(key) for key in keys]
+        return self._files_from_listing(s3_objects(self.s3_client,
+                                                   bucket=self.bucket,
+                                                   prefix=self.key,
+                                                   delimiter='/'))
 
     def directories_in_directory(self) -> List['BaseDirectoryUrl']:
-        prefix = self.key
-        response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=prefix, Delimiter='/')
-        prefix_keys = [content['Prefix'] for content in response.get('CommonPrefixes', [])]
-        urls = [f"s3://{self.bucket}/{prefix}{key}" for key in prefix_keys]
-        return [self._directory(url) for url in urls]
+        prefix_keys = s3_common_prefixes(self.s3_client,
+                                         bucket=self.bucket,
+                                         prefix=self.key)
+        return [self._directory(f"s3://{self.bucket}/{key}") for key in prefix_keys]
 
     def purge_directory(self) -> None:
         if not self.is_directory():
             raise ValueError("Not a directory")
         # https://stackoverflow.com/questions/11426560/amazon-s3-boto-how-to-delete-folder
-        objects_to_delete = self.s3_resource.meta.client.list_objects(Bucket=self.bucket,
-                                                                      Prefix=self.key)
-        delete_keys: Dict[str, List[Dict[str, str]]] = {'Objects': []}
-        delete_keys['Objects'] =\
-            [{'Key': k} for k in [obj['Key'] for obj in objects_to_delete.get('Contents', [])]]
-        if delete_keys['Objects']:
-            self.s3_resource.meta.client.delete_objects(Bucket=self.bucket, Delete=delete_keys)
+        objects = s3_objects_parallel(self.s3_client, bucket=self.bucket, prefix=self.key)
+        keys = (obj['Key'] for obj in objects)
+        while True:
+            batch = list(itertools.islice(keys, MAX_KEYS_PER_DELETE))
+            if not batch:
+                break
+            delete_keys: Dict[str, List[Dict[str, str]]] = {
+                'Objects': [{'Key': key} for key in batch]
+            }
+            self.s3_client.delete_objects(Bucket=self.bucket, Delete=delete_keys)
 
     def copy_to(self, other_loc: BaseDirectoryUrl) -> BaseDirectoryUrl:
         if not other_loc.is_directory():
             raise RuntimeError(f"Cannot copy a directory to a file ({other_loc.url})")
         elif isinstance(other_loc, FilesystemDirectoryUrl):
-            aws_cli('s3', 'sync', self.url, other_loc.local_file_path)
+            s3_sync_to_local(self.s3_client,
+                             bucket=self.bucket,
+                             prefix=self.key,
+                             local_directory=other_loc.local_file_path,
+                             max_workers=self.max_sync_workers)
+            return other_loc
+        elif isinstance(other_loc, S3DirectoryUrl):
+            self._copy_to_s3_directory(other_loc)
             return other_loc
         else:
             return super(S3DirectoryUrl, self).copy_to(other_loc)
 
+    def _copy_to_s3_directory(self,
+                              other_loc: 'S3DirectoryUrl',
+                              max_workers: int = DEFAULT_COPY_WORKERS) -> None:
+        # Have S3 copy the objects itself, rather than streaming each
+        # one down to this machine and back up again, and copy many
+        # objects at once since each copy is mostly waiting on S3.
+        objects = s3_objects_parallel(self.s3_client, bucket=self.bucket, prefix=self.key)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for obj in objects:
+                key = obj['Key']
+                if key.endswith('/'):
+                    # Zero-byte 'directory' marker objects
+                    continue
+                target_key = other_loc.key + key[len(self.key):]
+                futures.append(executor.submit(s3_server_side_copy,
+                                               source_client=self.s3_client,
+                                               source_bucket=self.bucket,
+                                               source_key=key,
+                                               target_client=other_loc.s3_client,
+                                               target_bucket=other_loc.bucket,
+                                               target_key=target_key))
+            for future in futures:
+                # Raise the first exception if any copy failed
+                future.result()
+
     def files_matching_prefix(self, prefix: str) -> List[BaseFileUrl]:
-        prefix = self.key + prefix
-        resp = self.s3_client.list_objects(Bucket=self.bucket, Prefix=prefix, Delimiter='/')
-        return [self._key_in_same_bucket(o['Key']) for o in resp.get('Contents', [])]
+        return self._files_from_listing(s3_objects(self.s3_client,
+                                                   bucket=self.bucket,
+                                                   prefix=self.key + prefix,
+                                                   delimiter='/'))
@@ -1,17 +1,33 @@
+import io
 import logging
 from .s3_base_url import S3BaseUrl
+from .s3_copy import s3_server_side_copy, RENAME_TRANSFER_CONFIG
+from .s3_ranged_reader import S3RangedReader
+from ..ranged_reader import DEFAULT_PART_SIZE, DEFAULT_MAX_PARTS_IN_FLIGHT
 from ..base import BaseDirectoryUrl, BaseFileUrl
-from typing import IO, List, Optional
+from typing import Any, IO, List, Mapping, Optional
 import threading
-from time import sleep
+from records_mover.utils.polling import wait_for, DEFAULT_MAX_MS_BETWEEN_POLLS
 from s3_concat import S3Concat
 from smart_open.s3 import open as s3_open
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 
 
 logger = logging.getLogger(__name__)
 
 
 class S3FileUrl(S3BaseUrl, BaseFileUrl):
+    # Set when this object came from a directory listing, which
+    # already told us the size of the file.
+    listed_size: Optional[int] = None
+
+    # Objects larger than a single part are read via this many
+    # concurrent byte-range GETs of this size, rather than a single
+    # streaming GET.
+    download_part_size: int = DEFAULT_PART_SIZE
+    max_download_parts_in_flight: int = DEFAULT_MAX_PARTS_IN_FLIGHT
+
     def __str__(self) -> str:
         return self.url
 
@@ -49,7 +65,31 @@ class S3FileUrl(S3BaseUrl, BaseFileUrl):
 
         return callback.length
 
+    def _head_object(self) -> Mapping[str, Any]:
+        try:
+            return self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"{self} not found")
+            else:
+                raise e
+
     def open(self, mode: str = "rb") -> IO[bytes]:
+        if mode == 'rb' and (self.listed_size is None or
+                             self.listed_size > self.download_part_size):
+            # Size and ETag from the same request, so they describe
+            # the same version of the object
+            response = self._head_object()
+            size = response['ContentLength']
+            if size > self.download_part_size:
+                reader = S3RangedReader(self.s3_client,
+                                        bucket=self.bucket,
+                                        key=self.key,
+                                        size=size,
+                                        etag=response.get('ETag'),
+                                        part_size=self.download_part_size,
+                                        max_parts_in_flight=self.max_download_parts_in_flight)
+                return io.BufferedReader(reader)
         try:
             return s3_open(bucket_id=self.bucket,
                            key_id=self.key,
@@ -79,7 +119,14 @@ class S3FileUrl(S3BaseUrl, BaseFileUrl):
                 raise e
 
     def download_fileobj(self, fileobj: IO[bytes]) -> None:
-        self.s3_client.download_fileobj(Fileobj=fileobj, Bucket=self.bucket, Key=self.key)
+        # boto3's managed download issues the same sort of concurrent
+        # byte-range GETs as S3RangedReader, writing the parts into
+        # place as they arrive.
+        config = TransferConfig(multipart_threshold=self.download_part_size,
+                                multipart_chunksize=self.download_part_size,
+                                max_concurrency=self.max_download_parts_in_flight)
+        self.s3_client.download_fileobj(Fileobj=fileobj, Bucket=self.bucket, Key=self.key,
+                                        Config=config)
 
     def store_string(self, contents: str) -> None:
         self.s3_resource.Object(self.bucket, self.key).put(Body=contents)
@@ -87,9 +134,16 @@ class S3FileUrl(S3BaseUrl, BaseFileUrl):
     def rename_to(self, new: 'BaseFileUrl') -> 'S3FileUrl':
         if not isinstance(new, S3FileUrl):
             raise TypeError(f'Can only rename to same type, not {new}')
-        # https://stackoverflow.com/questions/32501995/boto3-s3-renaming-an-object-using-copy-object
-        copy_source = {'Bucket': self.bucket, 'Key': self.key}
-        self.s3_resource.Object(new.bucket, new.key).copy_from(CopySource=copy_source)
+        # S3 has no rename operation, so copy and then delete.  A
+        # single CopyObject request is limited to 5GB, so larger
+        # objects are copied as concurrent multipart part copies.
+        s3_server_side_copy(source_client=self.s3_client,
+                            source_bucket=self.bucket,
+                            source_key=self.key,
+                            target_client=new.s3_client,
+                            target_bucket=new.bucket,
+                            target_key=new.key,
+                            config=RENAME_TRANSFER_CONFIG)
         self.s3_resource.Object(self.bucket, self.key).delete()
         logger.info("Renamed {old_url} to {new_url}".format(old_url=self.url, new_url=new.url))
         return new
@@ -97,18 +151,33 @@ class S3FileUrl(S3BaseUrl, BaseFileUrl):
     def delete(self) -> None:
         self.s3_resource.Object(self.bucket, self.key).delete()
 
+    def exists(self) -> bool:
+        # A HEAD request, rather than opening the object for reading
+        try:
+            self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey'):
+                return False
+            raise e
+
+    def content_version(self) -> Optional[str]:
+        return self._head_object().get('ETag')
+
     def wait_to_exist(self, log_level: int = logging.INFO,
-                      ms_between_polls: int = 50) -> None:
-        while True:
-            try:
-                with self.open():
-                    return
-            except FileNotFoundError:
-                logger.log(log_level, f"Waiting for {self.url} to appear...")
-                seconds_to_sleep = ms_between_polls / 1000.0
-                sleep(seconds_to_sleep)
+                      ms_between_polls: int = 50,
+                      max_ms_between_polls: int = DEFAULT_MAX_MS_BETWEEN_POLLS,
+                      timeout_seconds: Optional[float] = None) -> None:
+        wait_for(self.exists,
+                 description=lambda: f"{self.url} to appear",
+                 log_level=log_level,
+                 ms_between_polls=ms_between_polls,
+                 max_ms_between_polls=max_ms_between_polls,
+                 timeout_seconds=timeout_seconds)
 
     def size(self) -> int:
+        if self.listed_size is not None:
+            return self.listed_size
         response = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
         return response['ContentLength']
 
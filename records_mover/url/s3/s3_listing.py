@@ -0,0 +1,94 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Union, TYPE_CHECKING
+if TYPE_CHECKING:
+    # These type stubs aren't real classes, so only use their names
+    # during type checking
+    from boto3.session import (S3ClientTypeStub, ListObjectsResponseType,
+                               ListObjectsResponseContentType)
+
+
+# Number of sub-prefixes listed at once by s3_objects_parallel()
+DEFAULT_LISTING_WORKERS = 8
+
+
+def s3_list_pages(s3_client: 'S3ClientTypeStub',
+                  bucket: str,
+                  prefix: str,
+                  delimiter: Optional[str] = None) -> Iterator['ListObjectsResponseType']:
+    """Stream each page of a ListObjectsV2 listing, following
+    continuation tokens so that listings of more than 1000 keys are
+    complete."""
+    paginator = s3_client.get_paginator('list_objects_v2')
+    if delimiter is None:
+        return paginator.paginate(Bucket=bucket, Prefix=prefix)
+    else:
+        return paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter)
+
+
+def s3_objects(s3_client: 'S3ClientTypeStub',
+               bucket: str,
+               prefix: str,
+               delimiter: Optional[str] = None) -> Iterator['ListObjectsResponseContentType']:
+    """Stream the objects (including their keys and sizes) under the
+    given prefix.  If delimiter is given, don't descend into 'sub
+    directories' delimited by it."""
+    for page in s3_list_pages(s3_client, bucket, prefix, delimiter):
+        yield from page.get('Contents', [])
+
+
+def s3_common_prefixes(s3_client: 'S3ClientTypeStub',
+                       bucket: str,
+                       prefix: str,
+                       delimiter: str = '/') -> Iterator[str]:
+    "Stream the 'sub directory' prefixes directly under the given prefix"
+    for page in s3_list_pages(s3_client, bucket, prefix, delimiter):
+        for common_prefix in page.get('CommonPrefixes', []):
+            yield common_prefix['Prefix']
+
+
+def s3_objects_parallel(s3_client: 'S3ClientTypeStub',
+                        bucket: str,
+                        prefix: str,
+                        max_workers: int = DEFAULT_LISTING_WORKERS) ->\
+        Iterator['ListObjectsResponseContentType']:
+    """Stream all objects under the given prefix, including those in
+    'sub directories'.  Each sub-prefix directly under the prefix is
+    listed concurrently, which helps when there are many objects
+    spread among them.  Objects are not yielded in any particular
+    order.
+    """
+    sub_prefixes: List[str] = []
+    for page in s3_list_pages(s3_client, bucket, prefix, delimiter='/'):
+        yield from page.get('Contents', [])
+        sub_prefixes.extend(common_prefix['Prefix']
+                            for common_prefix in page.get('CommonPrefixes', []))
+    if len(sub_prefixes) == 0:
+        return
+
+    # Each item is a list of objects from a page, an exception raised
+    # while listing, or None to signal a sub-prefix listing is done.
+    results: 'queue.Queue[Union[List[ListObjectsResponseContentType], Exception, None]]' =\
+        queue.Queue()
+
+    def list_sub_prefix(sub_prefix: str) -> None:
+        try:
+            for page in s3_list_pages(s3_client, bucket, sub_prefix):
+                results.put(page.get('Contents', []))
+        except Exception as e:
+            results.put(e)
+        else:
+            results.put(None)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for sub_prefix in sub_prefixes:
+            executor.submit(list_sub_prefix, sub_prefix)
+        remaining = len(sub_prefixes)
+        while remaining > 0:
+            item = results.get()
+            if item is None:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield from item
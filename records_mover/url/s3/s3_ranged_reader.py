@@ -0,0 +1,56 @@
+from ..ranged_reader import RangedReader, DEFAULT_PART_SIZE, DEFAULT_MAX_PARTS_IN_FLIGHT
+from botocore.exceptions import ClientError
+from typing import TYPE_CHECKING, Optional
+if TYPE_CHECKING:
+    # These type stubs aren't real classes, so only use their names
+    # during type checking
+    from boto3.session import S3ClientTypeStub
+
+
+class S3RangedReader(RangedReader):
+    """RangedReader over an S3 object, using ranged GetObject requests.
+
+    If etag is given, each request is made conditional on it, so that
+    parts of two different versions of an object overwritten while
+    being read can't be mixed together.
+    """
+
+    def __init__(self,
+                 s3_client: 'S3ClientTypeStub',
+                 bucket: str,
+                 key: str,
+                 size: int,
+                 etag: Optional[str] = None,
+                 part_size: int = DEFAULT_PART_SIZE,
+                 max_parts_in_flight: int = DEFAULT_MAX_PARTS_IN_FLIGHT) -> None:
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._etag = etag
+        super().__init__(size=size,
+                         part_size=part_size,
+                         max_parts_in_flight=max_parts_in_flight)
+
+    def _fetch_part(self, start: int, end: int) -> bytes:
+        description = f"s3://{self._bucket}/{self._key}"
+        kwargs = {}
+        if self._etag is not None:
+            kwargs['IfMatch'] = self._etag
+        try:
+            # Range is inclusive on both ends
+            response = self._s3_client.get_object(Bucket=self._bucket,
+                                                  Key=self._key,
+                                                  Range=f'bytes={start}-{end}',
+                                                  **kwargs)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('412', 'PreconditionFailed'):
+                raise IOError(f"{description} no longer has ETag {self._etag}--was it "
+                              "modified while being read?")
+            raise e
+        body = response['Body']
+        try:
+            data = body.read()
+        finally:
+            body.close()
+        self._check_part_length(description, start, end, data)
+        return data
@@ -0,0 +1,108 @@
+from .s3_listing import s3_objects_parallel
+from concurrent.futures import ThreadPoolExecutor
+from boto3.s3.transfer import TransferConfig
+import hashlib
+import logging
+import os
+from typing import Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    # These type stubs aren't real classes, so only use their names
+    # during type checking
+    from boto3.session import S3ClientTypeStub, ListObjectsResponseContentType
+
+
+logger = logging.getLogger(__name__)
+
+
+# Number of objects downloaded at once by s3_sync_to_local()
+DEFAULT_SYNC_WORKERS = 16
+
+
+def _md5_of_file(path: str) -> str:
+    md5 = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _local_copy_is_current(local_path: str, obj: 'ListObjectsResponseContentType') -> bool:
+    try:
+        stat = os.stat(local_path)
+    except FileNotFoundError:
+        return False
+    if stat.st_size != obj['Size']:
+        return False
+    etag = obj['ETag'].strip('"')
+    if '-' in etag:
+        # Multipart upload ETags aren't the MD5 of the content, so
+        # fall back to comparing modification times--downloads below
+        # set the local file's to the object's, as 'aws s3 sync' does.
+        return stat.st_mtime >= obj['LastModified'].timestamp()
+    return _md5_of_file(local_path) == etag
+
+
+def _download(s3_client: 'S3ClientTypeStub',
+              bucket: str,
+              obj: 'ListObjectsResponseContentType',
+              local_path: str,
+              config: Optional[TransferConfig]) -> None:
+    # Download to a temporary name first so that a partial download
+    # is never mistaken for a complete one by a later sync.
+    partial_path = local_path + '.partial'
+    try:
+        with open(partial_path, 'wb') as f:
+            s3_client.download_fileobj(Bucket=bucket, Key=obj['Key'], Fileobj=f,
+                                       Config=config)
+        os.replace(partial_path, local_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    last_modified = obj['LastModified'].timestamp()
+    os.utime(local_path, (last_modified, last_modified))
+
+
+def s3_sync_to_local(s3_client: 'S3ClientTypeStub',
+                     bucket: str,
+                     prefix: str,
+                     local_directory: str,
+                     max_workers: int = DEFAULT_SYNC_WORKERS,
+                     config: Optional[TransferConfig] = None) -> int:
+    """Download all objects under the given prefix into the local
+    directory, recreating any 'sub directories', downloading many
+    objects at once.
+
+    Objects already present locally with matching size and ETag (or
+    modification time, for multipart uploads) are skipped, so
+    re-running a sync after a failure only downloads what's missing.
+
+    Returns the number of objects downloaded.
+    """
+    local_directory = os.path.abspath(local_directory)
+    objects = s3_objects_parallel(s3_client, bucket=bucket, prefix=prefix)
+    num_skipped = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for obj in objects:
+            key = obj['Key']
+            if key.endswith('/'):
+                # Zero-byte 'directory' marker objects
+                continue
+            local_path = os.path.abspath(os.path.join(local_directory,
+                                                      *key[len(prefix):].split('/')))
+            if not local_path.startswith(local_directory + os.sep):
+                raise ValueError(f"Refusing to download s3://{bucket}/{key} "
+                                 f"outside of {local_directory}")
+            if _local_copy_is_current(local_path, obj):
+                num_skipped += 1
+                continue
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            futures.append(executor.submit(_download, s3_client, bucket, obj,
+                                           local_path, config))
+        for future in futures:
+            # Raise the first exception if any download failed
+            future.result()
+    logger.info(f"Downloaded {len(futures)} files from s3://{bucket}/{prefix} "
+                f"to {local_directory} ({num_skipped} already up to date)")
+    return len(futures)
@@ -0,0 +1,74 @@
+import io
+from typing import IO, Any
+
+
+# Bytes from the start of a stream kept in memory so it can be rewound
+DEFAULT_PEEK_BUFFER_BYTES = 16 * 1024 * 1024
+
+
+class PeekBufferedFile(io.RawIOBase):
+    """Wraps a stream which can't be rewound (e.g., an HTTP response
+    or a pipe), recording its first max_buffer_bytes as they're read
+    so that the reader can seek back within them--e.g., to sniff its
+    format--and then have them replayed in front of the rest of the
+    stream.
+
+    Once more than max_buffer_bytes have been read, the recording is
+    dropped and seekable() starts returning False.
+
+    The underlying fileobj is not closed when this is--whoever opened
+    it remains responsible for that.
+    """
+
+    def __init__(self,
+                 fileobj: IO[bytes],
+                 max_buffer_bytes: int = DEFAULT_PEEK_BUFFER_BYTES) -> None:
+        self._fileobj = fileobj
+        self.max_buffer_bytes = max_buffer_bytes
+        self._buffer = bytearray()
+        self._pos = 0
+        self._passed_buffer = False
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return not self._passed_buffer
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self._passed_buffer:
+            raise io.UnsupportedOperation("Can't rewind a stream after reading more than "
+                                          f"its first {self.max_buffer_bytes} bytes")
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Can only seek relative to the start or current "
+                                          "position of a stream")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        if offset > len(self._buffer):
+            raise io.UnsupportedOperation("Can't seek forward past data not yet read")
+        self._pos = offset
+        return self._pos
+
+    def readinto(self, b: Any) -> int:
+        if self._pos < len(self._buffer):
+            # Replay what was recorded
+            n = min(len(b), len(self._buffer) - self._pos)
+            b[:n] = self._buffer[self._pos:self._pos + n]
+            self._pos += n
+            return n
+        data = self._fileobj.read(len(b))
+        n = len(data)
+        b[:n] = data
+        if not self._passed_buffer:
+            if len(self._buffer) + n <= self.max_buffer_bytes:
+                self._buffer += data
+            else:
+                self._passed_buffer = True
+                self._buffer = bytearray()
+        self._pos += n
+        return n
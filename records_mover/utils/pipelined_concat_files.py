@@ -0,0 +1,127 @@
+import io
+import queue
+import threading
+from typing import IO, Iterable, Iterator, Optional, Union
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class PipelinedConcatFiles(io.RawIOBase):
+    """Like ConcatFiles, but the files to be concatenated are produced
+    lazily by iterating 'files' in a background thread while earlier
+    files are still being read.
+
+    At most 'max_files_in_flight' files will have been produced but
+    not yet fully read and closed at any one time, which bounds the
+    resources (e.g., local disk) used by whatever is producing the
+    files.
+    """
+
+    # How often the background thread checks to see if the reader
+    # has gone away while it waits for room to produce another file.
+    POLL_SECONDS = 0.1
+
+    def __init__(self,
+                 files: Iterable[IO[bytes]],
+                 max_files_in_flight: int) -> None:
+        self._files_iter: Iterator[IO[bytes]] = iter(files)
+        # Items are either a produced file, an exception raised while
+        # producing one, or None to signal that there are no more.
+        self._queue: 'queue.Queue[Union[IO[bytes], BaseException, None]]' = queue.Queue()
+        self._stopping = threading.Event()
+        self._current: Optional[IO[bytes]] = None
+        self._exhausted = False
+        self._tell = 0
+        self._thread = threading.Thread(target=self._produce,
+                                        name='PipelinedConcatFiles',
+                                        daemon=True)
+        if max_files_in_flight < 1:
+            raise ValueError('max_files_in_flight must be at least 1')
+        self._slots = threading.BoundedSemaphore(max_files_in_flight)
+        self._thread.start()
+
+    def _acquire_slot(self) -> bool:
+        while not self._stopping.is_set():
+            if self._slots.acquire(timeout=self.POLL_SECONDS):
+                return True
+        return False
+
+    def _produce(self) -> None:
+        try:
+            while self._acquire_slot():
+                try:
+                    f = next(self._files_iter)
+                except StopIteration:
+                    self._slots.release()
+                    break
+                self._queue.put(f)
+        except BaseException as e:
+            self._queue.put(e)
+            return
+        self._queue.put(None)
+
+    def _next_file(self) -> Optional[IO[bytes]]:
+        if self._current is None and not self._exhausted:
+            item = self._queue.get()
+            if item is None:
+                self._exhausted = True
+            elif isinstance(item, BaseException):
+                self._exhausted = True
+                raise item
+            else:
+                self._current = item
+        return self._current
+
+    def _finish_current_file(self) -> None:
+        assert self._current is not None
+        self._current.close()
+        self._current = None
+        self._slots.release()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._stopping.set()
+        if self._current is not None:
+            self._finish_current_file()
+        if self._thread.is_alive():
+            self._thread.join()
+        # Close anything produced that the reader never got to.
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None and not isinstance(item, BaseException):
+                item.close()
+        return super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def readall(self) -> bytes:
+        out = bytearray()
+        while self._next_file() is not None:
+            chunk = self._current.read()  # type: ignore
+            self._tell += len(chunk)
+            out += chunk
+            self._finish_current_file()
+        return bytes(out)
+
+    def tell(self) -> int:
+        return self._tell
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            return self.readall()
+
+        while self._next_file() is not None:
+            chunk = self._current.read(size)  # type: ignore
+            # If we aren't getting any bytes from this stream, lets
+            # move on to the next stream
+            if len(chunk) == 0:
+                self._finish_current_file()
+            else:
+                self._tell += len(chunk)
+                return chunk
+
+        return b''
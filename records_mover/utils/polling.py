@@ -0,0 +1,47 @@
+from typing import Callable, Optional
+import tenacity
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MS_BETWEEN_POLLS = 50
+DEFAULT_MAX_MS_BETWEEN_POLLS = 30000
+
+
+def wait_for(check: Callable[[], bool],
+             description: Callable[[], str],
+             log_level: int = logging.INFO,
+             ms_between_polls: int = DEFAULT_MS_BETWEEN_POLLS,
+             max_ms_between_polls: int = DEFAULT_MAX_MS_BETWEEN_POLLS,
+             timeout_seconds: Optional[float] = None) -> None:
+    """Call check() until it returns True.
+
+    Polls start roughly ms_between_polls apart and back off
+    exponentially up to max_ms_between_polls, with random jitter so
+    that many waiters don't poll a store in lockstep.  Raises
+    TimeoutError if timeout_seconds pass first; waits forever if it
+    is None.
+
+    description() is called before each sleep to describe what we're
+    waiting for in the log.
+    """
+    def log_wait(retry_state: tenacity.RetryCallState) -> None:
+        logger.log(log_level, f"Waiting for {description()}...")
+
+    # https://tenacity.readthedocs.io/en/latest/
+    #
+    # wait_random_exponential() waits a random amount up to the
+    # exponentially growing cap ('full jitter'); times are in seconds.
+    wait = tenacity.wait_random_exponential(multiplier=ms_between_polls / 1000.0,
+                                            max=max_ms_between_polls / 1000.0)
+    poll = tenacity.retry(wait=wait,
+                          stop=(tenacity.stop_never if timeout_seconds is None
+                                else tenacity.stop_after_delay(timeout_seconds)),
+                          retry=tenacity.retry_if_result(lambda done: not done),
+                          before_sleep=log_wait)(check)
+    try:
+        poll()
+    except tenacity.RetryError:
+        raise TimeoutError(f"Timed out after {timeout_seconds} seconds waiting for "
+                           f"{description()}")
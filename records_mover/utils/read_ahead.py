@@ -0,0 +1,123 @@
+import io
+import queue
+import threading
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Optional, Union
+from ..url.fast_copy import is_regular_file
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes read from the underlying stream per call in the background
+DEFAULT_READ_AHEAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Bytes read but not yet consumed which may be held in memory at once
+DEFAULT_MAX_READ_AHEAD_BYTES = 64 * 1024 * 1024
+
+
+class ReadAheadFile(io.RawIOBase):
+    """Readable stream which reads 'fileobj' in a background thread,
+    keeping up to 'max_buffered_bytes' read ahead of the reader.
+
+    This lets a slow producer (e.g., a network download) and a slow
+    consumer (e.g., a database COPY) make progress at the same time
+    instead of taking turns.  At least two chunks are buffered, so
+    'chunk_size' is reduced if needed to respect the ceiling.
+
+    The underlying fileobj is not closed when this is--whoever opened
+    it remains responsible for that.
+    """
+
+    # How often the background thread checks to see if the reader
+    # has gone away while it waits for room to buffer another chunk.
+    POLL_SECONDS = 0.1
+
+    def __init__(self,
+                 fileobj: IO[bytes],
+                 max_buffered_bytes: int = DEFAULT_MAX_READ_AHEAD_BYTES,
+                 chunk_size: int = DEFAULT_READ_AHEAD_CHUNK_SIZE) -> None:
+        if max_buffered_bytes < 2:
+            raise ValueError('max_buffered_bytes must be at least 2')
+        self._fileobj = fileobj
+        self._chunk_size = max(1, min(chunk_size, max_buffered_bytes // 2))
+        # Items are either a chunk of data, an exception raised while
+        # reading one, or b'' to signal the end of the stream.
+        self._queue: 'queue.Queue[Union[bytes, BaseException]]' =\
+            queue.Queue(maxsize=max_buffered_bytes // self._chunk_size)
+        self._stopping = threading.Event()
+        self._current = memoryview(b'')
+        self._current_pos = 0
+        self._exhausted = False
+        self._tell = 0
+        self._thread = threading.Thread(target=self._produce,
+                                        name='ReadAheadFile',
+                                        daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Union[bytes, BaseException]) -> bool:
+        while not self._stopping.is_set():
+            try:
+                self._queue.put(item, timeout=self.POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self) -> None:
+        try:
+            while True:
+                chunk = self._fileobj.read(self._chunk_size)
+                if not self._put(chunk) or not chunk:
+                    return
+        except BaseException as e:
+            self._put(e)
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._tell
+
+    def readinto(self, b: Any) -> int:
+        while self._current_pos >= len(self._current):
+            if self._exhausted:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._exhausted = True
+                raise item
+            if not item:
+                self._exhausted = True
+                return 0
+            self._current = memoryview(item)
+            self._current_pos = 0
+        n = min(len(b), len(self._current) - self._current_pos)
+        b[:n] = self._current[self._current_pos:self._current_pos + n]
+        self._current_pos += n
+        self._tell += n
+        return n
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._current = memoryview(b'')
+        return super().close()
+
+
+@contextmanager
+def read_ahead_if_remote(fileobj: IO[bytes],
+                         max_buffered_bytes: Optional[int]) -> Iterator[IO[bytes]]:
+    """Yield a stream reading fileobj through a ReadAheadFile, unless
+    read-ahead is turned off (max_buffered_bytes is None) or fileobj
+    is a local file, where the OS does read-ahead already."""
+    if max_buffered_bytes is None or is_regular_file(fileobj):
+        yield fileobj
+        return
+    logger.debug(f"Reading up to {max_buffered_bytes} bytes ahead in the background")
+    with ReadAheadFile(fileobj, max_buffered_bytes=max_buffered_bytes) as read_ahead_file:
+        yield read_ahead_file  # type: ignore
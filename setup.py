@@ -151,19 +151,6 @@ db_dependencies = [
 ]
 
 smart_open_dependencies = [
-    # smart_open requires rsa>=3.1.4, which causes pip 20.2.4 in
-    # default mode to install rsa 4.6.
-    #
-    # That then results in this error from pip at install-time:
-    #
-    # awscli 1.18.178 requires rsa<=4.5.0,>=3.1.2; python_version !=
-    # "3.4", but you'll have rsa 4.6 which is incompatible.
-    #
-    # Also, pipgrip (used to make Python formulas in Homebrew) takes
-    # somewhere between much longer and forever to provide its output
-    # without this line.
-    #
-    'rsa>=3.1.4,<=4.5.0',
     # we rely on exception types from smart_open,
     # which seem to change in feature releases
     # without a major version bump
@@ -188,7 +175,6 @@ bigquery_dependencies = [
 
 
 aws_dependencies = [
-    'awscli>=1,<2',
     'boto>=2,<3',
     'boto3',
     's3-concat>=0.1.7,<0.2'
@@ -313,13 +299,6 @@ setup(name='records-mover',
       },
       install_requires=[
           'timeout_decorator',
-          # awscli pins PyYAML. We have seen issues at
-          # run-time if we don't constrain things here as well. So
-          # this tracks the awscli req for python >= 3.6 which is
-          # what we support
-          #
-          # https://github.com/aws/aws-cli/blob/develop/setup.py
-          'PyYAML>=3.10,<5.5',
           # Not sure how/if interface will change in db-facts, so
           # let's be conservative about what we're specifying for now.
           'db-facts>=4,<5',
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Microbenchmark: refining the schema of a very wide dataframe in
+one process versus splitting its columns between several
+(ProcessingInstructions.max_inference_processes).
+
+Usage: python tests/benchmarks/column_parallel_inference.py [num_columns] [num_rows] [num_processes]
+"""
+import os
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.schema import RecordsSchema
+
+
+def make_frame(num_rows: int, num_columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    words = np.array(['alpha', 'beta', 'naïve', 'café', 'x' * 40], dtype=object)
+    columns = {}
+    for i in range(num_columns):
+        if i % 2 == 0:
+            columns[f'int_{i}'] = rng.integers(0, 1000000, num_rows)
+        else:
+            columns[f'str_{i}'] = pd.Series(rng.choice(words, num_rows), dtype=object)
+    return pd.DataFrame(columns)
+
+
+def main() -> None:
+    num_columns = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    num_processes = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    df = make_frame(num_rows, num_columns)
+    schema = RecordsSchema.from_data({
+        'schema': 'bltypes/v1',
+        'fields': {
+            name: {'type': 'integer' if name.startswith('int_') else 'string'}
+            for name in df
+        },
+    })
+
+    def refine(max_inference_processes: int) -> None:
+        processing_instructions =\
+            ProcessingInstructions(max_inference_processes=max_inference_processes)
+        schema.refine_from_dataframe(df, processing_instructions)
+
+    one_process_secs = min(timeit.repeat(lambda: refine(1), number=1, repeat=3))
+    many_processes_secs = min(timeit.repeat(lambda: refine(num_processes), number=1, repeat=3))
+    print(f"{num_columns} columns x {num_rows} rows, 1 process:   "
+          f"{one_process_secs * 1000:.1f}ms")
+    print(f"{num_columns} columns x {num_rows} rows, {num_processes} processes: "
+          f"{many_processes_secs * 1000:.1f}ms ({one_process_secs / many_processes_secs:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
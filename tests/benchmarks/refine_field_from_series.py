@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Microbenchmark: cost of the per-column type and length scans done
+when inferring a records schema from a dataframe.
+
+Compares the per-value Python loops refine_field_from_series() used
+to run--mapping type() and len() over each series, and encoding each
+string to count its bytes--against the vectorized kernels it uses
+now, on a wide frame (many short columns) and a long one (a few
+columns of many rows).
+
+Usage: python tests/benchmarks/refine_field_from_series.py [num_rows_long] [num_columns_wide]
+"""
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+from records_mover.records.schema.field.pandas import _python_type_of, _max_utf8_length
+
+
+def make_frame(num_rows: int, num_columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    words = np.array(['alpha', 'beta', 'gamma', 'naïve', 'café', '€uro', '数据', 'x' * 40],
+                     dtype=object)
+    columns = {}
+    for i in range(num_columns):
+        if i % 3 == 0:
+            columns[f'int_{i}'] = pd.Series(rng.integers(0, 1000000, num_rows),
+                                            dtype=object)
+        else:
+            columns[f'str_{i}'] = pd.Series(rng.choice(words, num_rows), dtype=object)
+    return pd.DataFrame(columns)
+
+
+def per_value(df: pd.DataFrame) -> None:
+    for _, series in df.items():
+        series.map(type).unique()
+        series.dropna().map(type).unique()
+        strings = series.astype('str')
+        strings.map(len).max()
+        strings.str.encode('utf-8').map(len).max()
+
+
+def vectorized(df: pd.DataFrame) -> None:
+    for _, series in df.items():
+        _python_type_of(series, skipna=False)
+        _python_type_of(series, skipna=True)
+        strings = series.astype('str')
+        char_lengths = strings.str.len()
+        _max_utf8_length(strings, char_lengths, int(char_lengths.max()))
+
+
+def main() -> None:
+    num_rows_long = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    num_columns_wide = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    frames = {
+        f'long ({num_rows_long} rows x 3 columns)': make_frame(num_rows_long, 3),
+        f'wide (1000 rows x {num_columns_wide} columns)': make_frame(1000, num_columns_wide),
+    }
+    for name, df in frames.items():
+        per_value_secs = min(timeit.repeat(lambda: per_value(df), number=1, repeat=3))
+        vectorized_secs = min(timeit.repeat(lambda: vectorized(df), number=1, repeat=3))
+        print(f"{name}, per-value loops: {per_value_secs * 1000:.1f}ms")
+        print(f"{name}, vectorized:      {vectorized_secs * 1000:.1f}ms "
+              f"({per_value_secs / vectorized_secs:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Microbenchmark: cost of constructing S3 URL objects.
+
+Compares building S3 URL objects with the shared client cache against
+creating a fresh boto3 client and resource for each object, which is
+what each URL object used to do.  No AWS credentials or network
+access are needed--boto3 only talks to S3 when a request is made.
+
+Usage: python tests/benchmarks/s3_url_construction.py [num_urls]
+"""
+import sys
+import timeit
+import boto3
+from records_mover.url.s3.s3_url import S3Url
+
+
+def main() -> None:
+    num_urls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    session = boto3.session.Session(aws_access_key_id='fake',
+                                    aws_secret_access_key='fake',
+                                    region_name='us-east-1')
+
+    def uncached() -> None:
+        for i in range(num_urls):
+            session.client('s3')
+            session.resource('s3')
+
+    def cached() -> None:
+        directory_url = S3Url('s3://bucket/dir/', boto3_session=session)
+        for i in range(num_urls):
+            directory_url.file_in_this_directory(f'file{i:05}').s3_resource
+
+    uncached_secs = min(timeit.repeat(uncached, number=1, repeat=3))
+    cached_secs = min(timeit.repeat(cached, number=1, repeat=3))
+    print(f"{num_urls} URL objects, new client+resource each: "
+          f"{uncached_secs * 1000:.1f}ms ({uncached_secs / num_urls * 1000:.2f}ms/object)")
+    print(f"{num_urls} URL objects, shared client+resource:   "
+          f"{cached_secs * 1000:.1f}ms ({cached_secs / num_urls * 1000:.2f}ms/object)")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,9 @@ from records_mover.records.schema.field.constraints import (
     RecordsSchemaFieldDecimalConstraints,
 )
 from records_mover.records.schema.field.statistics import (
+    RecordsSchemaFieldStatistics,
     RecordsSchemaFieldStringStatistics,
+    RecordsSchemaFieldNumericStatistics,
 )
 from records_mover.records.schema.field.representation import RecordsSchemaPandasFieldRepresentation
 from records_mover.records.schema.field import RecordsSchemaField
@@ -27,12 +29,12 @@ class TestPandas(unittest.TestCase):
             'integer': {
                 'series': pd.Series([30, 35, 40]),
                 'constraints_type': RecordsSchemaFieldIntegerConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldNumericStatistics,
             },
             'decimal': {
                 'series': pd.Series([30.0, 35.1, 40.2]),
                 'constraints_type': RecordsSchemaFieldDecimalConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldNumericStatistics,
             },
             'string': {
                 'series': pd.Series(['a', 'b', 'c']),
@@ -42,17 +44,17 @@ class TestPandas(unittest.TestCase):
             'boolean': {
                 'series': pd.Series([True, True, False]),
                 'constraints_type': RecordsSchemaFieldConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldStatistics,
             },
             'date': {
                 'series': pd.Series([datetime.date(2020, 1, 1)]),
                 'constraints_type': RecordsSchemaFieldConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldStatistics,
             },
             'time': {
                 'series': pd.Series([datetime.time(hour=12, minute=0, second=0)]),
                 'constraints_type': RecordsSchemaFieldConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldStatistics,
             },
             'timetz': {
                 'series': pd.Series([datetime.time(hour=12, minute=0, second=0,
@@ -62,12 +64,12 @@ class TestPandas(unittest.TestCase):
                 # have timezones or not.
                 'expected_field_type': 'time',
                 'constraints_type': RecordsSchemaFieldConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldStatistics,
             },
             'datetime': {
                 'series': pd.Series([datetime.datetime(2020, 1, 1, hour=12)]),
                 'constraints_type': RecordsSchemaFieldConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldStatistics,
             },
             'datetimetz': {
                 'series': pd.Series([datetime.datetime(2020, 1, 1, hour=12,
@@ -77,7 +79,7 @@ class TestPandas(unittest.TestCase):
                 # have timezones or not.
                 'expected_field_type': 'datetime',
                 'constraints_type': RecordsSchemaFieldConstraints,
-                'statistics_type': type(None),
+                'statistics_type': RecordsSchemaFieldStatistics,
             }
         }
         for field_type in RECORDS_FIELD_TYPES:
@@ -107,3 +109,103 @@ class TestPandas(unittest.TestCase):
                               fields[field_type]['constraints_type'])
             self.assertEquals(type(returned_field.statistics),
                               fields[field_type]['statistics_type'])
+
+    def test_refine_field_from_series_statistics(self) -> None:
+        field = RecordsSchemaField(name='testfield',
+                                   field_type='decimal',
+                                   constraints=None,
+                                   statistics=None,
+                                   representations={})
+        returned_field = refine_field_from_series(field,
+                                                  pd.Series([1.5, None, -3.0]),
+                                                  total_rows=3,
+                                                  rows_sampled=3)
+        statistics = returned_field.statistics
+        self.assertEqual(statistics.to_data(), {
+            'rows_sampled': 3,
+            'total_rows': 3,
+            'min': '-3.0',
+            'max': '1.5',
+        })
+        self.assertEqual(statistics.null_count, 1)
+        self.assertEqual(statistics.python_types, frozenset([float]))
+
+        # Statistics from later chunks are folded in
+        returned_field = refine_field_from_series(returned_field,
+                                                  pd.Series([10.0]),
+                                                  total_rows=1,
+                                                  rows_sampled=1)
+        self.assertEqual(returned_field.statistics.to_data(), {
+            'rows_sampled': 4,
+            'total_rows': 4,
+            'min': '-3.0',
+            'max': '10.0',
+        })
+
+    def test_refine_field_from_series_string_lengths(self) -> None:
+        field = RecordsSchemaField(name='testfield',
+                                   field_type='string',
+                                   constraints=None,
+                                   statistics=None,
+                                   representations={})
+        returned_field = refine_field_from_series(field,
+                                                  pd.Series(['naïve', 'abc'], dtype=object),
+                                                  total_rows=2,
+                                                  rows_sampled=2)
+        self.assertEqual(returned_field.statistics.to_data(), {
+            'rows_sampled': 2,
+            'total_rows': 2,
+            'max_length_bytes': 6,
+            'max_length_chars': 5,
+        })
+
+    def test_refine_field_from_series_string_lengths_multibyte(self) -> None:
+        field = RecordsSchemaField(name='testfield',
+                                   field_type='string',
+                                   constraints=None,
+                                   statistics=None,
+                                   representations={})
+        # The string with the most characters isn't the one with the
+        # longest encoding
+        series = pd.Series(['abcdefg', '\U0001f600é', None, '€€€'],
+                           dtype=object)
+        returned_field = refine_field_from_series(field,
+                                                  series,
+                                                  total_rows=4,
+                                                  rows_sampled=4)
+        statistics = returned_field.statistics
+        self.assertEqual(statistics.max_length_chars, 7)
+        self.assertEqual(statistics.max_length_bytes, 9)
+        self.assertEqual(statistics.null_count, 1)
+        self.assertEqual(statistics.python_types, frozenset([str]))
+
+    def test_refine_field_from_series_mixed_types(self) -> None:
+        field = RecordsSchemaField(name='testfield',
+                                   field_type='string',
+                                   constraints=None,
+                                   statistics=None,
+                                   representations={})
+        returned_field = refine_field_from_series(field,
+                                                  pd.Series([1, 'a', None], dtype=object),
+                                                  total_rows=3,
+                                                  rows_sampled=3)
+        self.assertEqual(returned_field.field_type, 'string')
+        self.assertEqual(returned_field.statistics.python_types, frozenset([int, str]))
+
+    def test_refine_field_from_series_mixed_dates_and_datetimes(self) -> None:
+        field = RecordsSchemaField(name='testfield',
+                                   field_type='string',
+                                   constraints=None,
+                                   statistics=None,
+                                   representations={})
+        series = pd.Series([datetime.date(2020, 1, 1),
+                            datetime.datetime(2020, 1, 1, 12, 30),
+                            None], dtype=object)
+        returned_field = refine_field_from_series(field,
+                                                  series,
+                                                  total_rows=3,
+                                                  rows_sampled=3)
+        # Not narrowed to a date, which would drop the time
+        self.assertEqual(returned_field.field_type, 'string')
+        self.assertEqual(returned_field.statistics.python_types,
+                         frozenset([datetime.date, datetime.datetime]))
@@ -0,0 +1,36 @@
+from records_mover.records.sources.dataframes import DataframesRecordsSource
+from records_mover.records.records_format import DelimitedRecordsFormat
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.schema import RecordsSchema
+import pandas as pd
+import unittest
+
+
+class TestDataframesRecordsSourcePipelined(unittest.TestCase):
+    def test_to_fileobjs_source_pipelined_single_header(self):
+        dfs = [
+            pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}),
+            pd.DataFrame({'a': [3], 'b': ['z']}),
+            pd.DataFrame({'a': [4], 'b': ['w']}),
+        ]
+        processing_instructions = ProcessingInstructions(max_chunks_in_flight=1)
+        records_schema = RecordsSchema.from_data({
+            'schema': 'bltypes/v1',
+            'fields': {
+                'a': {'type': 'integer'},
+                'b': {'type': 'string'},
+            }
+        })
+        source = DataframesRecordsSource(dfs=dfs,
+                                         processing_instructions=processing_instructions,
+                                         records_schema=records_schema)
+        records_format = DelimitedRecordsFormat(variant='csv',
+                                                hints={'compression': None})
+        with source.to_fileobjs_source(processing_instructions=processing_instructions,
+                                       records_format_if_possible=records_format)\
+                as fileobjs_source:
+            self.assertEqual(list(fileobjs_source.target_names_to_input_fileobjs.keys()),
+                             ['data001.csv'])
+            fileobj = fileobjs_source.target_names_to_input_fileobjs['data001.csv']
+            lines = fileobj.read().decode('utf-8').splitlines()
+        self.assertEqual(lines, ['a,b', '1,x', '2,y', '3,z', '4,w'])
@@ -0,0 +1,62 @@
+from records_mover.url.filesystem import FilesystemDirectoryUrl, FilesystemFileUrl
+from pathlib import Path
+import tempfile
+import unittest
+import io
+import os
+
+
+class TestFilesystemCopy(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def file_url(self, *parts):
+        return FilesystemFileUrl(self.root.joinpath(*parts).as_uri())
+
+    def write(self, contents, *parts):
+        path = self.root.joinpath(*parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(contents)
+
+    def test_file_copy_to(self):
+        self.write(b'a,b\n1,2\n', 'input.csv')
+        out = self.file_url('input.csv').copy_to(self.file_url('output.csv'))
+        self.assertEqual(out.url, self.file_url('output.csv').url)
+        self.assertEqual(self.root.joinpath('output.csv').read_bytes(), b'a,b\n1,2\n')
+
+    def test_concatenate_from(self):
+        self.write(b'1,2\n', 'a.csv')
+        self.write(b'3,4\n', 'b.csv')
+        length = self.file_url('out.csv').concatenate_from([self.file_url('a.csv'),
+                                                            self.file_url('b.csv')])
+        self.assertEqual(length, 8)
+        self.assertEqual(self.root.joinpath('out.csv').read_bytes(), b'1,2\n3,4\n')
+
+    def test_upload_and_download_fileobj(self):
+        self.write(b'abcdef', 'input')
+        with open(self.root / 'input', 'rb') as f:
+            f.read(2)
+            self.assertEqual(self.file_url('output').upload_fileobj(f), 4)
+        self.assertEqual(self.root.joinpath('output').read_bytes(), b'cdef')
+
+        with open(self.root / 'downloaded', 'wb') as f:
+            self.file_url('output').download_fileobj(f)
+        self.assertEqual(self.root.joinpath('downloaded').read_bytes(), b'cdef')
+
+        # Streams which aren't files still work
+        self.assertEqual(self.file_url('from_stream').upload_fileobj(io.BytesIO(b'xyz')), 3)
+        self.assertEqual(self.root.joinpath('from_stream').read_bytes(), b'xyz')
+
+    def test_directory_copy_to_creates_subdirectories(self):
+        self.write(b'1', 'source', 'a')
+        self.write(b'2', 'source', 'sub', 'b')
+        source = FilesystemDirectoryUrl(self.root.joinpath('source').as_uri() + '/')
+        target = FilesystemDirectoryUrl(self.root.joinpath('target').as_uri() + '/')
+        source.copy_to(target)
+        self.assertEqual(self.root.joinpath('target', 'a').read_bytes(), b'1')
+        self.assertEqual(self.root.joinpath('target', 'sub', 'b').read_bytes(), b'2')
+        self.assertEqual(sorted(os.listdir(self.root / 'target')), ['a', 'sub'])
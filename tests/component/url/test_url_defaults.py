@@ -11,6 +11,6 @@ class TestUrl(unittest.TestCase):
     def test_init_urls(self):
         init_urls()
         self.assertEqual(list(resolver.directory_url_ctors.keys()),
-                         ['s3', 'gs', 'file'])
+                         ['s3', 'gs', 'file', 'mem'])
         self.assertEqual(list(resolver.file_url_ctors.keys()),
-                         ['s3', 'gs', 'file', 'http', 'https'])
+                         ['s3', 'gs', 'file', 'http', 'https', 'mem'])
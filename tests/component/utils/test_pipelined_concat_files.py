@@ -0,0 +1,70 @@
+import io
+import unittest
+
+from records_mover.utils.pipelined_concat_files import PipelinedConcatFiles
+
+
+class TestPipelinedConcatFiles(unittest.TestCase):
+    def test_read_reads_in_chunks(self):
+        stream = PipelinedConcatFiles([io.BytesIO(b'abc'), io.BytesIO(b'abcdef'),
+                                       io.BytesIO(b'123')],
+                                      max_files_in_flight=1)
+
+        chunks = iter(lambda: stream.read(6), b'')
+        self.assertEqual(b''.join(chunks), b'abcabcdef123')
+        stream.close()
+
+    def test_read_minus_one(self):
+        stream = PipelinedConcatFiles([io.BytesIO(b'abc'), io.BytesIO(b'abcdef'),
+                                       io.BytesIO(b'123')],
+                                      max_files_in_flight=2)
+        self.assertEqual(stream.read(-1), b'abcabcdef123')
+        self.assertEqual(12, stream.tell())
+        stream.close()
+
+    def test_bounds_files_in_flight(self):
+        produced = []
+        closed = []
+
+        class TrackedBytesIO(io.BytesIO):
+            def close(self):
+                closed.append(self)
+                super().close()
+
+        def files():
+            for i in range(5):
+                # Every file produced before this one but not yet
+                # closed is still 'in flight'
+                self.assertLessEqual(len(produced) - len(closed), 1)
+                f = TrackedBytesIO(str(i).encode())
+                produced.append(f)
+                yield f
+
+        stream = PipelinedConcatFiles(files(), max_files_in_flight=2)
+        self.assertEqual(stream.read(-1), b'01234')
+        stream.close()
+        self.assertEqual(len(produced), 5)
+        self.assertEqual(len(closed), 5)
+
+    def test_exception_in_producer_is_raised_by_reader(self):
+        def files():
+            yield io.BytesIO(b'abc')
+            raise KeyError('whoops')
+
+        stream = PipelinedConcatFiles(files(), max_files_in_flight=1)
+        self.assertEqual(stream.read(3), b'abc')
+        with self.assertRaises(KeyError):
+            stream.read(3)
+        stream.close()
+
+    def test_close_before_finished_reading_closes_files(self):
+        fileobjs = [io.BytesIO(b'abc'), io.BytesIO(b'def'), io.BytesIO(b'ghi')]
+        stream = PipelinedConcatFiles(fileobjs, max_files_in_flight=3)
+        self.assertEqual(stream.read(2), b'ab')
+        stream.close()
+        self.assertTrue(stream.closed)
+        self.assertTrue(fileobjs[0].closed)
+
+    def test_max_files_in_flight_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            PipelinedConcatFiles([], max_files_in_flight=0)
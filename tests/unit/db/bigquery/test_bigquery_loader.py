@@ -247,6 +247,7 @@ class TestBigQueryLoader(unittest.TestCase):
         mock_table = 'mytable'
         mock_load_plan = Mock(name='mock_load_plan')
         mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_load_plan.processing_instructions.max_read_ahead_bytes = None
         mock_target_records_format = mock_load_plan.records_format
         mock_target_records_format.format_type = 'delimited'
         mock_target_records_format.hints = {}
@@ -140,6 +140,7 @@ class TestPostgresLoader(unittest.TestCase):
         mock_schema = Mock(name='schema')
         mock_table = Mock(name='table')
         mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.processing_instructions.max_read_ahead_bytes = None
 
         mock_records_format = Mock(name='records_format',
                                    spec=DelimitedRecordsFormat)
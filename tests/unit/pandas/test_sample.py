@@ -0,0 +1,47 @@
+import unittest
+import pandas as pd
+from pandas import DataFrame
+from records_mover.pandas.sample import sample_rows, reservoir_sample
+
+
+class TestSample(unittest.TestCase):
+    def test_sample_rows(self):
+        df = DataFrame({'a': range(100)})
+        out = sample_rows(df, 10)
+        self.assertEqual(len(out), 10)
+        self.assertEqual(list(out['a']), sorted(out['a']))
+        self.assertEqual(list(out['a']), list(sample_rows(df, 10)['a']))
+
+    def test_sample_rows_all(self):
+        df = DataFrame({'a': range(5)})
+        self.assertIs(sample_rows(df, 10), df)
+
+    def test_reservoir_sample(self):
+        chunks = [DataFrame({'a': range(i, i + 100)}) for i in range(0, 10000, 100)]
+        out, rows_seen = reservoir_sample(chunks, 100)
+        self.assertEqual(rows_seen, 10000)
+        self.assertEqual(len(out), 100)
+        self.assertEqual(list(out.index), list(range(100)))
+        # Kept in order, and spread across the whole stream rather
+        # than favoring the first or last chunks
+        self.assertEqual(list(out['a']), sorted(out['a']))
+        self.assertLess(out['a'].min(), 1000)
+        self.assertGreater(out['a'].max(), 9000)
+        self.assertAlmostEqual(out['a'].mean(), 5000, delta=1000)
+
+    def test_reservoir_sample_repeatable(self):
+        def chunks():
+            return (DataFrame({'a': range(i, i + 10)}) for i in range(0, 100, 10))
+
+        out_1, _ = reservoir_sample(chunks(), 5)
+        out_2, _ = reservoir_sample(chunks(), 5)
+        pd.testing.assert_frame_equal(out_1, out_2)
+
+    def test_reservoir_sample_fewer_rows_than_requested(self):
+        chunks = [DataFrame({'a': [1, 2]}), DataFrame({'a': [3]})]
+        out, rows_seen = reservoir_sample(chunks, 10)
+        self.assertEqual(rows_seen, 3)
+        self.assertEqual(list(out['a']), [1, 2, 3])
+
+    def test_reservoir_sample_no_chunks(self):
+        self.assertEqual(reservoir_sample([], 10), (None, 0))
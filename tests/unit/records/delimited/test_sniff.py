@@ -1,8 +1,11 @@
 from records_mover.records.delimited.sniff import (
-    rewound_fileobj, infer_newline_format, sniff_encoding_hint
+    rewound_fileobj, infer_newline_format, sniff_encoding_hint, read_decompressed_sample,
+    sniff_encoding_hint_from_sample, DecompressedSample, complete_records_from_sample
 )
 from mock import Mock, patch
 import unittest
+import gzip
+import io
 
 
 class TestSniff(unittest.TestCase):
@@ -36,3 +39,37 @@ class TestSniff(unittest.TestCase):
         mock_chardet.result = {}
         out = sniff_encoding_hint(mock_fileobj)
         self.assertIsNone(out)
+
+    def test_read_decompressed_sample(self):
+        data = b'a,b\n' * 100
+        fileobj = io.BytesIO(gzip.compress(data))
+        fileobj.seek(5)
+        sample = read_decompressed_sample(fileobj, 'GZIP', max_bytes=10)
+        self.assertEqual(sample, DecompressedSample(data=data[:10], complete=False))
+        self.assertEqual(fileobj.tell(), 5)
+
+    def test_read_decompressed_sample_complete(self):
+        data = b'a,b\n' * 100
+        sample = read_decompressed_sample(io.BytesIO(data), None, max_bytes=len(data))
+        self.assertEqual(sample, DecompressedSample(data=data, complete=True))
+
+    def test_sniff_encoding_hint_from_sample(self):
+        data = 'Liberté,égalité,fraternité\n'.encode('utf-8')
+        sample = DecompressedSample(data=data, complete=True)
+        self.assertEqual(sniff_encoding_hint_from_sample(sample), 'UTF8')
+
+    def test_complete_records_from_sample_drops_partial_record(self):
+        data = 'a,b\nx,é\ny,é'.encode('utf-8')
+        # Cut part way through the last character too
+        sample = DecompressedSample(data=data[:-1], complete=False)
+        self.assertEqual(complete_records_from_sample(sample, 'UTF8', None),
+                         'a,b\nx,é\n')
+
+    def test_complete_records_from_sample_complete(self):
+        sample = DecompressedSample(data=b'a,b\r\nx,y', complete=True)
+        self.assertEqual(complete_records_from_sample(sample, 'UTF8', '\r\n'),
+                         'a,b\r\nx,y')
+
+    def test_complete_records_from_sample_no_complete_record(self):
+        sample = DecompressedSample(data=b'a,b', complete=False)
+        self.assertEqual(complete_records_from_sample(sample, 'UTF8', '\n'), '')
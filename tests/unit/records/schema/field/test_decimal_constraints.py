@@ -61,3 +61,16 @@ class TestDecimalConstraints(unittest.TestCase):
             'fixed_precision': 123,
             'fixed_scale': 45
         })
+
+    def test_merge(self):
+        a = RecordsSchemaFieldDecimalConstraints(required=False, unique=None,
+                                                 fixed_precision=10, fixed_scale=2,
+                                                 fp_total_bits=32, fp_significand_bits=23)
+        b = RecordsSchemaFieldDecimalConstraints(required=False, unique=None,
+                                                 fixed_precision=12, fixed_scale=2,
+                                                 fp_total_bits=64, fp_significand_bits=53)
+        self.assertEqual(a.merge(b).to_data(), {
+            'required': False,
+            'fp_total_bits': 64,
+            'fp_significand_bits': 53,
+        })
@@ -147,3 +147,69 @@ class TestField(unittest.TestCase):
         series = pd.Series(data)
         new_series = field.cast_series_type(series)
         self.assertEqual(new_series[0], datetime.time(0, 0, 0))
+
+    def test_widest_type(self):
+        self.assertEqual(RecordsSchemaField.widest_type('integer', 'integer'), 'integer')
+        self.assertEqual(RecordsSchemaField.widest_type('integer', 'decimal'), 'decimal')
+        self.assertEqual(RecordsSchemaField.widest_type('datetime', 'date'), 'datetime')
+        self.assertEqual(RecordsSchemaField.widest_type('boolean', 'integer'), 'string')
+
+    def test_merge(self):
+        a = RecordsSchemaField.from_data('a', {
+            'type': 'integer',
+            'constraints': {'required': True, 'min': '0', 'max': '255'},
+        })
+        b = RecordsSchemaField.from_data('a', {
+            'type': 'integer',
+            'constraints': {'required': False, 'min': '-128', 'max': '127'},
+        })
+        self.assertEqual(a.merge(b).to_data(), {
+            'type': 'integer',
+            'constraints': {'required': False, 'min': '-128', 'max': '255'},
+        })
+
+    def test_merge_widens_to_string(self):
+        a = RecordsSchemaField.from_data('a', {
+            'type': 'integer',
+            'constraints': {'required': True},
+        })
+        b = RecordsSchemaField.from_data('a', {
+            'type': 'string',
+            'constraints': {'required': True, 'max_length_chars': 12},
+            'statistics': {'rows_sampled': 10, 'total_rows': 10, 'max_length_chars': 8},
+        })
+        merged = a.merge(b)
+        self.assertEqual(merged.to_data(), {
+            'type': 'string',
+            'constraints': {'required': True},
+        })
+        # Inputs are left as they were
+        self.assertEqual(b.statistics.rows_sampled, 10)
+
+    def test_merge_integer_and_string_statistics(self):
+        integers = {
+            'type': 'integer',
+            'statistics': {'rows_sampled': 3, 'total_rows': 3, 'min': '1', 'max': '300'},
+        }
+        strings = {
+            'type': 'string',
+            'statistics': {'rows_sampled': 2, 'total_rows': 2,
+                           'max_length_bytes': 8, 'max_length_chars': 6},
+        }
+        mock_driver = Mock(name='driver')
+        mock_driver.varchar_length_is_in_chars.return_value = True
+        for a, b in [(integers, strings), (strings, integers)]:
+            merged = RecordsSchemaField.from_data('a', a).\
+                merge(RecordsSchemaField.from_data('a', b))
+            self.assertEqual(merged.to_data(), {
+                'type': 'string',
+                'statistics': {'rows_sampled': 5, 'total_rows': 5,
+                               'max_length_bytes': 8, 'max_length_chars': 6},
+            })
+            self.assertEqual(merged.to_sqlalchemy_type(mock_driver).length, 6)
+
+    def test_merge_different_names(self):
+        a = RecordsSchemaField.from_data('a', {'type': 'integer'})
+        b = RecordsSchemaField.from_data('b', {'type': 'integer'})
+        with self.assertRaises(ValueError):
+            a.merge(b)
@@ -36,3 +36,15 @@ class TestFieldStringConstraints(unittest.TestCase):
         self.assertEqual(str(out),
                          "RecordsSchemaFieldStringConstraints({'required': 'required', "
                          "'unique': 'unique', 'max_length_chars': 123})")
+
+    def test_merge(self):
+        a = RecordsSchemaFieldStringConstraints(required=True, unique=True,
+                                                max_length_bytes=None,
+                                                max_length_chars=10)
+        b = RecordsSchemaFieldStringConstraints(required=True, unique=None,
+                                                max_length_bytes=20,
+                                                max_length_chars=5)
+        self.assertEqual(a.merge(b).to_data(), {
+            'required': True,
+            'max_length_chars': 10,
+        })
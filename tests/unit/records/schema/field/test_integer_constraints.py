@@ -27,3 +27,15 @@ class TestIntegerConstraints(unittest.TestCase):
                                min_=mock_min_,
                                max_=mock_max_)
         self.assertEqual(out, mock_RecordsSchemaFieldIntegerConstraints.return_value)
+
+    def test_merge(self):
+        a = RecordsSchemaFieldIntegerConstraints(required=True, unique=False,
+                                                 min_=-5, max_=10)
+        b = RecordsSchemaFieldIntegerConstraints(required=False, unique=False,
+                                                 min_=0, max_=100)
+        self.assertEqual(a.merge(b).to_data(), {
+            'required': False,
+            'unique': False,
+            'min': '-5',
+            'max': '100',
+        })
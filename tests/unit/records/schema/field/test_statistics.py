@@ -1,6 +1,8 @@
 import unittest
 from mock import Mock
-from records_mover.records.schema.field.statistics import (RecordsSchemaFieldStatistics)
+from records_mover.records.schema.field.statistics import (RecordsSchemaFieldStatistics,
+                                                           RecordsSchemaFieldStringStatistics,
+                                                           RecordsSchemaFieldNumericStatistics)
 
 
 class TestStatistics(unittest.TestCase):
@@ -32,3 +34,103 @@ class TestStatistics(unittest.TestCase):
         stats = RecordsSchemaFieldStatistics.from_data(d, 'integer')
         self.assertEqual(stats.rows_sampled, 123)
         self.assertEqual(stats.total_rows, 123)
+
+    def test_merge(self):
+        stats = RecordsSchemaFieldStatistics(rows_sampled=10, total_rows=20)
+        stats.merge(RecordsSchemaFieldStatistics(rows_sampled=5, total_rows=7))
+        self.assertEqual(stats.to_data(), {
+            'rows_sampled': 15,
+            'total_rows': 27
+        })
+
+    def test_merge_string(self):
+        stats = RecordsSchemaFieldStringStatistics(rows_sampled=10, total_rows=20,
+                                                   max_length_bytes=None,
+                                                   max_length_chars=12)
+        stats.merge(RecordsSchemaFieldStringStatistics(rows_sampled=5, total_rows=7,
+                                                       max_length_bytes=30,
+                                                       max_length_chars=15))
+        # Lengths measured on either side are kept
+        self.assertEqual(stats.to_data(), {
+            'rows_sampled': 15,
+            'total_rows': 27,
+            'max_length_bytes': 30,
+            'max_length_chars': 15
+        })
+
+    def test_merge_null_counts_and_types(self):
+        stats = RecordsSchemaFieldStatistics(rows_sampled=10, total_rows=10,
+                                             null_count=2, python_types=frozenset([int]))
+        stats.merge(RecordsSchemaFieldStatistics(rows_sampled=10, total_rows=10,
+                                                 null_count=3, python_types=frozenset([float])))
+        self.assertEqual(stats.null_count, 5)
+        self.assertEqual(stats.python_types, frozenset([int, float]))
+        stats.merge(RecordsSchemaFieldStatistics(rows_sampled=10, total_rows=10))
+        self.assertIsNone(stats.null_count)
+        self.assertIsNone(stats.python_types)
+
+    def test_numeric_to_and_from_data(self):
+        stats = RecordsSchemaFieldNumericStatistics(rows_sampled=3, total_rows=3,
+                                                    min_=-12345678901234567890,
+                                                    max_=7)
+        data = stats.to_data()
+        self.assertEqual(data, {
+            'rows_sampled': 3,
+            'total_rows': 3,
+            'min': '-12345678901234567890',
+            'max': '7',
+        })
+        out = RecordsSchemaFieldStatistics.from_data(data, 'integer')
+        self.assertEqual((out.min_, out.max_), (-12345678901234567890, 7))
+        out = RecordsSchemaFieldStatistics.from_data({'rows_sampled': 1,
+                                                      'total_rows': 1,
+                                                      'min': '1.5'}, 'decimal')
+        self.assertEqual((out.min_, out.max_), (1.5, None))
+
+    def test_merge_numeric(self):
+        stats = RecordsSchemaFieldNumericStatistics(rows_sampled=3, total_rows=3,
+                                                    min_=0, max_=7)
+        stats.merge(RecordsSchemaFieldNumericStatistics(rows_sampled=3, total_rows=3,
+                                                        min_=-1.5, max_=2))
+        self.assertEqual((stats.min_, stats.max_), (-1.5, 7))
+
+    def test_merge_string_with_other_type(self):
+        stats = RecordsSchemaFieldStringStatistics(rows_sampled=10, total_rows=20,
+                                                   max_length_bytes=12,
+                                                   max_length_chars=12)
+        other = RecordsSchemaFieldNumericStatistics(rows_sampled=5, total_rows=7,
+                                                    min_=1.5, max_=100.25)
+        stats.merge(other.cast('string'))
+        # The decimals' lengths weren't measured, but those of the
+        # strings still apply
+        self.assertEqual(stats.to_data(), {
+            'rows_sampled': 15,
+            'total_rows': 27,
+            'max_length_bytes': 12,
+            'max_length_chars': 12,
+        })
+
+    def test_merge_string_with_non_string_statistics(self):
+        stats = RecordsSchemaFieldStringStatistics(rows_sampled=10, total_rows=20,
+                                                   max_length_bytes=12,
+                                                   max_length_chars=12)
+        stats.merge(RecordsSchemaFieldStatistics(rows_sampled=5, total_rows=7))
+        self.assertEqual((stats.max_length_bytes, stats.max_length_chars), (12, 12))
+
+    def test_cast(self):
+        stats = RecordsSchemaFieldNumericStatistics(rows_sampled=3, total_rows=3,
+                                                    min_=0.5, max_=7.5, null_count=1)
+        self.assertIs(stats.cast('decimal'), stats)
+        out = stats.cast('string')
+        self.assertIs(type(out), RecordsSchemaFieldStringStatistics)
+        self.assertEqual((out.max_length_bytes, out.max_length_chars), (None, None))
+        self.assertEqual(out.null_count, 1)
+        out = stats.cast('boolean')
+        self.assertIs(type(out), RecordsSchemaFieldStatistics)
+
+    def test_cast_integers_to_string(self):
+        stats = RecordsSchemaFieldNumericStatistics(rows_sampled=3, total_rows=3,
+                                                    min_=-1234, max_=56)
+        out = stats.cast('string')
+        self.assertIs(type(out), RecordsSchemaFieldStringStatistics)
+        self.assertEqual((out.max_length_bytes, out.max_length_chars), (5, 5))
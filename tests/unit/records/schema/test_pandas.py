@@ -4,9 +4,42 @@ from mock import Mock, MagicMock, patch
 import numpy as np
 import pandas as pd
 from records_mover.records.schema.schema.pandas import (schema_from_dataframe,
-                                                        refine_schema_from_dataframe)
+                                                        refine_schema_from_dataframe,
+                                                        _refine_fields_in_processes)
+import pickle
 from records_mover.records.processing_instructions import ProcessingInstructions
 from records_mover.records.schema import RecordsSchema
+from records_mover.records.schema.field import RecordsSchemaField
+from records_mover.records.schema.field.numpy import details_from_numpy_dtype
+
+
+class PicklingPool:
+    "Stands in for a process pool, pickling arguments and results as one would"
+
+    def __init__(self, processes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def starmap(self, func, iterable):
+        return [pickle.loads(pickle.dumps(func(*pickle.loads(pickle.dumps(args)))))
+                for args in iterable]
+
+
+class RefinedField:
+    "Picklable field which remembers what it was refined from"
+
+    def __init__(self, name):
+        self.name = name
+
+    def refine_from_series(self, series, **kwargs):
+        self.series = series
+        self.kwargs = kwargs
+        return self
 
 
 class TestPandas(unittest.TestCase):
@@ -52,6 +85,7 @@ class TestPandas(unittest.TestCase):
         mock_df = MagicMock(name='df')
         mock_processing_instructions = Mock(name='processing_instructions')
         mock_processing_instructions.max_inference_rows = 200
+        mock_processing_instructions.max_inference_processes = 1
         mock_total_rows = 100
         mock_df.index.__len__.return_value = mock_total_rows
         mock_rows_sampled = 100
@@ -65,6 +99,81 @@ class TestPandas(unittest.TestCase):
                                                          rows_sampled=mock_rows_sampled,
                                                          total_rows=mock_total_rows)
 
+    @patch('records_mover.records.schema.schema.pandas._refine_fields_in_processes')
+    @patch('records_mover.records.schema.schema.pandas.os')
+    def test_refine_schema_from_dataframe_wide(self,
+                                               mock_os,
+                                               mock_refine_fields_in_processes):
+        mock_os.cpu_count.return_value = 8
+        df = DataFrame({f'col{i}': [i] for i in range(250)})
+        mock_records_schema = Mock(name='records_schema')
+        mock_records_schema.fields = [Mock(name=f'field{i}') for i in range(250)]
+        processing_instructions = ProcessingInstructions(max_inference_processes=4)
+        out = refine_schema_from_dataframe(mock_records_schema,
+                                           df,
+                                           processing_instructions)
+        # Only enough processes to give each a good number of columns
+        mock_refine_fields_in_processes.assert_called_with(mock_records_schema.fields,
+                                                           df,
+                                                           total_rows=1,
+                                                           rows_sampled=1,
+                                                           num_processes=2)
+        self.assertEqual(out.fields, mock_refine_fields_in_processes.return_value)
+
+    @patch('records_mover.records.schema.schema.pandas._process_pool', new=PicklingPool)
+    def test_refine_fields_in_processes(self):
+        df = DataFrame({
+            'a': [1, 2, 3],
+            'b': pd.Series(['x', 'y', None], dtype=object),
+            'c': [1.5, None, 2.5],
+        })
+        fields = []
+        for name in df:
+            field = RefinedField(name)
+            fields.append(field)
+        out = _refine_fields_in_processes(fields, df,
+                                          total_rows=10,
+                                          rows_sampled=3,
+                                          num_processes=2)
+        self.assertEqual([field.name for field in out], ['a', 'b', 'c'])
+        for field in out:
+            pd.testing.assert_series_equal(field.series, df[field.name])
+            self.assertEqual(field.kwargs, {'total_rows': 10, 'rows_sampled': 3})
+
+    @patch('records_mover.records.schema.schema.pandas._process_pool', new=PicklingPool)
+    def test_refine_fields_in_processes_matches_one_process(self):
+        df = DataFrame({
+            'ints_and_nones': pd.Series([1, None, 3], dtype=object),
+            'short_strings_and_nones': pd.Series(['a', None, 'c'], dtype=object),
+            'short_strings_and_nans': pd.Series(['a', np.nan, 'c'], dtype=object),
+            'bools_and_nones': pd.Series([True, None, False], dtype=object),
+            'floats': [1.5, None, 2.5],
+            'ints': [1, 2, 3],
+            'datetimes': pd.to_datetime(['2020-01-01', None, '2020-01-02']),
+        })
+
+        def unrefined_fields():
+            fields = []
+            for name in df:
+                field_type, constraints = details_from_numpy_dtype(df[name].dtype, unique=False)
+                fields.append(RecordsSchemaField(name=name,
+                                                 field_type=field_type,
+                                                 constraints=constraints,
+                                                 statistics=None,
+                                                 representations={}))
+            return fields
+
+        schema = RecordsSchema(fields=unrefined_fields(), known_representations={})
+        in_one_process = refine_schema_from_dataframe(schema, df, ProcessingInstructions())
+        in_processes = _refine_fields_in_processes(unrefined_fields(), df,
+                                                   total_rows=3,
+                                                   rows_sampled=3,
+                                                   num_processes=3)
+        self.assertEqual([field.to_data() for field in in_processes],
+                         [field.to_data() for field in in_one_process.fields])
+        self.assertEqual([field.statistics.python_types for field in in_processes],
+                         [field.statistics.python_types for field in in_one_process.fields])
+
     def test_pandas_numeric_types_and_constraints(self):
         self.maxDiff = None
         # https://docs.scipy.org/doc/numpy/reference/arrays.scalars.html
@@ -1,7 +1,12 @@
 import unittest
 from mock import Mock, patch, ANY
 from pandas import DataFrame
+from pandas.errors import EmptyDataError
 from records_mover.records.schema import RecordsSchema
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.utils.peek_buffered_file import PeekBufferedFile
+import gzip
+import io
 
 
 class TestRecordsSchema(unittest.TestCase):
@@ -71,6 +76,7 @@ class TestRecordsSchema(unittest.TestCase):
         mock_fileobjs = [mock_fileobj]
         mock_records_format = Mock(name='records_format')
         mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.infer_from_whole_stream = False
         mock_fileobj.seekable.return_value = True
         mock_reader = mock_stream_csv.return_value.__enter__.return_value
         data = [
@@ -144,6 +150,104 @@ class TestRecordsSchema(unittest.TestCase):
                          mock_RecordsSchema.from_dataframe.return_value.
                          refine_from_dataframe.return_value)
 
+    @patch('records_mover.records.schema.schema.RecordsSchema')
+    def test_from_fileobjs_infer_from_whole_stream(self,
+                                                   mock_RecordsSchema):
+        # Sorted so that the first rows have no value for b
+        data = b'a,b\n' + b''.join(f'{i},\n'.encode('utf-8') for i in range(50)) +\
+            b''.join(f'{i},foo\n'.encode('utf-8') for i in range(50, 100))
+        fileobj = io.BytesIO(data)
+        mock_records_format = Mock(name='records_format')
+        mock_records_format.hints = {
+            'compression': None,
+            'encoding': 'UTF8',
+            'field-delimiter': ',',
+            'record-terminator': '\n',
+            'header-row': True,
+            'quoting': None,
+            'escape': None,
+        }
+        processing_instructions = ProcessingInstructions(max_inference_rows=10,
+                                                         infer_from_whole_stream=True)
+        RecordsSchema.from_fileobjs([fileobj],
+                                    mock_records_format,
+                                    processing_instructions)
+        df = mock_RecordsSchema.from_dataframe.mock_calls[0][1][0]
+        self.assertEqual(len(df), 10)
+        self.assertEqual(list(df['a']), sorted(df['a']))
+        self.assertTrue(df['a'].max() >= 50)
+        self.assertIn('foo', list(df['b']))
+        self.assertEqual(fileobj.tell(), 0)
+
+    @patch('records_mover.records.schema.schema.RecordsSchema')
+    def test_from_fileobjs_pure_stream(self,
+                                       mock_RecordsSchema):
+        data = b'a,b\n' + b'1,foo\n' * 100
+        pipe = io.BytesIO(gzip.compress(data))
+        pipe.seekable = lambda: False  # type: ignore
+        fileobj = PeekBufferedFile(pipe, max_buffer_bytes=200)
+        mock_records_format = Mock(name='records_format')
+        mock_records_format.hints = {
+            'compression': 'GZIP',
+            'encoding': 'UTF8',
+            'field-delimiter': ',',
+            'record-terminator': '\n',
+            'header-row': True,
+            'quoting': None,
+            'escape': None,
+        }
+        mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.max_inference_rows = None
+        RecordsSchema.from_fileobjs([fileobj],
+                                    mock_records_format,
+                                    mock_processing_instructions)
+        df = mock_RecordsSchema.from_dataframe.mock_calls[0][1][0]
+        # Only the records which fit in half the buffer are used
+        self.assertEqual(list(df.columns), ['a', 'b'])
+        self.assertEqual(len(df), 16)
+        self.assertEqual(fileobj.tell(), 0)
+        self.assertEqual(gzip.decompress(fileobj.read()), data)
+
+    @patch('records_mover.records.schema.schema._infer_schema_from_fileobj')
+    def test_from_fileobjs_multiple(self,
+                                    mock_infer_schema_from_fileobj):
+        def schema(field_type):
+            return RecordsSchema.from_data({
+                'schema': 'bltypes/v1',
+                'fields': {'a': {'type': field_type}},
+            })
+
+        mock_fileobjs = [Mock(name=f'fileobj{i}') for i in range(4)]
+        mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.max_inference_rows = 10
+        mock_processing_instructions.max_inference_workers = 2
+        mock_records_format = Mock(name='records_format')
+        mock_infer_schema_from_fileobj.side_effect = [
+            (5, schema('integer')),
+            EmptyDataError('No columns to parse from file'),
+            (0, schema('string')),
+            (5, schema('decimal')),
+        ]
+        out = RecordsSchema.from_fileobjs(mock_fileobjs,
+                                          mock_records_format,
+                                          mock_processing_instructions)
+        # Files without records don't make every field a string
+        self.assertEqual([field.field_type for field in out.fields], ['decimal'])
+        # The row budget is spread across the files
+        for mock_fileobj in mock_fileobjs:
+            mock_infer_schema_from_fileobj.assert_any_call(mock_fileobj,
+                                                           mock_records_format,
+                                                           mock_processing_instructions,
+                                                           3)
+
+    def test_merge_different_fields(self):
+        a = RecordsSchema.from_data({'schema': 'bltypes/v1',
+                                     'fields': {'a': {'type': 'integer'}}})
+        b = RecordsSchema.from_data({'schema': 'bltypes/v1',
+                                     'fields': {'b': {'type': 'integer'}}})
+        with self.assertRaises(ValueError):
+            a.merge(b)
+
     @patch('records_mover.records.schema.schema.pandas.refine_schema_from_dataframe')
     def test_refine_from_dataframe(self,
                                    mock_refine_schema_from_dataframe):
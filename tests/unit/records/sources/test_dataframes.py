@@ -26,6 +26,7 @@ class TestDataframesRecordsSource(unittest.TestCase):
         mock_df_2 = Mock(name='df_2')
         mock_processing_instructions = Mock(name='processing_instructions')
         mock_processing_instructions.max_inference_rows = 10
+        mock_processing_instructions.max_chunks_in_flight = None
         mock_include_index = Mock(name='include_index')
         dataframe_records_source =\
             DataframesRecordsSource(dfs=[mock_df_1, mock_df_2],
@@ -83,8 +84,13 @@ class TestDataframesRecordsSource(unittest.TestCase):
                     "data001.csv": mock_data_fileobj_1,
                     "data002.csv": mock_data_fileobj_2,
                 },
-                                   records_schema=mock_target_records_schema,
+                                   records_schema=mock_target_records_schema.merge.return_value,
                                    records_format=mock_target_records_format)
+            # Later chunks are folded into the schema inferred from the first
+            mock_RecordsSchema.from_dataframe.assert_called_with(mock_df_2,
+                                                                 mock_processing_instructions,
+                                                                 include_index=mock_include_index)
+            mock_target_records_schema.merge.assert_called_with(mock_target_records_schema)
             self.assertEqual(fileobjs, mock_FileobjsSource.return_value)
             mock_data_fileobj_1.close.assert_not_called()
             mock_data_fileobj_2.close.assert_not_called()
@@ -111,6 +117,7 @@ class TestDataframesRecordsSource(unittest.TestCase):
         mock_df_2 = Mock(name='df_2')
         mock_processing_instructions = Mock(name='processing_instructions')
         mock_processing_instructions.max_inference_rows = 10
+        mock_processing_instructions.max_chunks_in_flight = None
         mock_include_index = Mock(name='include_index')
         dataframe_records_source =\
             DataframesRecordsSource(dfs=[mock_df_1, mock_df_2],
@@ -155,8 +162,13 @@ class TestDataframesRecordsSource(unittest.TestCase):
                     "data001.parquet": mock_data_fileobj_1,
                     "data002.parquet": mock_data_fileobj_2,
                 },
-                                   records_schema=mock_target_records_schema,
+                                   records_schema=mock_target_records_schema.merge.return_value,
                                    records_format=mock_target_records_format)
+            # Later chunks are folded into the schema inferred from the first
+            mock_RecordsSchema.from_dataframe.assert_called_with(mock_df_2,
+                                                                 mock_processing_instructions,
+                                                                 include_index=mock_include_index)
+            mock_target_records_schema.merge.assert_called_with(mock_target_records_schema)
             self.assertEqual(fileobjs, mock_FileobjsSource.return_value)
             mock_data_fileobj_1.close.assert_not_called()
             mock_data_fileobj_2.close.assert_not_called()
@@ -9,12 +9,12 @@ class TestRecordsDirectoryRecordsSource(unittest.TestCase):
         self.mock_directory = Mock(name='directory')
         self.mock_records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
         self.mock_directory.load_format.return_value = self.mock_records_format
-        mock_url_resolver = MagicMock(name='url_resolver')
+        self.mock_url_resolver = MagicMock(name='url_resolver')
         self.mock_override_hints = Mock(name='overrride_hints')
         self.source =\
             RecordsDirectoryRecordsSource(directory=self.mock_directory,
                                           fail_if_dont_understand=True,
-                                          url_resolver=mock_url_resolver,
+                                          url_resolver=self.mock_url_resolver,
                                           override_hints=self.mock_override_hints)
 
     def test_init(self):
@@ -37,9 +37,11 @@ class TestRecordsDirectoryRecordsSource(unittest.TestCase):
                 to_fileobjs_source(processing_instructions=mock_processing_instructions) as f:
             self.assertEqual(mock_infer_if_needed.return_value.__enter__.return_value, f)
             mock_records_schema = self.mock_directory.load_schema_json_obj.return_value
+            mock_loc = self.mock_url_resolver.cached_file_url.return_value
             mock_infer_if_needed.\
                 assert_called_with(ANY,
                                    initial_hints=None,
                                    processing_instructions=mock_processing_instructions,
                                    records_format=self.mock_records_format.alter_hints.return_value,
-                                   records_schema=mock_records_schema)
+                                   records_schema=mock_records_schema,
+                                   input_locs={mock_loc.filename.return_value: mock_loc})
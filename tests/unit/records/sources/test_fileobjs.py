@@ -1,6 +1,11 @@
 from records_mover.records.sources.fileobjs import FileobjsSource
 from records_mover.records.records_format import DelimitedRecordsFormat
+from records_mover.utils.peek_buffered_file import PeekBufferedFile
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.schema import RecordsSchema
 from mock import Mock, patch
+import io
+import tempfile
 import unittest
 
 
@@ -14,13 +19,37 @@ class TestFileobjsSource(unittest.TestCase):
         }
         mock_records_schema = Mock(name='records_schema')
         mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.inference_cache_dir = None
         with FileobjsSource.\
                 infer_if_needed(target_names_to_input_fileobjs=mock_target_names_to_input_fileobjs,
                                 processing_instructions=mock_processing_instructions,
                                 records_schema=mock_records_schema,
                                 records_format=None,
                                 initial_hints={}):
-            mock_sniff_hints_from_fileobjs.assert_called_with([mock_fileobj], initial_hints={})
+            mock_sniff_hints_from_fileobjs.\
+                assert_called_with([mock_fileobj], initial_hints={},
+                                   max_workers=mock_processing_instructions.max_inference_workers)
+
+    @patch('records_mover.records.sources.fileobjs.sniff_hints_from_fileobjs')
+    def test_infer_if_needed_pure_stream(self,
+                                         mock_sniff_hints_from_fileobjs):
+        mock_fileobj = Mock(name='fileobj')
+        mock_fileobj.seekable.return_value = False
+        mock_target_names_to_input_fileobjs = {
+            'foo': mock_fileobj
+        }
+        mock_records_schema = Mock(name='records_schema')
+        mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.inference_cache_dir = None
+        with FileobjsSource.\
+                infer_if_needed(target_names_to_input_fileobjs=mock_target_names_to_input_fileobjs,
+                                processing_instructions=mock_processing_instructions,
+                                records_schema=mock_records_schema,
+                                records_format=None,
+                                initial_hints={}) as out:
+            sniffed_fileobj = mock_sniff_hints_from_fileobjs.call_args[0][0][0]
+            self.assertIsInstance(sniffed_fileobj, PeekBufferedFile)
+            self.assertIs(out.target_names_to_input_fileobjs['foo'], sniffed_fileobj)
 
     @patch('records_mover.records.sources.fileobjs.sniff_hints_from_fileobjs')
     def test_infer_if_needed_no_format_no_initial_hints(self,
@@ -31,13 +60,16 @@ class TestFileobjsSource(unittest.TestCase):
         }
         mock_records_schema = Mock(name='records_schema')
         mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.inference_cache_dir = None
         with FileobjsSource.\
                 infer_if_needed(target_names_to_input_fileobjs=mock_target_names_to_input_fileobjs,
                                 processing_instructions=mock_processing_instructions,
                                 records_schema=mock_records_schema,
                                 records_format=None,
                                 initial_hints=None):
-            mock_sniff_hints_from_fileobjs.assert_called_with([mock_fileobj], initial_hints={})
+            mock_sniff_hints_from_fileobjs.\
+                assert_called_with([mock_fileobj], initial_hints={},
+                                   max_workers=mock_processing_instructions.max_inference_workers)
 
     @patch('records_mover.records.sources.fileobjs.RecordsSchema')
     @patch('records_mover.records.sources.fileobjs.DelimitedRecordsFormat')
@@ -51,6 +83,7 @@ class TestFileobjsSource(unittest.TestCase):
             'foo': mock_fileobj
         }
         mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.inference_cache_dir = None
         mock_records_format = mock_DelimitedRecordsFormat.return_value
         mock_records_schema = mock_RecordsSchema.from_fileobjs.return_value
         with FileobjsSource.\
@@ -59,7 +92,9 @@ class TestFileobjsSource(unittest.TestCase):
                                 records_schema=None,
                                 records_format=None,
                                 initial_hints=None) as out:
-            mock_sniff_hints_from_fileobjs.assert_called_with([mock_fileobj], initial_hints={})
+            mock_sniff_hints_from_fileobjs.\
+                assert_called_with([mock_fileobj], initial_hints={},
+                                   max_workers=mock_processing_instructions.max_inference_workers)
             self.assertEqual(out.records_format, mock_records_format)
             self.assertEqual(out.records_schema, mock_records_schema)
         mock_RecordsSchema.from_fileobjs.\
@@ -80,6 +115,7 @@ class TestFileobjsSource(unittest.TestCase):
                                                                         1, 2,
                                                                         'reason')
         mock_processing_instructions = Mock(name='processing_instructions')
+        mock_processing_instructions.inference_cache_dir = None
         with self.assertRaises(TypeError):
             with FileobjsSource.\
                  infer_if_needed(target_names_to_input_fileobjs=mock_target_names_to_input_fileobjs,
@@ -89,6 +125,42 @@ class TestFileobjsSource(unittest.TestCase):
                                  initial_hints={}):
                 pass
 
+    @patch('records_mover.records.sources.fileobjs.RecordsSchema')
+    @patch('records_mover.records.sources.fileobjs.sniff_hints_from_fileobjs')
+    def test_infer_if_needed_inference_cache(self,
+                                             mock_sniff_hints_from_fileobjs,
+                                             mock_RecordsSchema):
+        mock_sniff_hints_from_fileobjs.return_value = {'field-delimiter': '\t'}
+        schema = RecordsSchema.from_data({
+            'schema': 'bltypes/v1',
+            'fields': {'a': {'type': 'integer'}},
+        })
+        mock_RecordsSchema.from_fileobjs.return_value = schema
+        with tempfile.TemporaryDirectory() as cache_dir:
+            processing_instructions = ProcessingInstructions(inference_cache_dir=cache_dir)
+
+            def infer(contents):
+                with FileobjsSource.\
+                        infer_if_needed(target_names_to_input_fileobjs={
+                                            'foo': io.BytesIO(contents)
+                                        },
+                                        processing_instructions=processing_instructions,
+                                        records_schema=None,
+                                        records_format=None,
+                                        initial_hints=None) as out:
+                    return out
+
+            first = infer(b'a\n1\n')
+            second = infer(b'a\n1\n')
+            self.assertEqual(mock_sniff_hints_from_fileobjs.call_count, 1)
+            self.assertEqual(mock_RecordsSchema.from_fileobjs.call_count, 1)
+            self.assertEqual(second.records_format, first.records_format)
+            self.assertEqual(second.records_schema.to_data(), schema.to_data())
+
+            infer(b'a\n2\n')
+            self.assertEqual(mock_sniff_hints_from_fileobjs.call_count, 2)
+            self.assertEqual(mock_RecordsSchema.from_fileobjs.call_count, 2)
+
     def test_known_supported_records_formats(self):
         mock_records_format = Mock(name='records_format')
         mock_records_schema = Mock(name='records_schema')
@@ -187,9 +259,12 @@ class TestFileobjsSource(unittest.TestCase):
         out = source.move_to_records_directory(mock_records_directory,
                                                mock_records_format,
                                                mock_processing_instructions)
-        mock_records_directory.save_fileobjs.assert_called_with(mock_target_names_to_input_fileobjs,
-                                                                records_format=mock_records_format,
-                                                                records_schema=mock_records_schema)
+        mock_pi = mock_processing_instructions
+        mock_records_directory.save_fileobjs.\
+            assert_called_with(mock_target_names_to_input_fileobjs,
+                               records_format=mock_records_format,
+                               records_schema=mock_records_schema,
+                               max_upload_workers=mock_pi.max_upload_workers)
         mock_MoveResult.assert_called_with(move_count=None,
                                            output_urls={'file.mumble': 'vmb://dir/file.mumble'})
         self.assertEqual(out, mock_MoveResult.return_value)
@@ -27,6 +27,7 @@ class TestDoMoveFromFileobjsSource(unittest.TestCase):
         }
         self.mock_fileobj = mock_fileobj_a
         self.mock_plan = self.mock_RecordsLoadPlan.return_value
+        self.mock_plan.processing_instructions.max_read_ahead_bytes = None
         self.algo =\
             DoMoveFromFileobjsSource(prep=self.mock_prep,
                                      target_table_details=self.mock_tbl,
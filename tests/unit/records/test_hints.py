@@ -1,8 +1,10 @@
 from records_mover.records.delimited.sniff import (
-    sniff_hints_from_fileobjs, PartialRecordsHints
+    sniff_hints_from_fileobjs, reconcile_hints, PartialRecordsHints
 )
-from mock import MagicMock, patch
+from mock import patch
 from typing import List, IO
+import gzip
+import io
 import unittest
 
 
@@ -11,26 +13,19 @@ class TestHints(unittest.TestCase):
 
     @patch('records_mover.records.delimited.sniff.csv')
     @patch('records_mover.records.delimited.sniff.stream_csv')
-    @patch('records_mover.records.delimited.sniff.io')
     def test_sniff_hints_from_fileobjs(self,
-                                       mock_io,
                                        mock_stream_csv,
                                        mock_csv) -> None:
-        mock_fileobj = MagicMock(name='fileobj')
-        mock_fileobj.closed = False
-        mock_fileobjs: List[IO[bytes]] = [mock_fileobj]
+        fileobj = io.BytesIO(gzip.compress(b'a,b\n1,2\n'))
+        fileobjs: List[IO[bytes]] = [fileobj]
         mock_initial_hints: PartialRecordsHints = {
             'field-delimiter': ','
         }
-        mock_streaming_engine = mock_stream_csv.return_value.__enter__.return_value._engine
-        mock_io.TextIOWrapper.return_value.newlines = '\n'
-        mock_streaming_engine.compression = 'gzip'
-        mock_streaming_engine.encoding = 'utf-8'
         mock_sniffer = mock_csv.Sniffer.return_value
         mock_sniff_results = mock_sniffer.sniff.return_value
         mock_sniff_results.doublequote = True
         mock_sniffer.has_header.return_value = False
-        out = sniff_hints_from_fileobjs(fileobjs=mock_fileobjs,
+        out = sniff_hints_from_fileobjs(fileobjs=fileobjs,
                                         initial_hints=mock_initial_hints)
         self.assertEqual(out, {
             'compression': 'GZIP',
@@ -40,5 +35,53 @@ class TestHints(unittest.TestCase):
             'quoting': 'minimal',
             'field-delimiter': ',',
             'header-row': False,
-            'record-terminator': str(mock_io.TextIOWrapper.return_value.newlines),
+            'record-terminator': '\n',
         })
+        # Everything was sniffed from one decompressed sample
+        mock_sniffer.sniff.assert_any_call('a,b\n1,2\n')
+        self.assertEqual(fileobj.tell(), 0)
+
+    @patch('records_mover.records.delimited.sniff.sniff_hints')
+    def test_sniff_hints_from_multiple_fileobjs(self,
+                                                mock_sniff_hints) -> None:
+        fileobjs: List[IO[bytes]] = [io.BytesIO(b'') for _ in range(20)]
+        initial_hints: PartialRecordsHints = {}
+        mock_sniff_hints.return_value = {'compression': None}
+        out = sniff_hints_from_fileobjs(fileobjs=fileobjs,
+                                        initial_hints=initial_hints,
+                                        max_workers=4)
+        self.assertEqual(out, {'compression': None})
+        sniffed = [call[0][0] for call in mock_sniff_hints.call_args_list]
+        # An evenly spread sample, rather than every file
+        self.assertCountEqual(sniffed, [fileobjs[i] for i in [0, 2, 5, 7, 10, 12, 15, 17]])
+
+    def test_sniff_hints_from_multiple_fileobjs_with_empty_files(self) -> None:
+        fileobjs: List[IO[bytes]] = [
+            io.BytesIO(b''),
+            io.BytesIO(gzip.compress(b'a\tb\n1\t2\n')),
+            io.BytesIO(gzip.compress(b'a\tb\n3\t4\n')),
+        ]
+        out = sniff_hints_from_fileobjs(fileobjs=fileobjs,
+                                        initial_hints={},
+                                        max_workers=2)
+        self.assertEqual(out['compression'], 'GZIP')
+        self.assertEqual(out['field-delimiter'], '\t')
+
+    def test_reconcile_hints(self) -> None:
+        out = reconcile_hints([
+            {'compression': 'GZIP', 'header-row': True},
+            {'compression': None, 'header-row': True},
+            {'compression': None, 'quoting': 'minimal'},
+        ])
+        self.assertEqual(out, {
+            'compression': None,
+            'header-row': True,
+            'quoting': 'minimal',
+        })
+
+    def test_reconcile_hints_tie_goes_to_first(self) -> None:
+        out = reconcile_hints([
+            {'header-row': False},
+            {'header-row': True},
+        ])
+        self.assertEqual(out, {'header-row': False})
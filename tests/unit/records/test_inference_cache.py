@@ -0,0 +1,99 @@
+from records_mover.records.inference_cache import InferenceCache, fingerprint_fileobj
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.records_format import DelimitedRecordsFormat
+from records_mover.records.schema import RecordsSchema
+from records_mover.utils.peek_buffered_file import PeekBufferedFile
+from mock import Mock, patch
+import io
+import os
+import tempfile
+import unittest
+
+
+class TestInferenceCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = InferenceCache(self.tempdir.name, ttl_seconds=60, max_entries=2)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_fingerprint_fileobj(self):
+        fileobj = io.BytesIO(b'a,b\n1,2\n')
+        fileobj.seek(3)
+        fingerprint = fingerprint_fileobj(fileobj)
+        self.assertEqual(fileobj.tell(), 0)
+        self.assertEqual(fingerprint, fingerprint_fileobj(io.BytesIO(b'a,b\n1,2\n')))
+        self.assertNotEqual(fingerprint, fingerprint_fileobj(io.BytesIO(b'a,b\n1,3\n')))
+
+    def test_fingerprint_fileobj_loc(self):
+        mock_loc = Mock(name='loc')
+        mock_loc.url = 's3://bucket/file.csv'
+        mock_loc.content_version.return_value = '"etag1"'
+        fingerprint = fingerprint_fileobj(io.BytesIO(b'abc'), mock_loc)
+        mock_loc.content_version.return_value = '"etag2"'
+        self.assertNotEqual(fingerprint, fingerprint_fileobj(io.BytesIO(b'abc'), mock_loc))
+
+    def test_fingerprint_fileobj_pure_stream(self):
+        pipe = io.BytesIO(b'abc')
+        pipe.seekable = lambda: False  # type: ignore
+        self.assertIsNone(fingerprint_fileobj(pipe))
+        fileobj = PeekBufferedFile(pipe)
+        self.assertIsNone(fingerprint_fileobj(fileobj))
+        mock_loc = Mock(name='loc')
+        mock_loc.url = 's3://bucket/file.csv'
+        mock_loc.content_version.return_value = '"etag"'
+        self.assertIsNotNone(fingerprint_fileobj(fileobj, mock_loc))
+        self.assertEqual(fileobj.read(), b'abc')
+
+    def test_hints(self):
+        key = InferenceCache.hints_key(['fingerprint'], {'compression': None})
+        self.assertIsNone(self.cache.get_hints(key))
+        self.cache.put_hints(key, {'compression': None, 'field-delimiter': '\t'})
+        self.assertEqual(self.cache.get_hints(key),
+                         {'compression': None, 'field-delimiter': '\t'})
+        self.assertNotEqual(key, InferenceCache.hints_key(['fingerprint'],
+                                                          {'compression': 'GZIP'}))
+
+    def test_schema(self):
+        records_format = DelimitedRecordsFormat(variant='csv')
+        processing_instructions = ProcessingInstructions()
+        key = InferenceCache.schema_key(['fingerprint'], records_format, processing_instructions)
+        schema = RecordsSchema.from_data({
+            'schema': 'bltypes/v1',
+            'fields': {'a': {'type': 'integer'}},
+        })
+        self.cache.put_schema(key, schema)
+        self.assertEqual(self.cache.get_schema(key).to_data(), schema.to_data())
+        self.assertNotEqual(key, InferenceCache.schema_key(['fingerprint'],
+                                                           DelimitedRecordsFormat(variant='csv',
+                                                                                  hints={
+                                                                                      'quoting':
+                                                                                      None
+                                                                                  }),
+                                                           processing_instructions))
+        self.assertNotEqual(key, InferenceCache.schema_key(['fingerprint'],
+                                                           records_format,
+                                                           ProcessingInstructions(
+                                                               max_inference_rows=10)))
+
+    @patch('records_mover.records.inference_cache.time')
+    def test_expired(self, mock_time):
+        mock_time.time.return_value = 1000.0
+        self.cache.put_hints('key', {})
+        mock_time.time.return_value = 1059.0
+        self.assertEqual(self.cache.get_hints('key'), {})
+        mock_time.time.return_value = 1061.0
+        self.assertIsNone(self.cache.get_hints('key'))
+        self.assertEqual(os.listdir(self.tempdir.name), [])
+
+    def test_least_recently_used_evicted(self):
+        for i, key in enumerate(['key0', 'key1']):
+            self.cache.put_hints(key, {})
+            os.utime(os.path.join(self.tempdir.name, f'{key}.json'), (i, i))
+        # Using key0 makes key1 the least recently used
+        self.cache.get_hints('key0')
+        self.cache.put_hints('key2', {})
+        self.assertEqual(self.cache.get_hints('key0'), {})
+        self.assertIsNone(self.cache.get_hints('key1'))
+        self.assertEqual(self.cache.get_hints('key2'), {})
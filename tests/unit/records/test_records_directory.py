@@ -2,7 +2,8 @@ import unittest
 from records_mover.records.records_directory import RecordsDirectory
 from records_mover.records.records_format import DelimitedRecordsFormat
 from records_mover.url.base import BaseDirectoryUrl
-from mock import Mock, patch, call
+from mock import Mock, patch, call, ANY
+import logging
 import json
 
 
@@ -99,7 +100,7 @@ class TestRecordsDirectory(unittest.TestCase):
             '"meta": {"content_length": 123}}]}'
         mock_manifest_loc.store_string.\
             assert_called_with(expected_manifest)
-        self.mock_records_loc.file_in_this_directory.assert_called_with('manifest')
+        self.mock_records_loc.file_in_this_directory.assert_any_call('manifest')
 
     @patch('records_mover.records.records_directory.RecordsDirectory')
     @patch('records_mover.records.records_directory.json')
@@ -260,6 +261,49 @@ class TestRecordsDirectory(unittest.TestCase):
         mock_output_loc.concatenate_from.assert_called_with([mock_csv_1_loc,
                                                              mock_csv_2_loc])
 
+    @patch('records_mover.records.records_directory.wait_for')
+    def test_await_completion(self, mock_wait_for):
+        mock_manifest_loc = Mock(name='manifest_loc')
+        self.mock_records_loc.file_in_this_directory.return_value = mock_manifest_loc
+        self.mock_records_loc.url = 's3://bucket/dir/'
+        mock_manifest_loc.json_contents.return_value = {
+            'entries': [
+                {'url': 's3://bucket/dir/a.csv', 'mandatory': True},
+                {'url': 's3://bucket/dir/b.csv', 'mandatory': True},
+            ]
+        }
+        mock_file_a = Mock(name='file_a')
+        mock_file_a.filename.return_value = 'a.csv'
+        mock_file_b = Mock(name='file_b')
+        mock_file_b.filename.return_value = 'b.csv'
+        self.mock_records_loc.files_in_directory.side_effect = [
+            [mock_file_a],
+            [mock_file_a, mock_file_b],
+        ]
+        self.records_directory.await_completion(manifest_filename='manifest',
+                                                ms_between_polls=5000,
+                                                timeout_seconds=None)
+        self.mock_records_loc.file_in_this_directory.assert_any_call('manifest')
+        mock_manifest_loc.wait_to_exist.assert_called_with(log_level=logging.INFO,
+                                                           ms_between_polls=5000,
+                                                           max_ms_between_polls=ANY,
+                                                           timeout_seconds=None)
+        check = mock_wait_for.call_args[0][0]
+        describe = mock_wait_for.call_args[1]['description']
+        self.assertFalse(check())
+        self.assertEqual(describe(), '1 of 2 files to appear in s3://bucket/dir/')
+        self.assertTrue(check())
+        # One listing per poll, no matter how many files
+        self.assertEqual(self.mock_records_loc.files_in_directory.call_count, 2)
+
+    @patch('records_mover.records.records_directory.wait_for')
+    def test_await_completion_strongly_consistent(self, mock_wait_for):
+        self.mock_records_loc.eventually_consistent = False
+        self.records_directory.await_completion()
+        self.mock_records_loc.file_in_this_directory.assert_not_called()
+        self.mock_records_loc.files_in_directory.assert_not_called()
+        mock_wait_for.assert_not_called()
+
     def test_str(self):
         self.assertEqual(str(self.records_directory),
                          f"RecordsDirectory({self.mock_records_loc.url})")
@@ -61,3 +61,25 @@ class TestRecordsDirectorySchema(unittest.TestCase):
         mock_target_loc = self.mock_records_loc.file_in_this_directory.return_value
         self.mock_records_loc.file_in_this_directory.assert_called_with('name.csv')
         mock_target_loc.upload_fileobj.assert_called_with(mock_fileobj)
+
+    def test_save_data_from_fileobjs_concurrently(self):
+        lengths = {'data001.csv': 11, 'data002.csv': 12, 'data003.csv': 13}
+        fileobjs_by_target_names = {
+            target_name: Mock(name=target_name)
+            for target_name in lengths
+        }
+
+        def file_in_this_directory(target_name):
+            mock_target_loc = Mock(name=f'target_loc_{target_name}')
+            mock_target_loc.url = f's3://bucket/dir/{target_name}'
+            mock_target_loc.upload_fileobj.return_value = lengths[target_name]
+            return mock_target_loc
+
+        self.mock_records_loc.file_in_this_directory.side_effect = file_in_this_directory
+        out = self.records_directory.save_data_from_fileobjs(fileobjs_by_target_names,
+                                                             max_upload_workers=3)
+        self.assertEqual(list(out.items()), [
+            ('s3://bucket/dir/data001.csv', {'content_length': 11}),
+            ('s3://bucket/dir/data002.csv', {'content_length': 12}),
+            ('s3://bucket/dir/data003.csv', {'content_length': 13}),
+        ])
@@ -21,18 +21,51 @@ class TestS3Url(unittest.TestCase):
         self.assertEqual(gc.url, 's3://mybucket/myparent/mychild/anothergrandchild')
 
     def test_purge_directory(self):
-        self.mock_s3_resource.meta.client.list_objects.return_value = {
+        mock_s3_client = self.mock_boto3_session.client.return_value
+        mock_paginator = mock_s3_client.get_paginator.return_value
+        mock_paginator.paginate.return_value = [{
             'Contents': [{
-                'Key': 'key_to_delete'
+                'Key': 'myparent/mychild/key_to_delete'
             }]
-        }
+        }]
         self.s3_directory_url.purge_directory()
-        self.mock_s3_resource.meta.client.list_objects.\
+        mock_s3_client.get_paginator.assert_called_with('list_objects_v2')
+        mock_paginator.paginate.\
             assert_called_with(Bucket='mybucket',
-                               Prefix='myparent/mychild/')
-        self.mock_s3_resource.meta.client.delete_objects.\
+                               Prefix='myparent/mychild/',
+                               Delimiter='/')
+        mock_s3_client.delete_objects.\
             assert_called_with(Bucket='mybucket',
-                               Delete={'Objects': [{'Key': 'key_to_delete'}]})
+                               Delete={'Objects': [{'Key': 'myparent/mychild/key_to_delete'}]})
+
+    def test_purge_directory_many_keys_in_subdirectories(self):
+        mock_s3_client = self.mock_boto3_session.client.return_value
+        mock_paginator = mock_s3_client.get_paginator.return_value
+
+        def paginate(Bucket, Prefix, Delimiter=None):
+            if Delimiter is not None:
+                return [{
+                    'Contents': [{'Key': 'myparent/mychild/top'}],
+                    'CommonPrefixes': [{'Prefix': 'myparent/mychild/sub/'}],
+                }]
+            # Two pages of keys in the subdirectory
+            return [
+                {'Contents': [{'Key': f'myparent/mychild/sub/{i}'} for i in range(1000)]},
+                {'Contents': [{'Key': f'myparent/mychild/sub/{i}'} for i in range(1000, 1500)]},
+            ]
+
+        mock_paginator.paginate.side_effect = paginate
+        self.s3_directory_url.purge_directory()
+        deleted_keys = [
+            obj['Key']
+            for delete_call in mock_s3_client.delete_objects.call_args_list
+            for obj in delete_call[1]['Delete']['Objects']
+        ]
+        self.assertEqual(mock_s3_client.delete_objects.call_count, 2)
+        self.assertEqual(len(deleted_keys), 1501)
+        self.assertEqual(set(deleted_keys),
+                         set(['myparent/mychild/top'] +
+                             [f'myparent/mychild/sub/{i}' for i in range(1500)]))
 
     def test_directory_in_this_directory_from_directory(self):
         out = self.s3_directory_url.directory_in_this_directory('abc')
@@ -44,11 +77,12 @@ class TestS3Url(unittest.TestCase):
 
     @patch('records_mover.url.base.secrets')
     def test_temporary_directory(self, mock_secrets):
-        self.mock_s3_resource.meta.client.list_objects.return_value = {
+        mock_s3_client = self.mock_boto3_session.client.return_value
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{
             'Contents': [{
                 'Key': 'key_to_delete'
             }]
-        }
+        }]
         mock_secrets.token_urlsafe.return_value = '3MNURWKF'
         with self.s3_directory_url.temporary_directory() as d:
             self.assertEqual(d.url, 's3://mybucket/myparent/mychild/3MNURWKF/')
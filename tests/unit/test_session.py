@@ -307,3 +307,32 @@ class TestSession(unittest.TestCase):
         )
 
         mock_google_auth_default.assert_called_once_with(scopes=expected_scopes)
+
+    @patch.dict('records_mover.session.os.environ', {}, clear=True)
+    @patch('records_mover.session.get_config')
+    def test_gcs_parallel_composite_upload_from_config(self,
+                                                       mock_session_get_config,
+                                                       mock_creds_via_env_os,
+                                                       mock_os,
+                                                       mock_get_config,
+                                                       mock_google_auth_default,
+                                                       mock_google_cloud_storage_Client):
+        mock_session_get_config.return_value.config = {
+            'session': {'session_type': 'env', 'gcs_parallel_composite_upload': True}
+        }
+        session = Session()
+        self.assertTrue(session.url_resolver.gcs_parallel_composite_upload)
+
+    @patch.dict('records_mover.session.os.environ',
+                {'RECORDS_MOVER_SESSION_TYPE': 'env'}, clear=True)
+    @patch('records_mover.session.get_config')
+    def test_gcs_parallel_composite_upload_off_by_default(self,
+                                                          mock_session_get_config,
+                                                          mock_creds_via_env_os,
+                                                          mock_os,
+                                                          mock_get_config,
+                                                          mock_google_auth_default,
+                                                          mock_google_cloud_storage_Client):
+        mock_session_get_config.return_value.config = {}
+        session = Session()
+        self.assertFalse(session.url_resolver.gcs_parallel_composite_upload)
@@ -0,0 +1,174 @@
+from records_mover.url.gcs.gcs_compose import gcs_compose, gcs_parallel_composite_upload
+from mock import Mock
+import google.api_core.exceptions
+import threading
+import io
+import unittest
+
+
+class TestGCSCompose(unittest.TestCase):
+    def setUp(self):
+        self.mock_bucket_obj = Mock(name='bucket_obj')
+        self.mock_bucket_obj.name = 'bucket'
+        self.composed = {}
+        self.deleted = []
+        self.uploaded = {}
+        self.lock = threading.Lock()
+
+        def blob(name):
+            mock_blob = Mock(name=name)
+            mock_blob.name = name
+
+            def compose(sources):
+                with self.lock:
+                    self.composed[name] = [source.name for source in sources]
+
+            def delete():
+                with self.lock:
+                    self.deleted.append(name)
+
+            def upload_from_file(file_obj, size):
+                data = file_obj.read()
+                self.assertEqual(len(data), size)
+                with self.lock:
+                    self.uploaded[name] = data
+
+            mock_blob.compose.side_effect = compose
+            mock_blob.upload_from_file.side_effect = upload_from_file
+            mock_blob.delete.side_effect = delete
+            return mock_blob
+
+        self.mock_bucket_obj.blob.side_effect = blob
+
+    def test_compose_few(self):
+        gcs_compose(self.mock_bucket_obj, ['a', 'b'], 'out')
+        self.assertEqual(self.composed, {'out': ['a', 'b']})
+        self.assertEqual(self.deleted, [])
+
+    def test_compose_tree(self):
+        sources = [f'part{i:04}' for i in range(32 * 32 + 1)]
+        gcs_compose(self.mock_bucket_obj, sources, 'out')
+
+        def expand(name):
+            if name in self.composed:
+                return [leaf for child in self.composed[name] for leaf in expand(child)]
+            return [name]
+
+        # Every compose is within the limit, and order is preserved
+        self.assertTrue(all(len(batch) <= 32 for batch in self.composed.values()))
+        self.assertEqual(expand('out'), sources)
+        # Two levels of intermediates: 33 then 2
+        intermediates = set(self.composed.keys()) - {'out'}
+        self.assertEqual(len(intermediates), 35)
+        self.assertEqual(set(self.deleted), intermediates)
+
+    def test_compose_cleans_up_on_failure(self):
+        original_blob = self.mock_bucket_obj.blob.side_effect
+
+        def blob(name):
+            mock_blob = original_blob(name)
+            if name == 'out':
+                mock_blob.compose.side_effect = RuntimeError('nope')
+            elif name.endswith('-0-1'):
+                mock_blob.delete.side_effect = google.api_core.exceptions.NotFound('gone')
+            return mock_blob
+
+        self.mock_bucket_obj.blob.side_effect = blob
+        with self.assertRaises(RuntimeError):
+            gcs_compose(self.mock_bucket_obj, [str(i) for i in range(40)], 'out')
+        self.assertEqual(len(self.deleted), 1)
+
+    def test_compose_nothing(self):
+        with self.assertRaises(ValueError):
+            gcs_compose(self.mock_bucket_obj, [], 'out')
+
+    def test_upload_small(self):
+        out = gcs_parallel_composite_upload(self.mock_bucket_obj, io.BytesIO(b'abc'), 'out',
+                                            chunk_size=10)
+        self.assertEqual(out, 3)
+        self.assertEqual(self.uploaded, {'out': b'abc'})
+        self.assertEqual(self.composed, {})
+
+    def test_upload_empty(self):
+        out = gcs_parallel_composite_upload(self.mock_bucket_obj, io.BytesIO(b''), 'out',
+                                            chunk_size=10)
+        self.assertEqual(out, 0)
+        self.assertEqual(self.uploaded, {'out': b''})
+
+    def test_upload_in_parts(self):
+        data = bytes(range(256)) * 10
+
+        class ShortReads(io.RawIOBase):
+            # Returns at most 7 bytes per read, like a slow socket
+            def __init__(self):
+                self.inner = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                return self.inner.readinto(memoryview(b)[:7])
+
+        out = gcs_parallel_composite_upload(self.mock_bucket_obj, ShortReads(), 'out',
+                                            chunk_size=100, max_workers=3)
+        self.assertEqual(out, len(data))
+        parts = self.composed['out']
+        self.assertEqual(len(parts), 26)
+        self.assertEqual(b''.join(self.uploaded[part] for part in parts), data)
+        self.assertTrue(all(len(self.uploaded[part]) == 100 for part in parts[:-1]))
+        self.assertEqual(set(self.deleted), set(parts))
+
+    def test_upload_exactly_one_chunk(self):
+        out = gcs_parallel_composite_upload(self.mock_bucket_obj, io.BytesIO(b'x' * 10), 'out',
+                                            chunk_size=10)
+        self.assertEqual(out, 10)
+        self.assertEqual(self.uploaded, {'out': b'x' * 10})
+        self.assertEqual(self.composed, {})
+
+    def test_upload_without_readinto_reuses_buffers(self):
+        data = bytes(range(256)) * 10
+        inner = io.BytesIO(data)
+
+        class ReadOnly:
+            def read(self, size=-1):
+                return inner.read(size)
+
+        buffers = set()
+        original_blob = self.mock_bucket_obj.blob.side_effect
+
+        def blob(name):
+            mock_blob = original_blob(name)
+            upload_from_file = mock_blob.upload_from_file.side_effect
+
+            def record_buffer(file_obj, size):
+                with self.lock:
+                    buffers.add(id(file_obj._view.obj))
+                upload_from_file(file_obj, size)
+
+            mock_blob.upload_from_file.side_effect = record_buffer
+            return mock_blob
+
+        self.mock_bucket_obj.blob.side_effect = blob
+        out = gcs_parallel_composite_upload(self.mock_bucket_obj, ReadOnly(), 'out',
+                                            chunk_size=100, max_workers=2)
+        self.assertEqual(out, len(data))
+        parts = self.composed['out']
+        self.assertEqual(b''.join(self.uploaded[part] for part in parts), data)
+        # No more than one buffer per worker plus one being filled
+        self.assertLessEqual(len(buffers), 3)
+
+    def test_upload_part_failure_cleans_up(self):
+        original_blob = self.mock_bucket_obj.blob.side_effect
+
+        def blob(name):
+            mock_blob = original_blob(name)
+            if name.endswith('-00002'):
+                mock_blob.upload_from_file.side_effect = RuntimeError('nope')
+            return mock_blob
+
+        self.mock_bucket_obj.blob.side_effect = blob
+        with self.assertRaises(RuntimeError):
+            gcs_parallel_composite_upload(self.mock_bucket_obj, io.BytesIO(b'x' * 1000), 'out',
+                                          chunk_size=100, max_workers=2)
+        self.assertNotIn('out', self.composed)
+        self.assertTrue(set(self.uploaded).issubset(set(self.deleted)))
@@ -1,5 +1,6 @@
 from records_mover.url.gcs.gcs_directory_url import GCSDirectoryUrl
-from mock import patch, Mock
+from mock import patch, Mock, MagicMock
+import google.api_core.exceptions
 import unittest
 
 
@@ -20,12 +21,25 @@ class TestGCSDirectoryURL(unittest.TestCase):
         out = self.loc.directory_in_this_directory('newdir')
         self.assertEqual(out.url, 'gs://bucket/dir/newdir/')
 
+    def test_parallel_composite_upload_passed_on(self):
+        self.assertFalse(self.loc.file_in_this_directory('foo.csv').parallel_composite_upload)
+        loc = GCSDirectoryUrl(url=self.mock_url,
+                              gcs_client=self.mock_client,
+                              gcp_credentials=self.mock_gcp_credentials,
+                              gcs_parallel_composite_upload=True)
+        file_loc = loc.directory_in_this_directory('newdir').file_in_this_directory('foo.csv')
+        self.assertTrue(file_loc.parallel_composite_upload)
+        self.assertTrue(file_loc.containing_directory().parallel_composite_upload)
+
     @patch('records_mover.url.gcs.gcs_file_url.GCSFileUrl')
     def test_files_in_directory(self,
                                 mock_GCSFileUrl):
         mock_blob_1 = Mock(name='blob_1')
         mock_blob_2 = Mock(name='blob_1')
-        self.mock_client.list_blobs.return_value = [mock_blob_1, mock_blob_2]
+        mock_blobs = MagicMock(name='blobs')
+        mock_blobs.__iter__.return_value = iter([mock_blob_1, mock_blob_2])
+        mock_blobs.prefixes = set()
+        self.mock_client.list_blobs.return_value = mock_blobs
 
         out = self.loc.files_in_directory()
 
@@ -35,23 +49,47 @@ class TestGCSDirectoryURL(unittest.TestCase):
         self.assertEqual(out,
                          [mock_GCSFileUrl.return_value, mock_GCSFileUrl.return_value])
 
-    @patch('records_mover.url.gcs.gcs_directory_url.googleapiclient')
-    def test_directories_in_directory(self,
-                                      mock_googleapiclient):
-        mock_service = mock_googleapiclient.discovery.build.return_value
-        mock_folders_req = mock_service.objects.return_value.list.return_value
-        mock_prefix = 'dir/'
-        mock_folders_resp = mock_folders_req.execute.return_value
-        mock_folders_resp.get.return_value = ['dir/bing/', 'dir/bazzle/']
+    def test_directories_in_directory(self):
+        mock_blobs = MagicMock(name='blobs')
+        mock_blobs.__iter__.return_value = iter([])
+        mock_blobs.prefixes = {'dir/bing/', 'dir/bazzle/', 'dir/'}
+        self.mock_client.list_blobs.return_value = mock_blobs
         out = self.loc.directories_in_directory()
-        mock_googleapiclient.discovery.build.\
-            assert_called_with('storage', 'v1',
-                               credentials=self.mock_gcp_credentials)
-        mock_service.objects.return_value.list.assert_called_with(bucket='bucket',
-                                                                  prefix=mock_prefix,
-                                                                  delimiter='/')
-        mock_folders_req.execute.assert_called_with()
-        mock_folders_resp.get.assert_called_with('prefixes', [])
+        self.mock_client.list_blobs.assert_called_with(bucket_or_name='bucket',
+                                                       prefix='dir/',
+                                                       delimiter='/')
         self.assertEqual(list(map(lambda loc: loc.url, out)),
-                         ['gs://bucket/dir/bing/',
-                          'gs://bucket/dir/bazzle/'])
+                         ['gs://bucket/dir/bazzle/',
+                          'gs://bucket/dir/bing/'])
+
+    def test_files_and_directories_in_directory_lists_once(self):
+        mock_blob = Mock(name='blob')
+        mock_blob.name = 'dir/file.csv'
+        mock_blobs = MagicMock(name='blobs')
+        mock_blobs.__iter__.return_value = iter([mock_blob])
+        mock_blobs.prefixes = {'dir/sub/'}
+        self.mock_client.list_blobs.return_value = mock_blobs
+        out = self.loc.files_and_directories_in_directory()
+        self.mock_client.list_blobs.assert_called_once_with(bucket_or_name='bucket',
+                                                            prefix='dir/',
+                                                            delimiter='/')
+        self.assertEqual([loc.url for loc in out],
+                         ['gs://bucket/dir/file.csv', 'gs://bucket/dir/sub/'])
+
+    def test_purge_directory(self):
+        mock_blobs = [Mock(name=f'blob_{i}') for i in range(50)]
+        mock_blobs[3].delete.side_effect = google.api_core.exceptions.NotFound('gone')
+        self.mock_client.list_blobs.return_value = iter(mock_blobs)
+        self.loc.purge_directory()
+        # No delimiter, so everything under the prefix in one listing
+        self.mock_client.list_blobs.assert_called_once_with(bucket_or_name='bucket',
+                                                            prefix='dir/')
+        for mock_blob in mock_blobs:
+            mock_blob.delete.assert_called_once_with()
+
+    def test_purge_directory_raises_other_errors(self):
+        mock_blob = Mock(name='blob')
+        mock_blob.delete.side_effect = google.api_core.exceptions.Forbidden('no')
+        self.mock_client.list_blobs.return_value = iter([mock_blob])
+        with self.assertRaises(google.api_core.exceptions.Forbidden):
+            self.loc.purge_directory()
@@ -54,3 +54,61 @@ class TestGCSFileURL(unittest.TestCase):
         out = self.loc.rename_to(mock_new)
         self.mock_bucket_obj.rename_blob.assert_called_with(self.mock_blob_obj, mock_new.blob)
         self.assertEqual(out, mock_new)
+
+    @patch('records_mover.url.gcs.gcs_file_url.gcs_compose')
+    def test_concatenate_from(self, mock_gcs_compose):
+        locs = [GCSFileUrl(url=f'gs://bucket/dir/part{i}.csv',
+                           gcs_client=self.mock_client,
+                           gcp_credentials=self.mock_gcp_credentials)
+                for i in range(3)]
+        out = self.loc.concatenate_from(locs)
+        mock_gcs_compose.assert_called_with(self.mock_bucket_obj,
+                                            ['dir/part0.csv', 'dir/part1.csv', 'dir/part2.csv'],
+                                            'dir/file.csv')
+        self.assertIsNone(out)
+
+    @patch('records_mover.url.gcs.gcs_file_url.gcs_compose')
+    @patch('records_mover.url.base.BaseFileUrl.concatenate_from')
+    def test_concatenate_from_other_bucket(self, mock_base_concatenate_from, mock_gcs_compose):
+        locs = [GCSFileUrl(url='gs://otherbucket/dir/part0.csv',
+                           gcs_client=self.mock_client,
+                           gcp_credentials=self.mock_gcp_credentials)]
+        out = self.loc.concatenate_from(locs)
+        mock_gcs_compose.assert_not_called()
+        mock_base_concatenate_from.assert_called_with(locs)
+        self.assertEqual(out, mock_base_concatenate_from.return_value)
+
+    @patch('records_mover.url.gcs.gcs_file_url.gcs_parallel_composite_upload')
+    def test_upload_fileobj(self, mock_gcs_parallel_composite_upload):
+        mock_fileobj = Mock(name='fileobj')
+        self.loc.parallel_composite_upload = True
+        self.loc.upload_chunk_size = 123
+        self.loc.max_upload_workers = 4
+        out = self.loc.upload_fileobj(mock_fileobj)
+        mock_gcs_parallel_composite_upload.assert_called_with(self.mock_bucket_obj,
+                                                              mock_fileobj,
+                                                              'dir/file.csv',
+                                                              chunk_size=123,
+                                                              max_workers=4)
+        self.assertEqual(out, mock_gcs_parallel_composite_upload.return_value)
+
+    @patch('records_mover.url.gcs.gcs_file_url.gcs_parallel_composite_upload')
+    @patch('records_mover.url.gcs.gcs_file_url.BaseFileUrl.upload_fileobj')
+    def test_upload_fileobj_not_composite_by_default(self,
+                                                     mock_base_upload_fileobj,
+                                                     mock_gcs_parallel_composite_upload):
+        mock_fileobj = Mock(name='fileobj')
+        out = self.loc.upload_fileobj(mock_fileobj)
+        mock_base_upload_fileobj.assert_called_with(mock_fileobj, mode='wb')
+        mock_gcs_parallel_composite_upload.assert_not_called()
+        self.assertEqual(out, mock_base_upload_fileobj.return_value)
+
+    def test_content_version(self):
+        self.mock_bucket_obj.get_blob.return_value.generation = 1234
+        self.assertEqual(self.loc.content_version(), '1234')
+        self.mock_bucket_obj.get_blob.assert_called_with('dir/file.csv')
+
+    def test_content_version_not_found(self):
+        self.mock_bucket_obj.get_blob.return_value = None
+        with self.assertRaises(FileNotFoundError):
+            self.loc.content_version()
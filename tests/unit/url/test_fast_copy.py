@@ -0,0 +1,81 @@
+from records_mover.url.fast_copy import copy_file_contents, is_regular_file, reflink
+from mock import patch, Mock
+import tempfile
+import unittest
+import errno
+import io
+import os
+
+
+class TestFastCopy(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tempdir.name, 'input')
+        self.output_path = os.path.join(self.tempdir.name, 'output')
+        self.data = os.urandom(3 * 1024 * 1024 + 17)
+        with open(self.input_path, 'wb') as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def output(self):
+        with open(self.output_path, 'rb') as f:
+            return f.read()
+
+    def test_is_regular_file(self):
+        with open(self.input_path, 'rb') as f:
+            self.assertTrue(is_regular_file(f))
+        self.assertFalse(is_regular_file(io.BytesIO(b'abc')))
+        self.assertFalse(is_regular_file(Mock(name='fileobj')))
+        r, w = os.pipe()
+        with open(r, 'rb') as read_end, open(w, 'wb'):
+            self.assertFalse(is_regular_file(read_end))
+
+    def test_copy_file_contents_from_current_positions(self):
+        with open(self.input_path, 'rb') as input_file, \
+             open(self.output_path, 'wb') as output_file:
+            # Partially-consumed buffered input and pending buffered
+            # output both need to be accounted for
+            self.assertEqual(input_file.read(10), self.data[:10])
+            output_file.write(b'header')
+            copied = copy_file_contents(input_file, output_file)
+            self.assertEqual(copied, len(self.data) - 10)
+            self.assertEqual(input_file.read(), b'')
+            output_file.write(b'footer')
+        self.assertEqual(self.output(), b'header' + self.data[10:] + b'footer')
+
+    def test_copy_file_contents_append_mode(self):
+        with open(self.output_path, 'wb') as f:
+            f.write(b'existing')
+        with open(self.input_path, 'rb') as input_file, \
+             open(self.output_path, 'ab') as output_file:
+            copy_file_contents(input_file, output_file)
+        self.assertEqual(self.output(), b'existing' + self.data)
+
+    @patch('records_mover.url.fast_copy.os.copy_file_range', create=True)
+    @patch('records_mover.url.fast_copy.os.sendfile', create=True)
+    def test_copy_file_contents_falls_back(self, mock_sendfile, mock_copy_file_range):
+        mock_copy_file_range.side_effect = OSError(errno.EXDEV, 'Invalid cross-device link')
+        mock_sendfile.side_effect = OSError(errno.EINVAL, 'Invalid argument')
+        with open(self.input_path, 'rb') as input_file, \
+             open(self.output_path, 'wb') as output_file:
+            self.assertEqual(copy_file_contents(input_file, output_file), len(self.data))
+        self.assertEqual(self.output(), self.data)
+
+    @patch('records_mover.url.fast_copy.os.copy_file_range', create=True)
+    def test_copy_file_contents_real_errors_raise(self, mock_copy_file_range):
+        mock_copy_file_range.side_effect = OSError(errno.ENOSPC, 'No space left on device')
+        with open(self.input_path, 'rb') as input_file, \
+             open(self.output_path, 'wb') as output_file:
+            with self.assertRaises(OSError):
+                copy_file_contents(input_file, output_file)
+
+    def test_reflink_or_not(self):
+        with open(self.input_path, 'rb') as input_file, \
+             open(self.output_path, 'wb') as output_file:
+            if not reflink(input_file, output_file):
+                # Not supported by the filesystem running the tests
+                copy_file_contents(input_file, output_file)
+            self.assertEqual(input_file.tell(), len(self.data))
+        self.assertEqual(self.output(), self.data)
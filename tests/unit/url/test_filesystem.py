@@ -1,7 +1,8 @@
 from records_mover.url.filesystem import FilesystemDirectoryUrl, FilesystemFileUrl
 from records_mover.url.s3.s3_file_url import S3FileUrl
-from records_mover.url.base import BaseFileUrl
+from records_mover.url.base import BaseFileUrl, BaseDirectoryUrl
 from mock import patch, Mock, MagicMock, mock_open
+import tempfile
 import unittest
 import os
 
@@ -85,6 +86,13 @@ class TestFilesystemFileUrl(unittest.TestCase):
     def test_is_directory(self):
         self.assertFalse(self.filesystem_file_url.is_directory())
 
+    @patch('records_mover.url.filesystem.os')
+    def test_content_version(self, mock_os):
+        mock_os.stat.return_value.st_mtime_ns = 1234
+        mock_os.stat.return_value.st_size = 56
+        self.assertEqual(self.filesystem_file_url.content_version(), '1234-56')
+        mock_os.stat.assert_called_with('/topdir/bottomdir/file')
+
     @patch("builtins.open", new_callable=mock_open)
     @patch("records_mover.url.base.blcopyfileobj")
     def test_concatenate_from(self,
@@ -218,6 +226,31 @@ class TestFilesystemDirectoryUrl(unittest.TestCase):
         mock_FilesystemFileUrl.assert_called_with('file:///topdir/bottomdir/file')
         self.assertEqual(ret, mock_target_directory)
 
+    def test_copy_to_filesystem_directory(self):
+        with tempfile.TemporaryDirectory() as source_dir, \
+                tempfile.TemporaryDirectory() as target_dir:
+            os.makedirs(os.path.join(source_dir, 'subdir'))
+            with open(os.path.join(source_dir, 'file'), 'w') as f:
+                f.write('a')
+            with open(os.path.join(source_dir, 'subdir', 'other'), 'w') as f:
+                f.write('b')
+            source_loc = FilesystemDirectoryUrl(f'file://{source_dir}/')
+            target_loc = FilesystemDirectoryUrl(f'file://{target_dir}/')
+            ret = source_loc.copy_to(target_loc)
+            self.assertEqual(ret, target_loc)
+            with open(os.path.join(target_dir, 'file')) as f:
+                self.assertEqual(f.read(), 'a')
+            with open(os.path.join(target_dir, 'subdir', 'other')) as f:
+                self.assertEqual(f.read(), 'b')
+
+    @patch.object(BaseDirectoryUrl, 'copy_to')
+    def test_copy_to_filesystem_non_directory(self, mock_copy_to):
+        mock_target_loc = MagicMock(name='target_loc', spec=FilesystemDirectoryUrl)
+        mock_target_loc.is_directory.return_value = False
+        ret = self.filesystem_directory_url.copy_to(mock_target_loc)
+        mock_copy_to.assert_called_with(mock_target_loc)
+        self.assertEqual(ret, mock_copy_to.return_value)
+
     def test_str(self):
         self.assertEqual('file:///topdir/bottomdir/', str(self.filesystem_directory_url))
 
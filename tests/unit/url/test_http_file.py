@@ -1,6 +1,8 @@
 from records_mover.url.http import HttpFileUrl
+from records_mover.url.http_ranged_reader import HttpRangeSupport
 from mock import patch, Mock
 import unittest
+import io
 
 
 class TestHttpFileUrl(unittest.TestCase):
@@ -10,11 +12,50 @@ class TestHttpFileUrl(unittest.TestCase):
     def test_url(self):
         self.assertEqual(self.http_file_url.url, 'http://site.com/path/file#foo?a=b&b=c')
 
+    @patch("records_mover.url.http.probe_range_support")
     @patch("records_mover.url.urllib.urlopen")
     @patch("records_mover.url.base.blcopyfileobj")
-    def test_download_fileobj(self, mock_copyfileobj, mock_urlopen):
+    def test_download_fileobj(self, mock_copyfileobj, mock_urlopen, mock_probe_range_support):
+        mock_probe_range_support.return_value = None
         mock_output_fileobj = Mock(name='output_fileobj')
         self.http_file_url.download_fileobj(mock_output_fileobj)
         mock_urlopen.assert_called_with('http://site.com/path/file#foo?a=b&b=c')
         mock_copyfileobj.assert_called_with(mock_urlopen.return_value.__enter__.return_value,
                                             mock_output_fileobj)
+
+    @patch("records_mover.url.http.probe_range_support")
+    @patch("records_mover.url.urllib.urlopen")
+    def test_open_small_file(self, mock_urlopen, mock_probe_range_support):
+        mock_probe_range_support.return_value = HttpRangeSupport(size=10, etag=None)
+        out = self.http_file_url.open()
+        self.assertEqual(out, mock_urlopen.return_value)
+
+    @patch("records_mover.url.http.probe_range_support")
+    @patch("records_mover.url.urllib.urlopen")
+    @patch("records_mover.url.http.HttpRangedReader")
+    def test_open_large_file(self, mock_HttpRangedReader, mock_urlopen,
+                             mock_probe_range_support):
+        mock_HttpRangedReader.return_value = io.BytesIO(b'data')
+        mock_probe_range_support.return_value =\
+            HttpRangeSupport(size=self.http_file_url.download_part_size + 1, etag='"abc"')
+        out = self.http_file_url.open()
+        self.assertIsInstance(out, io.BufferedReader)
+        self.assertEqual(out.read(), b'data')
+        mock_HttpRangedReader.\
+            assert_called_with('http://site.com/path/file#foo?a=b&b=c',
+                               size=self.http_file_url.download_part_size + 1,
+                               etag='"abc"',
+                               part_size=self.http_file_url.download_part_size,
+                               max_parts_in_flight=self.http_file_url.max_download_parts_in_flight,
+                               max_attempts=self.http_file_url.max_download_attempts)
+        mock_urlopen.assert_not_called()
+
+    @patch("records_mover.url.http.head")
+    def test_content_version(self, mock_head):
+        mock_head.return_value = {'ETag': '"abc"'}
+        self.assertEqual(self.http_file_url.content_version(), '"abc"')
+
+    @patch("records_mover.url.http.head")
+    def test_content_version_weak_etag(self, mock_head):
+        mock_head.return_value = {'ETag': 'W/"abc"'}
+        self.assertIsNone(self.http_file_url.content_version())
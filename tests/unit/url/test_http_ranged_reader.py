@@ -0,0 +1,124 @@
+from records_mover.url.http_ranged_reader import (HttpRangedReader, probe_range_support,
+                                                  HttpRangeSupport)
+from urllib.error import HTTPError, URLError
+from mock import patch
+import threading
+import unittest
+import io
+
+
+class FlakyResponse(io.BytesIO):
+    "Returns some data, then drops the connection"
+
+    def __init__(self, data, fail_after):
+        super().__init__(data)
+        self.status = 206
+        self.fail_after = fail_after
+
+    def read(self, size=-1):
+        if self.tell() >= self.fail_after:
+            raise ConnectionResetError('dropped')
+        return super().read(min(size, self.fail_after - self.tell()))
+
+
+@patch('records_mover.url.http_ranged_reader.time')
+@patch('records_mover.url.http_ranged_reader.urlopen')
+class TestHttpRangedReader(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 4
+        self.requests = []
+        self.lock = threading.Lock()
+        self.fail_after = None
+
+    def urlopen(self, request, timeout):
+        self.assertEqual(request.full_url, 'http://site.com/file')
+        start, end = request.get_header('Range')[len('bytes='):].split('-')
+        with self.lock:
+            self.requests.append((int(start), int(end), request.get_header('If-range')))
+        data = self.data[int(start):int(end) + 1]
+        if self.fail_after is not None:
+            fail_after = self.fail_after
+            self.fail_after = None
+            return FlakyResponse(data, fail_after)
+        response = io.BytesIO(data)
+        response.status = 206
+        return response
+
+    def reader(self, **kwargs):
+        return HttpRangedReader('http://site.com/file', size=len(self.data), **kwargs)
+
+    def test_read_all_in_order(self, mock_urlopen, mock_time):
+        mock_urlopen.side_effect = self.urlopen
+        with self.reader(etag='"abc"', part_size=100, max_parts_in_flight=3) as reader:
+            self.assertEqual(reader.read(), self.data)
+        self.assertEqual(sorted(self.requests),
+                         [(start, min(start + 100, len(self.data)) - 1, '"abc"')
+                          for start in range(0, len(self.data), 100)])
+
+    def test_resumes_dropped_connection(self, mock_urlopen, mock_time):
+        mock_urlopen.side_effect = self.urlopen
+        self.fail_after = 30
+        with self.reader(part_size=2000, max_parts_in_flight=1) as reader:
+            self.assertEqual(reader.read(), self.data)
+        self.assertEqual(self.requests, [(0, len(self.data) - 1, None),
+                                         (30, len(self.data) - 1, None)])
+        mock_time.sleep.assert_called_once()
+
+    def test_gives_up_after_max_attempts(self, mock_urlopen, mock_time):
+        mock_urlopen.side_effect = URLError('no route to host')
+        with self.reader(part_size=2000, max_attempts=3) as reader:
+            with self.assertRaises(URLError):
+                reader.read()
+        self.assertEqual(mock_urlopen.call_count, 3)
+
+    def test_client_error_not_retried(self, mock_urlopen, mock_time):
+        mock_urlopen.side_effect = HTTPError('http://site.com/file', 403, 'Forbidden', {}, None)
+        with self.reader(part_size=2000) as reader:
+            with self.assertRaises(HTTPError):
+                reader.read()
+        self.assertEqual(mock_urlopen.call_count, 1)
+
+    def test_full_response_raises(self, mock_urlopen, mock_time):
+        response = io.BytesIO(self.data)
+        response.status = 200
+        mock_urlopen.return_value = response
+        with self.reader(part_size=100, max_parts_in_flight=1) as reader:
+            with self.assertRaises(IOError):
+                reader.read()
+
+
+@patch('records_mover.url.http_ranged_reader.urlopen')
+class TestProbeRangeSupport(unittest.TestCase):
+    def mock_headers(self, mock_urlopen, headers):
+        mock_urlopen.return_value.__enter__.return_value.headers = headers
+
+    def test_supported(self, mock_urlopen):
+        self.mock_headers(mock_urlopen, {'Accept-Ranges': 'bytes',
+                                         'Content-Length': '1234',
+                                         'ETag': '"abc"'})
+        self.assertEqual(probe_range_support('http://site.com/file'),
+                         HttpRangeSupport(size=1234, etag='"abc"'))
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(request.get_method(), 'HEAD')
+
+    def test_weak_etag_ignored(self, mock_urlopen):
+        self.mock_headers(mock_urlopen, {'Accept-Ranges': 'bytes',
+                                         'Content-Length': '1234',
+                                         'ETag': 'W/"abc"'})
+        self.assertEqual(probe_range_support('http://site.com/file'),
+                         HttpRangeSupport(size=1234, etag=None))
+
+    def test_no_ranges(self, mock_urlopen):
+        self.mock_headers(mock_urlopen, {'Content-Length': '1234'})
+        self.assertIsNone(probe_range_support('http://site.com/file'))
+
+    def test_compressed(self, mock_urlopen):
+        self.mock_headers(mock_urlopen, {'Accept-Ranges': 'bytes',
+                                         'Content-Length': '1234',
+                                         'Content-Encoding': 'gzip'})
+        self.assertIsNone(probe_range_support('http://site.com/file'))
+
+    def test_head_fails(self, mock_urlopen):
+        mock_urlopen.side_effect = HTTPError('http://site.com/file', 405,
+                                             'Method Not Allowed', {}, None)
+        self.assertIsNone(probe_range_support('http://site.com/file'))
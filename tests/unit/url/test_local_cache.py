@@ -0,0 +1,79 @@
+from records_mover.url.local_cache import LocalFileCache
+from records_mover.url.base import BaseFileUrl
+from mock import Mock
+import tempfile
+import unittest
+import os
+
+
+class FakeFileUrl(BaseFileUrl):
+    def __init__(self, url, contents, version):
+        self.url = url
+        self.contents = contents
+        self.version = version
+        self.downloads = 0
+
+    def content_version(self):
+        return self.version
+
+    def download_fileobj(self, output_fileobj):
+        self.downloads += 1
+        output_fileobj.write(self.contents)
+
+
+class TestLocalFileCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = LocalFileCache(self.tempdir.name, max_bytes=100)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_local_copy_downloads_once(self):
+        loc = FakeFileUrl('s3://bucket/dir/file.csv.gz', b'abc', '"etag"')
+        first = self.cache.local_copy(loc)
+        second = self.cache.local_copy(loc)
+        self.assertEqual(loc.downloads, 1)
+        self.assertEqual(first.url, second.url)
+        self.assertEqual(first.filename(), 'file.csv.gz')
+        with second.open() as f:
+            self.assertEqual(f.read(), b'abc')
+
+    def test_new_version_downloaded(self):
+        loc = FakeFileUrl('s3://bucket/file.csv', b'abc', '"etag1"')
+        first = self.cache.local_copy(loc)
+        loc.version = '"etag2"'
+        loc.contents = b'def'
+        second = self.cache.local_copy(loc)
+        self.assertEqual(loc.downloads, 2)
+        with second.open() as f:
+            self.assertEqual(f.read(), b'def')
+        self.assertNotEqual(first.url, second.url)
+
+    def test_unknown_version_not_cached(self):
+        loc = FakeFileUrl('http://site.com/file.csv', b'abc', None)
+        self.assertIsNone(self.cache.local_copy(loc))
+        self.assertEqual(loc.downloads, 0)
+
+    def test_least_recently_used_evicted(self):
+        locs = [FakeFileUrl(f's3://bucket/file{i}', b'x' * 40, 'v') for i in range(3)]
+        local_locs = [self.cache.local_copy(loc) for loc in locs[:2]]
+        # Make file0 more recently used than file1
+        os.utime(os.path.dirname(local_locs[1].local_file_path), (0, 0))
+        self.cache.local_copy(locs[0])
+        self.cache.local_copy(locs[2])
+        self.assertTrue(os.path.exists(local_locs[0].local_file_path))
+        self.assertFalse(os.path.exists(local_locs[1].local_file_path))
+        self.assertEqual(locs[1].downloads, 1)
+
+    def test_oversized_entry_kept(self):
+        loc = FakeFileUrl('s3://bucket/big', b'x' * 200, 'v')
+        local_loc = self.cache.local_copy(loc)
+        self.assertTrue(os.path.exists(local_loc.local_file_path))
+
+    def test_failed_download_leaves_nothing(self):
+        loc = FakeFileUrl('s3://bucket/file', b'abc', 'v')
+        loc.download_fileobj = Mock(side_effect=ConnectionResetError('dropped'))
+        with self.assertRaises(ConnectionResetError):
+            self.cache.local_copy(loc)
+        self.assertEqual(os.listdir(self.tempdir.name), [])
@@ -0,0 +1,111 @@
+from records_mover.url.mem import MemoryFileUrl, MemoryDirectoryUrl, MemoryStore
+from records_mover.url.resolver import UrlResolver
+from mock import patch, Mock
+import unittest
+import errno
+import io
+
+
+@patch('records_mover.url.mem.memory_store', new_callable=lambda: MemoryStore(max_bytes=100))
+class TestMemoryUrls(unittest.TestCase):
+    def test_write_then_read(self, mock_memory_store):
+        loc = MemoryFileUrl('mem://bucket/dir/file.csv')
+        self.assertFalse(loc.exists())
+        loc.store_string('a,b\n')
+        self.assertTrue(loc.exists())
+        self.assertEqual(loc.string_contents(), 'a,b\n')
+        self.assertEqual(loc.size(), 4)
+        self.assertEqual(loc.filename(), 'file.csv')
+
+    def test_upload_download_fileobj(self, mock_memory_store):
+        loc = MemoryFileUrl('mem://file')
+        self.assertEqual(loc.upload_fileobj(io.BytesIO(b'abc')), 3)
+        out = io.BytesIO()
+        loc.download_fileobj(out)
+        self.assertEqual(out.getvalue(), b'abc')
+
+    def test_append(self, mock_memory_store):
+        loc = MemoryFileUrl('mem://file')
+        loc.store_string('abc')
+        with loc.open('ab') as f:
+            f.write(b'def')
+        self.assertEqual(loc.string_contents(), 'abcdef')
+
+    def test_missing(self, mock_memory_store):
+        loc = MemoryFileUrl('mem://missing')
+        with self.assertRaises(FileNotFoundError):
+            loc.open()
+        with self.assertRaises(FileNotFoundError):
+            loc.delete()
+
+    def test_size_cap(self, mock_memory_store):
+        loc = MemoryFileUrl('mem://file')
+        loc.upload_fileobj(io.BytesIO(b'x' * 60))
+        # Overwriting the same file doesn't count twice
+        loc.upload_fileobj(io.BytesIO(b'x' * 90))
+        with self.assertRaises(OSError) as cm:
+            MemoryFileUrl('mem://other').upload_fileobj(io.BytesIO(b'x' * 20))
+        self.assertEqual(cm.exception.errno, errno.ENOSPC)
+        loc.delete()
+        self.assertEqual(mock_memory_store.total_bytes, 0)
+
+    def test_size_cap_checked_on_write(self, mock_memory_store):
+        loc = MemoryFileUrl('mem://file')
+        with self.assertRaises(OSError) as cm:
+            with loc.open('wb') as f:
+                f.write(b'x' * 60)
+                f.write(b'x' * 60)
+        self.assertEqual(cm.exception.errno, errno.ENOSPC)
+        # The write was rejected before it was buffered, and nothing
+        # is stored afterwards
+        self.assertFalse(loc.exists())
+        self.assertEqual(mock_memory_store.total_bytes, 0)
+
+    def test_copy_and_rename(self, mock_memory_store):
+        loc = MemoryFileUrl('mem://a')
+        loc.store_string('abc')
+        copy = loc.copy_to(MemoryFileUrl('mem://b'))
+        renamed = loc.rename_to(MemoryFileUrl('mem://c'))
+        self.assertFalse(loc.exists())
+        self.assertEqual(copy.string_contents(), 'abc')
+        self.assertEqual(renamed.string_contents(), 'abc')
+
+    def test_directory_listing(self, mock_memory_store):
+        directory = MemoryDirectoryUrl('mem://bucket/dir/')
+        directory.file_in_this_directory('b.csv').store_string('b')
+        directory.file_in_this_directory('a.csv').store_string('a')
+        directory.directory_in_this_directory('sub').\
+            file_in_this_directory('c.csv').store_string('c')
+        MemoryFileUrl('mem://bucket/dir2/d.csv').store_string('d')
+        self.assertEqual([loc.url for loc in directory.files_in_directory()],
+                         ['mem://bucket/dir/a.csv', 'mem://bucket/dir/b.csv'])
+        self.assertEqual([loc.url for loc in directory.directories_in_directory()],
+                         ['mem://bucket/dir/sub/'])
+        self.assertEqual(directory.filename(), 'dir')
+        self.assertEqual(directory.containing_directory().url, 'mem://bucket/')
+        self.assertEqual(directory.file_in_this_directory('a.csv').containing_directory().url,
+                         directory.url)
+
+    def test_directory_copy_and_purge(self, mock_memory_store):
+        directory = MemoryDirectoryUrl('mem://dir/')
+        directory.file_in_this_directory('a.csv').store_string('a')
+        directory.directory_in_this_directory('sub').\
+            file_in_this_directory('b.csv').store_string('b')
+        target = directory.copy_to(MemoryDirectoryUrl('mem://target/'))
+        directory.purge_directory()
+        self.assertEqual(directory.files_and_directories_in_directory(), [])
+        self.assertEqual(target.file_in_this_directory('a.csv').string_contents(), 'a')
+        self.assertEqual(target.directory_in_this_directory('sub').
+                         file_in_this_directory('b.csv').string_contents(), 'b')
+
+    def test_temporary_directory(self, mock_memory_store):
+        with MemoryDirectoryUrl('mem://').temporary_directory() as tempdir:
+            tempdir.file_in_this_directory('a.csv').store_string('a')
+        self.assertEqual(mock_memory_store.total_bytes, 0)
+
+    def test_resolver(self, mock_memory_store):
+        resolver = UrlResolver(boto3_session_getter=Mock(),
+                               gcs_client_getter=Mock(),
+                               gcp_credentials_getter=Mock())
+        self.assertIsInstance(resolver.file_url('mem://a/b'), MemoryFileUrl)
+        self.assertIsInstance(resolver.directory_url('mem://a/'), MemoryDirectoryUrl)
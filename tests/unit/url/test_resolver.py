@@ -1,6 +1,8 @@
 from records_mover.url.resolver import directory_url_ctors, file_url_ctors, UrlResolver
 from records_mover.url.base import BaseFileUrl, BaseDirectoryUrl
-from mock import Mock
+from records_mover.url.gcs.gcs_directory_url import GCSDirectoryUrl
+from records_mover.url.gcs.gcs_file_url import GCSFileUrl
+from mock import Mock, patch
 import unittest
 
 
@@ -63,3 +65,36 @@ class TestUrlResolver(unittest.TestCase):
         directory_url = self.resolver.directory_url(dummy_url)
         self.mock_DummyDirectoryUrl.assert_called_with('dummy://foo/bar/?a=b&d=f')
         self.assertEqual(self.mock_DummyDirectoryUrl.return_value, directory_url)
+
+    @patch.dict(directory_url_ctors, {'gs': GCSDirectoryUrl})
+    @patch.dict(file_url_ctors, {'gs': GCSFileUrl})
+    def test_gcs_parallel_composite_upload(self):
+        resolver = UrlResolver(boto3_session_getter=lambda: self.mock_boto3_session,
+                               gcs_client_getter=lambda: self.mock_gcs_client,
+                               gcp_credentials_getter=lambda: self.mock_gcp_credentials,
+                               gcs_parallel_composite_upload=True)
+        directory_url = resolver.directory_url('gs://bucket/dir/')
+        self.assertTrue(directory_url.parallel_composite_upload)
+        file_url = directory_url.directory_in_this_directory('tmp').\
+            file_in_this_directory('foo.csv')
+        self.assertTrue(file_url.parallel_composite_upload)
+        self.assertFalse(self.resolver.file_url('gs://bucket/foo.csv').parallel_composite_upload)
+
+    def test_cached_file_url_no_cache(self):
+        dummy_url = 'dummy://foo/bar/baz'
+        file_url = self.resolver.cached_file_url(dummy_url)
+        self.assertEqual(self.mock_DummyFileUrl.return_value, file_url)
+
+    def test_cached_file_url(self):
+        mock_file_cache = Mock(name='file_cache')
+        self.resolver.file_cache = mock_file_cache
+        file_url = self.resolver.cached_file_url('dummy://foo/bar/baz')
+        mock_file_cache.local_copy.assert_called_with(self.mock_DummyFileUrl.return_value)
+        self.assertEqual(mock_file_cache.local_copy.return_value, file_url)
+
+    def test_cached_file_url_uncacheable(self):
+        mock_file_cache = Mock(name='file_cache')
+        mock_file_cache.local_copy.return_value = None
+        self.resolver.file_cache = mock_file_cache
+        file_url = self.resolver.cached_file_url('dummy://foo/bar/baz')
+        self.assertEqual(self.mock_DummyFileUrl.return_value, file_url)
@@ -0,0 +1,49 @@
+from records_mover.url.s3.s3_clients import s3_client, s3_resource
+from records_mover.url.s3.s3_url import S3Url
+from mock import Mock
+import threading
+import unittest
+
+
+class TestS3Clients(unittest.TestCase):
+    def test_s3_client_shared_among_urls(self):
+        mock_boto3_session = Mock(name='boto3_session')
+        mock_boto3_session.region_name = 'us-east-1'
+        directory_url = S3Url('s3://bucket/dir/', boto3_session=mock_boto3_session)
+        file_urls = [directory_url.file_in_this_directory(f'file{i}') for i in range(100)]
+        mock_boto3_session.client.assert_called_once_with('s3')
+        for file_url in file_urls:
+            self.assertIs(file_url.s3_client, directory_url.s3_client)
+
+    def test_s3_client_per_session(self):
+        mock_boto3_session_1 = Mock(name='boto3_session_1')
+        mock_boto3_session_2 = Mock(name='boto3_session_2')
+        self.assertEqual(s3_client(mock_boto3_session_1),
+                         mock_boto3_session_1.client.return_value)
+        self.assertEqual(s3_client(mock_boto3_session_2),
+                         mock_boto3_session_2.client.return_value)
+
+    def test_s3_client_per_region(self):
+        mock_boto3_session = Mock(name='boto3_session')
+        mock_boto3_session.client.side_effect = lambda service: Mock(name='client')
+        mock_boto3_session.region_name = 'us-east-1'
+        client_1 = s3_client(mock_boto3_session)
+        self.assertIs(client_1, s3_client(mock_boto3_session))
+        mock_boto3_session.region_name = 'us-west-2'
+        client_2 = s3_client(mock_boto3_session)
+        self.assertIsNot(client_1, client_2)
+        self.assertEqual(mock_boto3_session.client.call_count, 2)
+
+    def test_s3_resource_per_thread(self):
+        mock_boto3_session = Mock(name='boto3_session')
+        mock_boto3_session.resource.side_effect = lambda service: Mock(name='resource')
+        mock_boto3_session.region_name = 'us-east-1'
+        main_resource = s3_resource(mock_boto3_session)
+        self.assertIs(main_resource, s3_resource(mock_boto3_session))
+        other_resources = []
+        thread = threading.Thread(target=lambda:
+                                  other_resources.append(s3_resource(mock_boto3_session)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(main_resource, other_resources[0])
+        self.assertEqual(mock_boto3_session.resource.call_count, 2)
@@ -1,6 +1,7 @@
 from records_mover.url.s3.s3_directory_url import S3DirectoryUrl
+from records_mover.url.s3.s3_file_url import S3FileUrl
 from records_mover.url.filesystem import FilesystemDirectoryUrl
-from mock import patch, Mock, call
+from mock import patch, Mock, call, ANY
 import unittest
 
 
@@ -13,34 +14,105 @@ class TestS3DirectoryUrl(unittest.TestCase):
                                                S3Url=self.mock_S3Url,
                                                boto3_session=self.mock_boto3_session)
 
-    @patch('records_mover.url.s3.s3_directory_url.aws_cli')
+    @patch('records_mover.url.s3.s3_directory_url.s3_sync_to_local')
     def test_copy_to_dir(self,
-                         mock_aws_cli):
+                         mock_s3_sync_to_local):
         file_loc = Mock(name='file_loc', spec=FilesystemDirectoryUrl)
         file_loc.local_file_path = '/my/dir/'
-        self.s3_directory_url.copy_to(file_loc)
-        mock_aws_cli.assert_called_with('s3', 'sync', 's3://bucket/topdir/bottomdir/',
-                                        '/my/dir/')
+        self.s3_directory_url.max_sync_workers = 3
+        out = self.s3_directory_url.copy_to(file_loc)
+        mock_s3_client = self.mock_boto3_session.client.return_value
+        mock_s3_sync_to_local.assert_called_with(mock_s3_client,
+                                                 bucket='bucket',
+                                                 prefix='topdir/bottomdir/',
+                                                 local_directory='/my/dir/',
+                                                 max_workers=3)
+        self.assertEqual(out, file_loc)
+
+    def test_copy_to_s3_dir(self):
+        mock_s3_client = self.mock_boto3_session.client.return_value
+        mock_paginator = mock_s3_client.get_paginator.return_value
+        mock_paginator.paginate.side_effect = [
+            [{'Contents': [{'Key': 'topdir/bottomdir/', 'Size': 0},
+                           {'Key': 'topdir/bottomdir/a', 'Size': 1}],
+              'CommonPrefixes': [{'Prefix': 'topdir/bottomdir/sub/'}]}],
+            [{'Contents': [{'Key': 'topdir/bottomdir/sub/b', 'Size': 2}]}],
+        ]
+        mock_other_boto3_session = Mock(name='other_boto3_session')
+        mock_other_s3_client = mock_other_boto3_session.client.return_value
+        other_loc = S3DirectoryUrl('s3://otherbucket/otherdir/',
+                                   S3Url=self.mock_S3Url,
+                                   boto3_session=mock_other_boto3_session)
+        out = self.s3_directory_url.copy_to(other_loc)
+        self.assertEqual(out, other_loc)
+        self.assertEqual(mock_other_s3_client.copy.call_count, 2)
+        mock_other_s3_client.copy.assert_has_calls([
+            call(CopySource={'Bucket': 'bucket', 'Key': 'topdir/bottomdir/a'},
+                 Bucket='otherbucket',
+                 Key='otherdir/a',
+                 SourceClient=mock_s3_client,
+                 Config=ANY),
+            call(CopySource={'Bucket': 'bucket', 'Key': 'topdir/bottomdir/sub/b'},
+                 Bucket='otherbucket',
+                 Key='otherdir/sub/b',
+                 SourceClient=mock_s3_client,
+                 Config=ANY),
+        ], any_order=True)
+
+    def test_copy_to_s3_dir_raises_failed_copy(self):
+        mock_s3_client = self.mock_boto3_session.client.return_value
+        mock_paginator = mock_s3_client.get_paginator.return_value
+        mock_paginator.paginate.return_value = [
+            {'Contents': [{'Key': 'topdir/bottomdir/a', 'Size': 1}]},
+        ]
+        mock_s3_client.copy.side_effect = RuntimeError('copy failed')
+        other_loc = S3DirectoryUrl('s3://bucket/otherdir/',
+                                   S3Url=self.mock_S3Url,
+                                   boto3_session=self.mock_boto3_session)
+        with self.assertRaises(RuntimeError):
+            self.s3_directory_url.copy_to(other_loc)
 
     def test_files_in_directory(self):
         mock_s3_client = self.mock_boto3_session.client.return_value
-        mock_s3_client.list_objects.return_value = {
+        mock_paginator = mock_s3_client.get_paginator.return_value
+        mock_paginator.paginate.return_value = [{
             'Contents': []
-        }
+        }]
         out = self.s3_directory_url.files_in_directory()
-        mock_s3_client.list_objects.assert_called_with(Bucket='bucket',
-                                                       Delimiter='/',
-                                                       Prefix='topdir/bottomdir/')
+        mock_s3_client.get_paginator.assert_called_with('list_objects_v2')
+        mock_paginator.paginate.assert_called_with(Bucket='bucket',
+                                                   Delimiter='/',
+                                                   Prefix='topdir/bottomdir/')
         self.assertEqual([], out)
 
+    def test_files_in_directory_multiple_pages_with_sizes(self):
+        mock_s3_client = self.mock_boto3_session.client.return_value
+        mock_paginator = mock_s3_client.get_paginator.return_value
+        mock_paginator.paginate.return_value = [
+            {'Contents': [{'Key': 'topdir/bottomdir/a', 'Size': 1}]},
+            {'Contents': [{'Key': 'topdir/bottomdir/b', 'Size': 2}]},
+        ]
+        mock_file_url_a = Mock(name='file_url_a', spec=S3FileUrl)
+        mock_file_url_b = Mock(name='file_url_b', spec=S3FileUrl)
+        self.mock_S3Url.side_effect = [mock_file_url_a, mock_file_url_b]
+        out = self.s3_directory_url.files_in_directory()
+        self.mock_S3Url.assert_has_calls([call('s3://bucket/topdir/bottomdir/a',
+                                               self.mock_boto3_session),
+                                          call('s3://bucket/topdir/bottomdir/b',
+                                               self.mock_boto3_session)])
+        self.assertEqual([mock_file_url_a, mock_file_url_b], out)
+        self.assertEqual(mock_file_url_a.listed_size, 1)
+        self.assertEqual(mock_file_url_b.listed_size, 2)
+
     def test_files_matching_prefix_none(self):
         mock_s3_client = self.mock_boto3_session.client.return_value
-        mock_s3_client.list_objects.return_value = {
-        }
+        mock_paginator = mock_s3_client.get_paginator.return_value
+        mock_paginator.paginate.return_value = [{
+        }]
         out = self.s3_directory_url.files_matching_prefix('format_')
-        mock_s3_client.list_objects.assert_called_with(Bucket='bucket',
-                                                       Prefix='topdir/bottomdir/format_',
-                                                       Delimiter='/')
+        mock_paginator.paginate.assert_called_with(Bucket='bucket',
+                                                   Prefix='topdir/bottomdir/format_',
+                                                   Delimiter='/')
         self.assertEqual([], out)
 
     def test_temporary_directory_cleans_up_upon_exception(self):
@@ -66,21 +138,21 @@ class TestS3DirectoryUrl(unittest.TestCase):
         mock_s3_url = Mock(name='s3_url', spec=S3DirectoryUrl)
         self.mock_S3Url.return_value = mock_s3_url
         mock_s3_client = self.mock_boto3_session.client.return_value
-        mock_response = {
+        mock_paginator = mock_s3_client.get_paginator.return_value
+        mock_paginator.paginate.return_value = [{
             'CommonPrefixes': [
                 {
-                    'Prefix': 'prefix1/',
+                    'Prefix': 'topdir/bottomdir/prefix1/',
                 },
                 {
-                    'Prefix': 'prefix2/',
+                    'Prefix': 'topdir/bottomdir/prefix2/',
                 }
             ]
-        }
-        mock_s3_client.list_objects_v2.return_value = mock_response
+        }]
         out = self.s3_directory_url.directories_in_directory()
-        mock_s3_client.list_objects_v2.assert_called_with(Bucket='bucket',
-                                                          Prefix='topdir/bottomdir/',
-                                                          Delimiter='/')
+        mock_paginator.paginate.assert_called_with(Bucket='bucket',
+                                                   Prefix='topdir/bottomdir/',
+                                                   Delimiter='/')
         self.mock_S3Url.assert_has_calls([call('s3://bucket/topdir/bottomdir/prefix1/',
                                                self.mock_boto3_session),
                                           call('s3://bucket/topdir/bottomdir/prefix2/',
@@ -1,6 +1,9 @@
 from records_mover.url.s3.s3_file_url import S3FileUrl
+from records_mover.url.s3.s3_copy import RENAME_TRANSFER_CONFIG
+from botocore.exceptions import ClientError
 from mock import patch, Mock, MagicMock, ANY
 import unittest
+import io
 
 
 class TestS3FileUrl(unittest.TestCase):
@@ -12,6 +15,7 @@ class TestS3FileUrl(unittest.TestCase):
                                      boto3_session=self.mock_boto3_session)
         self.mock_s3_resource = self.mock_boto3_session.resource.return_value
         self.mock_s3_client = self.mock_boto3_session.client.return_value
+        self.mock_s3_client.head_object.return_value = {'ContentLength': 10, 'ETag': '"abc"'}
 
     def test_aws_creds(self):
         self.assertEqual(self.s3_file_url.aws_creds(),
@@ -46,38 +50,46 @@ class TestS3FileUrl(unittest.TestCase):
         mock_new_loc.bucket = 'bucket'
         mock_new_loc.key = 'newfile'
         mock_new_loc.url = 's3://bucket/newfile'
+        mock_new_loc.s3_client = self.mock_s3_client
         out = self.s3_file_url.rename_to(mock_new_loc)
-        self.mock_s3_resource.Object.return_value.copy_from.assert_called_with(CopySource={
-            'Bucket': 'bucket',
-            'Key': 'topdir/bottomdir/file'
-        })
+        self.mock_s3_client.copy.assert_called_with(CopySource={'Bucket': 'bucket',
+                                                                'Key': 'topdir/bottomdir/file'},
+                                                    Bucket='bucket',
+                                                    Key='newfile',
+                                                    SourceClient=self.mock_s3_client,
+                                                    Config=RENAME_TRANSFER_CONFIG)
+        self.mock_s3_resource.Object.assert_called_with('bucket', 'topdir/bottomdir/file')
         self.mock_s3_resource.Object.return_value.delete.assert_called_with()
         self.assertEqual(out, mock_new_loc)
 
-    @patch('records_mover.url.s3.s3_file_url.s3_open')
-    def test_wait_to_exist_exists_already(self, mock_s3_open):
+    def test_wait_to_exist_exists_already(self):
         self.s3_file_url.wait_to_exist()
 
-        mock_s3_open.assert_called_with(bucket_id='bucket',
-                                        key_id='topdir/bottomdir/file',
-                                        mode='rb',
-                                        session=self.mock_boto3_session)
+        self.mock_s3_client.head_object.\
+            assert_called_once_with(Bucket='bucket', Key='topdir/bottomdir/file')
 
-    @patch('records_mover.url.s3.s3_file_url.s3_open')
-    def test_wait_to_exist_one_loop(self, mock_s3_open):
-        mock_file = MagicMock(name='file')
-        err = ("'b0KD9AkG7XA/_manifest' does not exist in the bucket 'vince-scratch', "
-               "or is forbidden for access")
-        mock_s3_open.side_effect = [
-            ValueError(err),
-            mock_file
+    def test_wait_to_exist_one_loop(self):
+        self.mock_s3_client.head_object.side_effect = [
+            ClientError({'Error': {'Code': '404'}}, 'HeadObject'),
+            {'ContentLength': 10},
         ]
-        self.s3_file_url.wait_to_exist()
+        self.s3_file_url.wait_to_exist(ms_between_polls=1)
+
+        self.assertEqual(self.mock_s3_client.head_object.call_count, 2)
 
-        mock_s3_open.assert_called_with(bucket_id='bucket',
-                                        key_id='topdir/bottomdir/file',
-                                        mode='rb',
-                                        session=self.mock_boto3_session)
+    def test_wait_to_exist_times_out(self):
+        self.mock_s3_client.head_object.side_effect =\
+            ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+        with self.assertRaises(TimeoutError):
+            self.s3_file_url.wait_to_exist(ms_between_polls=1,
+                                           max_ms_between_polls=5,
+                                           timeout_seconds=0.05)
+
+    def test_exists_other_client_error_passes_through(self):
+        self.mock_s3_client.head_object.side_effect =\
+            ClientError({'Error': {'Code': '403'}}, 'HeadObject')
+        with self.assertRaises(ClientError):
+            self.s3_file_url.exists()
 
     @patch('records_mover.url.s3.s3_file_url.s3_open')
     def test_open_other_valueerror_passes_through(self, mock_s3_open):
@@ -85,12 +97,52 @@ class TestS3FileUrl(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.s3_file_url.open()
 
+    def test_open_not_found(self):
+        self.mock_s3_client.head_object.side_effect = ClientError({'Error': {'Code': '404'}},
+                                                                  'HeadObject')
+        with self.assertRaises(FileNotFoundError):
+            self.s3_file_url.open()
+
+    def test_open_other_client_error_passes_through(self):
+        self.mock_s3_client.head_object.side_effect = ClientError({'Error': {'Code': '403'}},
+                                                                  'HeadObject')
+        with self.assertRaises(ClientError):
+            self.s3_file_url.open()
+
+    @patch('records_mover.url.s3.s3_file_url.s3_open')
+    @patch('records_mover.url.s3.s3_file_url.S3RangedReader')
+    def test_open_large_object_uses_ranged_reader(self, mock_S3RangedReader, mock_s3_open):
+        self.s3_file_url.download_part_size = 4
+        self.s3_file_url.max_download_parts_in_flight = 3
+        mock_S3RangedReader.return_value = io.BytesIO(b'0123456789')
+        with self.s3_file_url.open() as f:
+            self.assertEqual(f.read(), b'0123456789')
+        mock_S3RangedReader.assert_called_with(self.mock_s3_client,
+                                               bucket='bucket',
+                                               key='topdir/bottomdir/file',
+                                               size=10,
+                                               etag='"abc"',
+                                               part_size=4,
+                                               max_parts_in_flight=3)
+        mock_s3_open.assert_not_called()
+
+    @patch('records_mover.url.s3.s3_file_url.s3_open')
+    def test_open_small_listed_object_skips_head(self, mock_s3_open):
+        self.s3_file_url.listed_size = 10
+        self.assertEqual(self.s3_file_url.open(), mock_s3_open.return_value)
+        self.mock_s3_client.head_object.assert_not_called()
+
     def test_download_fileobj(self):
         mock_fileobj = Mock(name='fileobj')
         self.s3_file_url.download_fileobj(mock_fileobj)
         self.mock_s3_client.download_fileobj.assert_called_with(Fileobj=mock_fileobj,
                                                                 Bucket='bucket',
-                                                                Key='topdir/bottomdir/file')
+                                                                Key='topdir/bottomdir/file',
+                                                                Config=ANY)
+        config = self.mock_s3_client.download_fileobj.call_args[1]['Config']
+        self.assertEqual(config.multipart_chunksize, self.s3_file_url.download_part_size)
+        self.assertEqual(config.max_concurrency,
+                         self.s3_file_url.max_download_parts_in_flight)
 
     def test_store_string(self):
         mock_contents = Mock(name='contents', spec=str)
@@ -114,6 +166,12 @@ class TestS3FileUrl(unittest.TestCase):
         out = self.s3_file_url.size()
         self.assertEqual(out, mock_content_length)
 
+    def test_size_from_listing(self):
+        self.s3_file_url.listed_size = 123
+        out = self.s3_file_url.size()
+        self.assertEqual(out, 123)
+        self.mock_s3_client.head_object.assert_not_called()
+
     @patch('records_mover.url.s3.s3_file_url.S3Concat')
     def test_concatenate_from(self,
                               mock_S3Concat):
@@ -134,3 +192,15 @@ class TestS3FileUrl(unittest.TestCase):
         mock_job.add_file.assert_any_call(mock_loc_1.key)
         mock_job.add_file.assert_any_call(mock_loc_2.key)
         mock_job.concat.assert_called_with()
+
+    def test_content_version(self):
+        self.mock_s3_client.head_object.return_value = {'ContentLength': 10, 'ETag': '"abc"'}
+        self.assertEqual(self.s3_file_url.content_version(), '"abc"')
+        self.mock_s3_client.head_object.assert_called_with(Bucket='bucket',
+                                                           Key='topdir/bottomdir/file')
+
+    def test_content_version_not_found(self):
+        self.mock_s3_client.head_object.side_effect = ClientError({'Error': {'Code': '404'}},
+                                                                  'HeadObject')
+        with self.assertRaises(FileNotFoundError):
+            self.s3_file_url.content_version()
@@ -0,0 +1,121 @@
+from records_mover.url.s3.s3_ranged_reader import S3RangedReader
+from botocore.exceptions import ClientError
+from mock import Mock
+import threading
+import unittest
+import io
+
+
+class TestS3RangedReader(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 4
+        self.mock_s3_client = Mock(name='s3_client')
+        self.requested_ranges = []
+        self.lock = threading.Lock()
+
+        def get_object(Bucket, Key, Range, **kwargs):
+            self.assertEqual(Bucket, 'bucket')
+            self.assertEqual(Key, 'key')
+            start, end = Range[len('bytes='):].split('-')
+            with self.lock:
+                self.requested_ranges.append((int(start), int(end)))
+            return {'Body': io.BytesIO(self.data[int(start):int(end) + 1])}
+
+        self.mock_s3_client.get_object.side_effect = get_object
+
+    def reader(self, **kwargs):
+        return S3RangedReader(self.mock_s3_client,
+                              bucket='bucket',
+                              key='key',
+                              size=len(self.data),
+                              **kwargs)
+
+    def test_read_all_in_order(self):
+        with self.reader(part_size=100, max_parts_in_flight=3) as reader:
+            self.assertEqual(reader.read(), self.data)
+            self.assertEqual(reader.tell(), len(self.data))
+        self.assertEqual(sorted(self.requested_ranges),
+                         [(start, min(start + 100, len(self.data)) - 1)
+                          for start in range(0, len(self.data), 100)])
+
+    def test_small_reads_span_parts(self):
+        out = b''
+        with self.reader(part_size=100, max_parts_in_flight=2) as reader:
+            while True:
+                chunk = reader.read(33)
+                if chunk == b'':
+                    break
+                out += chunk
+        self.assertEqual(out, self.data)
+
+    def test_buffered_readline(self):
+        self.data = b'a,b\n' * 100
+        with io.BufferedReader(self.reader(part_size=7, max_parts_in_flight=4)) as reader:
+            self.assertEqual(reader.readline(), b'a,b\n')
+            self.assertEqual(len(reader.readlines()), 99)
+
+    def test_bounded_read_ahead(self):
+        with self.reader(part_size=100, max_parts_in_flight=2) as reader:
+            reader.read(1)
+            # One part being read from, and at most two more requested
+            self.assertLessEqual(len(self.requested_ranges), 3)
+
+    def test_seek_and_reread(self):
+        with io.BufferedReader(self.reader(part_size=100, max_parts_in_flight=2)) as reader:
+            self.assertTrue(reader.seekable())
+            self.assertEqual(reader.read(550), self.data[:550])
+            self.assertEqual(reader.seek(0), 0)
+            self.assertEqual(reader.read(10), self.data[:10])
+            self.assertEqual(reader.seek(-24, io.SEEK_END), len(self.data) - 24)
+            self.assertEqual(reader.read(), self.data[-24:])
+            reader.seek(333)
+            self.assertEqual(reader.tell(), 333)
+            self.assertEqual(reader.read(), self.data[333:])
+
+    def test_seek_within_current_part(self):
+        with self.reader(part_size=100, max_parts_in_flight=1) as reader:
+            self.assertEqual(reader.read(50), self.data[:50])
+            reader.seek(10)
+            self.assertEqual(reader.read(20), self.data[10:30])
+        # The first part was not downloaded again
+        self.assertEqual(self.requested_ranges.count((0, 99)), 1)
+
+    def test_seek_past_end(self):
+        with self.reader(part_size=100) as reader:
+            reader.seek(len(self.data) + 10)
+            self.assertEqual(reader.read(), b'')
+
+    def test_etag_condition(self):
+        with self.reader(part_size=100, etag='"abc"') as reader:
+            reader.read()
+        for call in self.mock_s3_client.get_object.call_args_list:
+            self.assertEqual(call[1]['IfMatch'], '"abc"')
+
+    def test_etag_mismatch_raises(self):
+        self.mock_s3_client.get_object.side_effect =\
+            ClientError({'Error': {'Code': 'PreconditionFailed'}}, 'GetObject')
+        with self.reader(part_size=100, etag='"abc"') as reader:
+            with self.assertRaises(IOError):
+                reader.read()
+
+    def test_truncated_part_raises(self):
+        self.mock_s3_client.get_object.side_effect = lambda **kwargs: {'Body': io.BytesIO(b'x')}
+        with self.reader(part_size=100) as reader:
+            with self.assertRaises(IOError):
+                reader.read()
+
+    def test_get_error_raises_from_read(self):
+        self.mock_s3_client.get_object.side_effect = RuntimeError('nope')
+        with self.reader(part_size=100) as reader:
+            with self.assertRaises(RuntimeError):
+                reader.read(10)
+
+    def test_empty_object(self):
+        self.data = b''
+        with self.reader() as reader:
+            self.assertEqual(reader.read(), b'')
+        self.mock_s3_client.get_object.assert_not_called()
+
+    def test_invalid_part_size(self):
+        with self.assertRaises(ValueError):
+            self.reader(part_size=0)
@@ -0,0 +1,104 @@
+from records_mover.url.s3.s3_sync import s3_sync_to_local
+from datetime import datetime, timezone
+from mock import Mock
+import hashlib
+import tempfile
+import unittest
+import os
+
+
+class TestS3Sync(unittest.TestCase):
+    def setUp(self):
+        self.contents = {
+            'prefix/a.csv': b'a,b\n1,2\n',
+            'prefix/sub/b.csv': b'c,d\n3,4\n',
+        }
+        # ETags of multipart uploads aren't the MD5 of the content
+        self.multipart_etags = {}
+        self.last_modified = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.mock_s3_client = Mock(name='s3_client')
+        self.mock_s3_client.get_paginator.return_value.paginate.side_effect =\
+            self.paginate
+
+        def download_fileobj(Bucket, Key, Fileobj, Config):
+            Fileobj.write(self.contents[Key])
+
+        self.mock_s3_client.download_fileobj.side_effect = download_fileobj
+
+    def obj(self, key):
+        md5_etag = f'"{hashlib.md5(self.contents[key]).hexdigest()}"'
+        return {
+            'Key': key,
+            'Size': len(self.contents[key]),
+            'ETag': self.multipart_etags.get(key, md5_etag),
+            'LastModified': self.last_modified,
+        }
+
+    def paginate(self, Bucket, Prefix, Delimiter=None):
+        if Delimiter is None:
+            return [{'Contents': [self.obj(key) for key in self.contents
+                                  if key.startswith(Prefix)]}]
+        return [{
+            'Contents': [self.obj('prefix/a.csv'),
+                         {'Key': 'prefix/', 'Size': 0, 'ETag': '""',
+                          'LastModified': self.last_modified}],
+            'CommonPrefixes': [{'Prefix': 'prefix/sub/'}],
+        }]
+
+    def sync(self, local_dir):
+        return s3_sync_to_local(self.mock_s3_client,
+                                bucket='bucket',
+                                prefix='prefix/',
+                                local_directory=local_dir,
+                                max_workers=2)
+
+    def test_sync_downloads_tree(self):
+        with tempfile.TemporaryDirectory() as local_dir:
+            self.assertEqual(self.sync(local_dir), 2)
+            with open(os.path.join(local_dir, 'a.csv'), 'rb') as f:
+                self.assertEqual(f.read(), self.contents['prefix/a.csv'])
+            with open(os.path.join(local_dir, 'sub', 'b.csv'), 'rb') as f:
+                self.assertEqual(f.read(), self.contents['prefix/sub/b.csv'])
+            self.assertEqual(os.path.getmtime(os.path.join(local_dir, 'a.csv')),
+                             self.last_modified.timestamp())
+            self.assertEqual(sorted(os.listdir(local_dir)), ['a.csv', 'sub'])
+
+    def test_sync_skips_current_files(self):
+        with tempfile.TemporaryDirectory() as local_dir:
+            self.sync(local_dir)
+            self.mock_s3_client.download_fileobj.reset_mock()
+            self.assertEqual(self.sync(local_dir), 0)
+            self.mock_s3_client.download_fileobj.assert_not_called()
+
+    def test_sync_redownloads_changed_files(self):
+        with tempfile.TemporaryDirectory() as local_dir:
+            self.sync(local_dir)
+            self.mock_s3_client.download_fileobj.reset_mock()
+            with open(os.path.join(local_dir, 'a.csv'), 'wb') as f:
+                # Same size, different content
+                f.write(b'x,y\n5,6\n')
+            self.assertEqual(self.sync(local_dir), 1)
+            self.mock_s3_client.download_fileobj.assert_called_once()
+            with open(os.path.join(local_dir, 'a.csv'), 'rb') as f:
+                self.assertEqual(f.read(), self.contents['prefix/a.csv'])
+
+    def test_sync_failed_download_leaves_nothing_behind(self):
+        def download_fileobj(Bucket, Key, Fileobj, Config):
+            Fileobj.write(b'partial')
+            raise RuntimeError('connection reset')
+
+        self.mock_s3_client.download_fileobj.side_effect = download_fileobj
+        with tempfile.TemporaryDirectory() as local_dir:
+            with self.assertRaises(RuntimeError):
+                self.sync(local_dir)
+            self.assertFalse(os.path.exists(os.path.join(local_dir, 'a.csv')))
+            self.assertFalse(os.path.exists(os.path.join(local_dir, 'a.csv.partial')))
+
+    def test_sync_multipart_etag_compares_mtime(self):
+        self.multipart_etags['prefix/a.csv'] = '"0123456789abcdef-2"'
+        with tempfile.TemporaryDirectory() as local_dir:
+            self.sync(local_dir)
+            self.mock_s3_client.download_fileobj.reset_mock()
+            self.assertEqual(self.sync(local_dir), 0)
+            os.utime(os.path.join(local_dir, 'a.csv'), (0, 0))
+            self.assertEqual(self.sync(local_dir), 1)
@@ -0,0 +1,72 @@
+from records_mover.utils.peek_buffered_file import PeekBufferedFile
+import unittest
+import io
+
+
+class PipeLike(io.RawIOBase):
+    "A stream which can only be read forwards"
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._data.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+class TestPeekBufferedFile(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 4
+
+    def test_replays_start_after_rewind(self):
+        f = PeekBufferedFile(PipeLike(self.data), max_buffer_bytes=100)
+        self.assertTrue(f.seekable())
+        self.assertEqual(f.read(60), self.data[:60])
+        f.seek(0)
+        self.assertEqual(f.read(), self.data)
+        self.assertEqual(f.tell(), len(self.data))
+
+    def test_seek_within_recorded(self):
+        f = PeekBufferedFile(PipeLike(self.data), max_buffer_bytes=100)
+        f.read(50)
+        f.seek(10)
+        f.seek(5, io.SEEK_CUR)
+        self.assertEqual(f.tell(), 15)
+        self.assertEqual(f.read(5), self.data[15:20])
+
+    def test_seek_forward_past_recorded(self):
+        f = PeekBufferedFile(PipeLike(self.data), max_buffer_bytes=100)
+        f.read(50)
+        with self.assertRaises(io.UnsupportedOperation):
+            f.seek(51)
+
+    def test_seek_from_end(self):
+        f = PeekBufferedFile(PipeLike(self.data), max_buffer_bytes=100)
+        with self.assertRaises(io.UnsupportedOperation):
+            f.seek(0, io.SEEK_END)
+
+    def test_not_seekable_past_buffer(self):
+        f = PeekBufferedFile(PipeLike(self.data), max_buffer_bytes=100)
+        f.read(101)
+        self.assertFalse(f.seekable())
+        with self.assertRaises(io.UnsupportedOperation):
+            f.seek(0)
+        self.assertEqual(f.read(), self.data[101:])
+
+    def test_works_with_text_wrapper(self):
+        f = PeekBufferedFile(PipeLike(b'a,b\n1,2\n'), max_buffer_bytes=100)
+        text = io.TextIOWrapper(f, encoding='utf-8')
+        self.assertEqual(text.readline(), 'a,b\n')
+        text.detach()
+        f.seek(0)
+        self.assertEqual(f.read(), b'a,b\n1,2\n')
+
+    def test_close_leaves_underlying_open(self):
+        underlying = PipeLike(self.data)
+        with PeekBufferedFile(underlying, max_buffer_bytes=100) as f:
+            f.read(10)
+        self.assertFalse(underlying.closed)
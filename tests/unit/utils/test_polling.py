@@ -0,0 +1,36 @@
+from records_mover.utils.polling import wait_for
+from mock import Mock
+import unittest
+
+
+class TestPolling(unittest.TestCase):
+    def test_wait_for_already_done(self):
+        mock_check = Mock(name='check', return_value=True)
+        mock_description = Mock(name='description')
+        wait_for(mock_check, description=mock_description)
+        mock_check.assert_called_once_with()
+        mock_description.assert_not_called()
+
+    def test_wait_for_polls_until_done(self):
+        mock_check = Mock(name='check', side_effect=[False, False, True])
+        mock_description = Mock(name='description', return_value='something')
+        with self.assertLogs('records_mover.utils.polling') as logs:
+            wait_for(mock_check,
+                     description=mock_description,
+                     ms_between_polls=1,
+                     max_ms_between_polls=2)
+        self.assertEqual(mock_check.call_count, 3)
+        self.assertEqual(logs.output,
+                         ['INFO:records_mover.utils.polling:Waiting for something...'] * 2)
+
+    def test_wait_for_times_out(self):
+        mock_check = Mock(name='check', return_value=False)
+        with self.assertRaises(TimeoutError) as e:
+            wait_for(mock_check,
+                     description=lambda: 'something',
+                     ms_between_polls=1,
+                     max_ms_between_polls=5,
+                     timeout_seconds=0.05)
+        self.assertEqual(str(e.exception),
+                         'Timed out after 0.05 seconds waiting for something')
+        self.assertGreater(mock_check.call_count, 1)
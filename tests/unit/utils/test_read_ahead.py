@@ -0,0 +1,105 @@
+from records_mover.utils.read_ahead import ReadAheadFile, read_ahead_if_remote
+import tempfile
+import threading
+import unittest
+import io
+
+
+class SlowFile(io.BytesIO):
+    "Records how far ahead it has been read, and can be made to fail"
+
+    def __init__(self, data, fail_at=None):
+        super().__init__(data)
+        self.fail_at = fail_at
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        if self.fail_at is not None and self.tell() >= self.fail_at:
+            raise ConnectionResetError('dropped')
+        return super().read(size)
+
+
+class TestReadAheadFile(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 40
+
+    def test_read_all(self):
+        with ReadAheadFile(SlowFile(self.data), max_buffered_bytes=200, chunk_size=64) as f:
+            self.assertEqual(f.read(), self.data)
+            self.assertEqual(f.tell(), len(self.data))
+
+    def test_small_reads(self):
+        out = b''
+        with ReadAheadFile(SlowFile(self.data), max_buffered_bytes=200, chunk_size=64) as f:
+            while True:
+                chunk = f.read(33)
+                if chunk == b'':
+                    break
+                out += chunk
+        self.assertEqual(out, self.data)
+
+    def test_buffered_readline(self):
+        data = b'a,b\n' * 100
+        with io.BufferedReader(ReadAheadFile(io.BytesIO(data), max_buffered_bytes=20)) as f:
+            self.assertEqual(f.readline(), b'a,b\n')
+            self.assertEqual(len(f.readlines()), 99)
+
+    def test_bounded_read_ahead(self):
+        source = SlowFile(self.data)
+        done = threading.Event()
+        with ReadAheadFile(source, max_buffered_bytes=200, chunk_size=50) as f:
+            f.read(1)
+            # Give the background thread every chance to overrun
+            done.wait(0.2)
+            # Four chunks buffered, one being read from, and one
+            # read but blocked waiting for room
+            self.assertLessEqual(source.tell(), 50 * 6)
+
+    def test_chunk_size_shrinks_to_fit(self):
+        source = SlowFile(self.data)
+        with ReadAheadFile(source, max_buffered_bytes=10, chunk_size=1000) as f:
+            self.assertEqual(f.read(), self.data)
+        self.assertGreater(source.reads, len(self.data) / 5)
+
+    def test_error_raised_to_reader(self):
+        with ReadAheadFile(SlowFile(self.data, fail_at=128),
+                           max_buffered_bytes=200, chunk_size=64) as f:
+            self.assertEqual(f.read(128), self.data[:64])
+            self.assertEqual(f.read(128), self.data[64:128])
+            with self.assertRaises(ConnectionResetError):
+                f.read(128)
+
+    def test_close_early(self):
+        source = SlowFile(self.data)
+        f = ReadAheadFile(source, max_buffered_bytes=200, chunk_size=50)
+        f.read(1)
+        f.close()
+        self.assertTrue(f.closed)
+        self.assertFalse(source.closed)
+
+    def test_empty(self):
+        with ReadAheadFile(io.BytesIO(b'')) as f:
+            self.assertEqual(f.read(), b'')
+
+    def test_invalid_max_buffered_bytes(self):
+        with self.assertRaises(ValueError):
+            ReadAheadFile(io.BytesIO(b''), max_buffered_bytes=1)
+
+
+class TestReadAheadIfRemote(unittest.TestCase):
+    def test_stream(self):
+        source = io.BytesIO(b'abc')
+        with read_ahead_if_remote(source, max_buffered_bytes=100) as f:
+            self.assertIsInstance(f, ReadAheadFile)
+            self.assertEqual(f.read(), b'abc')
+
+    def test_disabled(self):
+        source = io.BytesIO(b'abc')
+        with read_ahead_if_remote(source, max_buffered_bytes=None) as f:
+            self.assertIs(f, source)
+
+    def test_local_file(self):
+        with tempfile.TemporaryFile() as source:
+            with read_ahead_if_remote(source, max_buffered_bytes=100) as f:
+                self.assertIs(f, source)
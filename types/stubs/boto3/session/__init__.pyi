@@ -1,8 +1,9 @@
-from typing import Any, List, IO, Union, Optional, Dict, Callable, overload
+from typing import Any, List, IO, Iterator, Union, Optional, Dict, Callable, overload
 from typing_extensions import Literal
 from mypy_extensions import TypedDict
 import datetime
 from botocore.credentials import Credentials
+from boto3.s3.transfer import TransferConfig
 
 
 # One day we'll be able to get deep types into boto3:
@@ -83,7 +84,20 @@ class S3HeadObjectOutput(TypedDict, total=False):
     ObjectLockLegalHoldStatus: str
 
 
+# https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Paginator.ListObjectsV2
+class ListObjectsV2PaginatorTypeStub:
+    def paginate(self, Bucket: str, Prefix: str,
+                 Delimiter: str = ...) -> Iterator[ListObjectsResponseType]:
+        ...
+
+
 class S3ClientTypeStub:
+    # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.get_paginator
+    def get_paginator(self,
+                      operation_name: Literal['list_objects_v2']) -> \
+            ListObjectsV2PaginatorTypeStub:
+        ...
+
     # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#client
     def list_objects_v2(self, Bucket: str, Prefix: str,
                         Delimiter: str = '/',
@@ -117,7 +131,8 @@ class S3ClientTypeStub:
 
     # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.get_object
     def get_object(self,
-                   Bucket: str, Key: str) -> GetObjectReponseType: ...
+                   Bucket: str, Key: str,
+                   Range: str = ...) -> GetObjectReponseType: ...
 
     # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.upload_fileobj
     def upload_fileobj(self,
@@ -133,6 +148,16 @@ class S3ClientTypeStub:
                      Delimiter: str = '/') -> ListObjectsResponseType:
         ...
 
+    # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.copy
+    def copy(self,
+             CopySource: Dict[str, str],
+             Bucket: str,
+             Key: str,
+             ExtraArgs: Optional[Dict[str, Any]] = None,
+             Callback: Optional[Callable[[int], None]] = None,
+             SourceClient: Optional['S3ClientTypeStub'] = None,
+             Config: Optional[TransferConfig] = None) -> None: ...
+
 
 class StreamingBodyType:
     _raw_stream: IO[bytes]
@@ -0,0 +1,14 @@
+# https://github.com/boto/botocore/blob/develop/botocore/exceptions.py
+from typing import Any, Dict
+
+
+class BotoCoreError(Exception):
+    ...
+
+
+class ClientError(Exception):
+    response: Dict[str, Any]
+    operation_name: str
+
+    def __init__(self, error_response: Dict[str, Any], operation_name: str) -> None:
+        ...
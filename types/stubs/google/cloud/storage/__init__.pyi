@@ -1,7 +1,16 @@
 import google.auth.credentials
 from google.cloud.storage.bucket import Bucket
 from google.cloud.storage.blob import Blob
-from typing import Optional, Iterator
+from typing import Optional, Iterator, Set
+
+
+# https://googleapis.dev/python/api-core/latest/page_iterator.html
+class BlobIterator(Iterator[Blob]):
+    # Populated as pages are fetched when listing with a delimiter
+    prefixes: Set[str]
+
+    def __next__(self) -> Blob:
+        ...
 
 
 # https://googleapis.dev/python/storage/latest/client.html
@@ -18,5 +27,5 @@ class Client:
     def list_blobs(self,
                    bucket_or_name: str,
                    prefix: Optional[str] = None,
-                   delimiter: Optional[str] = None) -> Iterator[Blob]:
+                   delimiter: Optional[str] = None) -> BlobIterator:
         ...
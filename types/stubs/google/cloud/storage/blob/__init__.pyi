@@ -1,6 +1,28 @@
+from typing import IO, List, Optional, Union
+
+
 class Blob:
     name: str
     size: int
+    generation: int
 
     def delete(self) -> None:
         ...
+
+    # https://googleapis.dev/python/storage/latest/blobs.html#google.cloud.storage.blob.Blob.compose
+    def compose(self, sources: List['Blob']) -> None:
+        ...
+
+    # https://googleapis.dev/python/storage/latest/blobs.html#google.cloud.storage.blob.Blob.upload_from_string
+    def upload_from_string(self,
+                           data: Union[bytes, str],
+                           content_type: Optional[str] = ...) -> None:
+        ...
+
+    # https://googleapis.dev/python/storage/latest/blobs.html#google.cloud.storage.blob.Blob.upload_from_file
+    def upload_from_file(self,
+                         file_obj: IO[bytes],
+                         rewind: bool = ...,
+                         size: Optional[int] = ...,
+                         content_type: Optional[str] = ...) -> None:
+        ...
@@ -1,9 +1,16 @@
 from google.cloud.storage.blob import Blob
+from typing import Optional
 
 
 class Bucket:
+    name: str
+
     def rename_blob(self, blob: Blob, new_name: str) -> Blob:
         ...
 
     def blob(self, blob_name: str) -> Blob:
         ...
+
+    # https://googleapis.dev/python/storage/latest/buckets.html#google.cloud.storage.bucket.Bucket.get_blob
+    def get_blob(self, blob_name: str) -> Optional[Blob]:
+        ...
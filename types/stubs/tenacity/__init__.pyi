@@ -0,0 +1,62 @@
+# https://tenacity.readthedocs.io/en/latest/api.html
+from typing import Any, Callable
+
+
+class RetryCallState:
+    attempt_number: int
+    outcome: Any
+
+
+class RetryError(Exception):
+    ...
+
+
+class wait_base:
+    ...
+
+
+class wait_random_exponential(wait_base):
+    def __init__(self, multiplier: float = ..., max: float = ...,
+                 exp_base: float = ..., min: float = ...) -> None:
+        ...
+
+
+class stop_base:
+    ...
+
+
+stop_never: stop_base
+
+
+class stop_after_delay(stop_base):
+    def __init__(self, max_delay: float) -> None:
+        ...
+
+
+class retry_base:
+    ...
+
+
+class retry_if_result(retry_base):
+    def __init__(self, predicate: Callable[[Any], bool]) -> None:
+        ...
+
+
+def retry(*dargs: Any, **dkw: Any) -> Any:
+    ...
+
+
+def stop_after_attempt(*args: Any, **kwargs: Any) -> Any:
+    ...
+
+
+def before_sleep_log(*args: Any, **kwargs: Any) -> Any:
+    ...
+
+
+def retry_if_exception_type(*args: Any, **kwargs: Any) -> Any:
+    ...
+
+
+def retry_if_exception(*args: Any, **kwargs: Any) -> Any:
+    ...